@@ -5,9 +5,12 @@ import logging
 import sys
 from pathlib import Path
 
-from ..core.extractor import WaveExtractor
-from ..core.multi_renderer import MultiFigureRenderer
-from ..core.renderer import WaveRenderer
+from ..core.parser import VCDParser
+
+# Argument choices as dict key views: O(1) membership checks while keeping the
+# declared order for --help and error messages (a frozenset would not)
+FORMAT_CHOICES = dict.fromkeys(["b", "d", "u", "x", "X"]).keys()
+PLOT_FORMAT_CHOICES = dict.fromkeys(["png", "svg", "html"]).keys()
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -62,20 +65,16 @@ Examples:
         "-s", "--signals", nargs="+", help="Signal paths to extract (required for VCD input)"
     )
 
-    parser.add_argument(
-        "--start-time", type=int, default=0, help="Start time for sampling (default: 0)"
-    )
+    parser.add_argument("--start-time", type=int, help="Start time for sampling (default: 0)")
 
     parser.add_argument(
-        "--end-time", type=int, default=0, help="End time for sampling (default: 0 = until end)"
+        "--end-time", type=int, help="End time for sampling (default: 0 = until end)"
     )
 
-    parser.add_argument(
-        "--wave-chunk", type=int, default=20, help="Samples per time group (default: 20)"
-    )
+    parser.add_argument("--wave-chunk", type=int, help="Samples per time group (default: 20)")
 
     parser.add_argument(
-        "--format", choices=["b", "d", "u", "x", "X"], help="Display format for multi-bit signals"
+        "--format", choices=FORMAT_CHOICES, help="Display format for multi-bit signals"
     )
 
     parser.add_argument(
@@ -95,54 +94,122 @@ Examples:
     parser.add_argument(
         "--plot-formats",
         nargs="+",
-        choices=["png", "svg", "html"],
+        choices=PLOT_FORMAT_CHOICES,
         help="Output formats for auto-plotting (default: png)",
     )
 
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Resolution of the -i/--image output in dots per inch (default: 150)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Parallelism for --plot-dir: above 1, category JSONs are written in a background "
+            "process while up to N figures are drawn in threads (default: 1)"
+        ),
+    )
+
+    # Hidden: save sampled signals after extraction, or reuse them instead of reading the VCD
+    parser.add_argument("--cache-parsed", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--from-cache", type=str, help=argparse.SUPPRESS)
+
     parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
 
     return parser
 
 
-def validate_args(args: argparse.Namespace) -> None:
+def _validate_vcd_args(args: argparse.Namespace) -> None:
+    """Validate arguments specific to VCD input.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Raises:
+        ValueError: If signal or auto plotting options are inconsistent.
+    """
+    # Auto plotting mode
+    if args.auto_plot or args.plot_dir:
+        if args.signals:
+            raise ValueError(
+                "Cannot specify signals with auto plotting (--auto-plot or --plot-dir)"
+            )
+        if args.output and args.output != "/dev/null":
+            raise ValueError("Cannot specify output JSON with auto plotting")
+    elif not args.signals and not args.list_signals and not args.from_cache:
+        raise ValueError(
+            "Signal paths are required for VCD input (use -s/--signals), or use --auto-plot for automatic signal selection"
+        )
+
+    # Cached samples carry the signals and sampling window of the run that saved them
+    if args.from_cache:
+        conflicting = [
+            option
+            for option, value in (
+                ("-s/--signals", args.signals),
+                ("--start-time", args.start_time),
+                ("--end-time", args.end_time),
+                ("--wave-chunk", args.wave_chunk),
+                ("--cache-parsed", args.cache_parsed),
+            )
+            if value is not None
+        ]
+        if conflicting:
+            raise ValueError(f"--from-cache cannot be combined with {', '.join(conflicting)}")
+
+
+def _validate_json_args(args: argparse.Namespace) -> None:
+    """Validate arguments specific to JSON input.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Raises:
+        ValueError: If VCD-only options are given or the image output is missing.
+    """
+    if args.signals:
+        raise ValueError("Signal paths cannot be specified for JSON input")
+    if args.auto_plot or args.plot_dir:
+        raise ValueError("Auto plotting options are not valid for JSON input")
+    if not args.image:
+        raise ValueError("Image output is required for JSON input")
+
+
+_VALIDATORS = {".vcd": _validate_vcd_args, ".json": _validate_json_args}
+
+
+def validate_args(
+    args: argparse.Namespace, input_path: Path | None = None, suffix: str | None = None
+) -> None:
     """Validate command-line arguments for consistency and requirements.
 
     Args:
         args: Parsed command-line arguments containing input/output paths,
             signal specifications, and processing parameters.
+        input_path: Path of args.input_file, if already constructed by the caller.
+        suffix: Lower-cased suffix of the input file, if already computed.
 
     Raises:
         ValueError: If arguments are invalid or inconsistent (e.g., missing
             required signals for VCD input, or invalid file extensions).
     """
-    input_path = Path(args.input_file)
+    if input_path is None:
+        input_path = Path(args.input_file)
+    if suffix is None:
+        suffix = input_path.suffix.lower()
 
     if not input_path.exists():
         raise ValueError(f"Input file does not exist: {args.input_file}")
 
-    if input_path.suffix.lower() == ".vcd":
-        # Auto plotting mode
-        if args.auto_plot or args.plot_dir:
-            if args.signals:
-                raise ValueError(
-                    "Cannot specify signals with auto plotting (--auto-plot or --plot-dir)"
-                )
-            if args.output and args.output != "/dev/null":
-                raise ValueError("Cannot specify output JSON with auto plotting")
-        elif not args.signals and not args.list_signals:
-            raise ValueError(
-                "Signal paths are required for VCD input (use -s/--signals), or use --auto-plot for automatic signal selection"
-            )
-
-    elif input_path.suffix.lower() == ".json":
-        if args.signals:
-            raise ValueError("Signal paths cannot be specified for JSON input")
-        if args.auto_plot or args.plot_dir:
-            raise ValueError("Auto plotting options are not valid for JSON input")
-        if not args.image:
-            raise ValueError("Image output is required for JSON input")
-    else:
+    validator = _VALIDATORS.get(suffix)
+    if validator is None:
         raise ValueError("Input file must be .vcd or .json")
+    validator(args)
 
     # Validate auto plotting options
     if args.plot_dir and not args.auto_plot:
@@ -150,6 +217,11 @@ def validate_args(args: argparse.Namespace) -> None:
     if args.plot_formats and not (args.auto_plot or args.plot_dir):
         raise ValueError("--plot-formats requires --auto-plot or --plot-dir")
 
+    if args.jobs < 1:
+        raise ValueError("--jobs must be at least 1")
+    if args.dpi <= 0:
+        raise ValueError("--dpi must be positive")
+
 
 def main() -> int:
     """Main CLI entry point for VCD to Image Converter.
@@ -165,16 +237,23 @@ def main() -> int:
         args = parser.parse_args()
 
         setup_logging(args.verbose)
-        validate_args(args)
+        input_path = Path(args.input_file)
+        suffix = input_path.suffix.lower()
+        validate_args(args, input_path, suffix)
 
-        if Path(args.input_file).suffix.lower() == ".vcd":
+        if suffix == ".vcd":
             if args.auto_plot:
                 # Auto plotting mode
+                from ..core.multi_renderer import MultiFigureRenderer
+
                 multi_renderer = MultiFigureRenderer()
+                multi_renderer.jobs = args.jobs
 
                 if args.plot_dir:
                     # Generate multiple categorized figures
                     formats = args.plot_formats or ["png"]
+                    # Reuse signal definitions parsed by earlier runs on the same VCD
+                    multi_renderer.load_parsed(args.input_file)
                     result = multi_renderer.render_categorized_figures(
                         vcd_file=args.input_file, output_dir=args.plot_dir, formats=formats
                     )
@@ -184,68 +263,76 @@ def main() -> int:
                     # Generate single auto plot
                     if not args.image:
                         raise ValueError("Image output required for auto plotting (use -i/--image)")
+                    multi_renderer.load_parsed(args.input_file)
                     result = multi_renderer.render_auto_plot(
                         vcd_file=args.input_file, output_file=args.image
                     )
                     if result == 0:
                         logging.info(f"Created auto plot: {args.image}")
 
+            elif args.list_signals:
+                # Only the header is needed to list signals
+                paths = VCDParser(args.input_file).list_signals()
+                sys.stdout.write("".join(f"{path}\n" for path in paths))
+
             else:
                 # Traditional VCD to JSON conversion
-                extractor = WaveExtractor(
-                    vcd_file=args.input_file,
-                    json_file=args.output or "",
-                    path_list=args.signals or [],
-                )
+                from ..core.extractor import WaveExtractor
+
+                if args.from_cache:
+                    extractor = WaveExtractor.from_cache(
+                        args.input_file, args.output or "", args.from_cache
+                    )
+                else:
+                    extractor = WaveExtractor(
+                        vcd_file=args.input_file,
+                        json_file=args.output or "",
+                        path_list=args.signals or [],
+                    )
 
-                extractor.wave_chunk = args.wave_chunk
-                extractor.start_time = args.start_time
-                extractor.end_time = args.end_time
+                    if args.wave_chunk is not None:
+                        extractor.wave_chunk = args.wave_chunk
+                    if args.start_time is not None:
+                        extractor.start_time = args.start_time
+                    if args.end_time is not None:
+                        extractor.end_time = args.end_time
+                    extractor.sample_cache = args.cache_parsed or ""
 
                 if args.format:
-                    for signal in args.signals:
+                    for signal in args.signals or extractor.path_list:
                         extractor.wave_format(signal, args.format)
 
-                if args.list_signals:
-                    extractor.print_props()
-                else:
-                    if args.image and (not args.output or args.output == "/dev/null"):
-                        # Direct VCD to image conversion - use temporary JSON file
-                        import tempfile
-
-                        with tempfile.NamedTemporaryFile(
-                            mode="w", suffix=".json", delete=False
-                        ) as temp_json:
-                            temp_json_path = temp_json.name
+                if args.image and (not args.output or args.output == "/dev/null"):
+                    # Direct VCD to image conversion - render the WaveJSON data in memory
+                    wavejson = extractor.extract_wavejson()
+                    if wavejson is None:
+                        raise ValueError("No signal samples found in VCD file")
 
-                        extractor.json_file = temp_json_path
-                        extractor.execute()
+                    from ..core.renderer import WaveRenderer
 
-                        renderer = WaveRenderer()
-                        renderer.render_to_image(temp_json_path, args.image)
+                    renderer = WaveRenderer(dpi=args.dpi)
+                    renderer.render_wavejson_to_image(wavejson, args.image)
+                    logging.info(f"Created image file: {args.image}")
+                else:
+                    # Standard VCD to JSON conversion
+                    json_file = args.output or str(input_path.with_suffix(".json"))
+                    extractor.json_file = json_file
+                    extractor.execute()
+                    logging.info(f"Created WaveJSON file: {json_file}")
+
+                    if args.image:
+                        # Convert JSON to image
+                        from ..core.renderer import WaveRenderer
+
+                        renderer = WaveRenderer(dpi=args.dpi)
+                        renderer.render_to_image(json_file, args.image)
                         logging.info(f"Created image file: {args.image}")
 
-                        # Clean up temporary file
-                        try:
-                            Path(temp_json_path).unlink()
-                        except Exception:
-                            pass  # Ignore cleanup errors
-                    else:
-                        # Standard VCD to JSON conversion
-                        json_file = args.output or args.input_file.replace(".vcd", ".json")
-                        extractor.json_file = json_file
-                        extractor.execute()
-                        logging.info(f"Created WaveJSON file: {json_file}")
-
-                        if args.image:
-                            # Convert JSON to image
-                            renderer = WaveRenderer()
-                            renderer.render_to_image(json_file, args.image)
-                            logging.info(f"Created image file: {args.image}")
-
         else:
             # JSON to image conversion
-            renderer = WaveRenderer()
+            from ..core.renderer import WaveRenderer
+
+            renderer = WaveRenderer(dpi=args.dpi)
             renderer.render_to_image(args.input_file, args.image)
             logging.info(f"Created image file: {args.image}")
 
@@ -8,46 +8,56 @@ from .models import SignalCategory, SignalDef, SignalType
 logger = logging.getLogger(__name__)
 
 
+# Keyword alternation per category in precedence order, each anchored at a word start
+_KEYWORDS = {
+    "clock": r"(?:clock|clk|ck)\b",
+    "reset": r"(?:reset|rst|clear)\b",
+    "input": r"(?:in|input)\b|i_\w",
+    "output": r"(?:out|output)\b|o_\w",
+}
+
+
 class SignalCategorizer:
     """Intelligent categorizer for VCD signals based on naming patterns and hierarchy."""
 
+    # Compiled once for the class and shared by every instance; used to spot
+    # clock-like inputs when no signal was categorized as a clock
+    clock_re = re.compile(rf"\b(?:{_KEYWORDS['clock']})", re.IGNORECASE)
+
+    # All categories in one pattern over lower-cased text so a name is scanned
+    # once; the group name of each match identifies its category
+    keyword_pattern = re.compile(
+        r"\b(?:"
+        + "|".join(f"(?P<{category}>{regex})" for category, regex in _KEYWORDS.items())
+        + ")"
+    )
+
+    # One bit per keyword category, lowest bit for the highest precedence;
+    # the lowest set bit of a match mask selects the signal type
+    keyword_bits = {category: 1 << index for index, category in enumerate(_KEYWORDS)}
+    _keyword_dispatch: list[SignalType | None] = [None] + [
+        SignalType(list(_KEYWORDS)[(mask & -mask).bit_length() - 1])
+        for mask in range(1, 1 << len(_KEYWORDS))
+    ]
+    _path_mask = keyword_bits["clock"] | keyword_bits["reset"]
+
+    # Substrings of lower-cased testbench signal names that suggest an output
+    output_indicator_re = re.compile(r"pulse|done|ready|valid|out|result")
+
+    # Module instance prefixes that indicate internal signals
+    internal_prefixes = (
+        "u_",  # Common Verilog instance prefix
+        "i_",  # Common instance prefix
+        "dut_",  # Design Under Test
+        "tb_",  # Testbench
+    )
+
     def __init__(self) -> None:
         """Initialize signal categorizer."""
-        # Common clock signal patterns
-        self.clock_patterns = [
-            re.compile(r"\bclock\b", re.IGNORECASE),
-            re.compile(r"\bclk\b", re.IGNORECASE),
-            re.compile(r"\bck\b", re.IGNORECASE),
-        ]
-
-        # Common input port patterns
-        self.input_patterns = [
-            re.compile(r"\bin\b", re.IGNORECASE),
-            re.compile(r"\binput\b", re.IGNORECASE),
-            re.compile(r"\bi_\w+", re.IGNORECASE),
-        ]
-
-        # Common output port patterns
-        self.output_patterns = [
-            re.compile(r"\bout\b", re.IGNORECASE),
-            re.compile(r"\boutput\b", re.IGNORECASE),
-            re.compile(r"\bo_\w+", re.IGNORECASE),
-        ]
-
-        # Common reset signal patterns
-        self.reset_patterns = [
-            re.compile(r"\breset\b", re.IGNORECASE),
-            re.compile(r"\brst\b", re.IGNORECASE),
-            re.compile(r"\bclear\b", re.IGNORECASE),
-        ]
-
-        # Module instance prefixes that indicate internal signals
-        self.internal_prefixes = [
-            "u_",  # Common Verilog instance prefix
-            "i_",  # Common instance prefix
-            "dut_",  # Design Under Test
-            "tb_",  # Testbench
-        ]
+        # Memoized keyword match masks per text, and classifications
+        # per feature key built in _classify_signal
+        self._hits_cache: dict[str, int] = {}
+        self._type_cache: dict[tuple[str, int, bool, bool, bool, int], SignalType] = {}
 
     def categorize_signals(self, path_dict: dict[str, SignalDef]) -> SignalCategory:
         """Categorize signals based on naming patterns and hierarchy.
@@ -59,31 +69,23 @@ class SignalCategorizer:
             SignalCategory object containing categorized signals.
         """
         category = SignalCategory()
-
+        buckets = {
+            SignalType.CLOCK: category.clocks,
+            SignalType.INPUT: category.inputs,
+            SignalType.OUTPUT: category.outputs,
+            SignalType.RESET: category.resets,
+            SignalType.INTERNAL: category.internals,
+            SignalType.UNKNOWN: category.unknowns,
+        }
+
+        classify = self._classify_signal
         for path, signal_def in path_dict.items():
-            signal_type = self._classify_signal(path, signal_def)
-            signal_def.signal_type = signal_type
-
-            if signal_type == SignalType.CLOCK:
-                category.clocks.append(path)
-            elif signal_type == SignalType.INPUT:
-                category.inputs.append(path)
-            elif signal_type == SignalType.OUTPUT:
-                category.outputs.append(path)
-            elif signal_type == SignalType.RESET:
-                category.resets.append(path)
-            elif signal_type == SignalType.INTERNAL:
-                category.internals.append(path)
-            else:  # SignalType.UNKNOWN
-                category.unknowns.append(path)
+            signal_type = signal_def.signal_type = classify(path, signal_def)
+            buckets[signal_type].append(path)
 
         # Sort signals for consistent ordering
-        category.clocks.sort()
-        category.inputs.sort()
-        category.outputs.sort()
-        category.resets.sort()
-        category.internals.sort()
-        category.unknowns.sort()
+        for paths in buckets.values():
+            paths.sort()
 
         logger.info(f"Categorized signals: {category}")
         return category
@@ -91,6 +93,10 @@ class SignalCategorizer:
     def _classify_signal(self, path: str, signal_def: SignalDef) -> SignalType:
         """Classify a single signal based on its path and name.
 
+        Everything the classification depends on is reduced to a small key, so
+        signals that share a leaf name across module instances are classified
+        once per categorizer.
+
         Args:
             path: Full hierarchical path to the signal.
             signal_def: Signal definition object.
@@ -98,70 +104,111 @@ class SignalCategorizer:
         Returns:
             SignalType classification.
         """
-        name = signal_def.name.lower()
-        path_lower = path.lower()
-
-        # Check for clock signals first
-        if self._matches_any_pattern(name, self.clock_patterns) or self._matches_any_pattern(
-            path_lower, self.clock_patterns
-        ):
-            return SignalType.CLOCK
-
-        # Check for reset signals
-        if self._matches_any_pattern(name, self.reset_patterns) or self._matches_any_pattern(
-            path_lower, self.reset_patterns
-        ):
-            return SignalType.RESET
-
-        # Check for explicit input/output patterns
-        if self._matches_any_pattern(name, self.input_patterns):
-            return SignalType.INPUT
-        if self._matches_any_pattern(name, self.output_patterns):
-            return SignalType.OUTPUT
-
-        # Analyze hierarchy depth and prefixes
+        name = signal_def.name
         path_parts = path.split("/")
+        nested = len(path_parts) > 2
+
+        # Path separators are never part of a keyword, so the path matches are
+        # the union of the (cached) per-component matches
+        path_hits = 0
+        for part in path_parts:
+            path_hits |= self._cached_hits(part)
+
+        internal_hit = nested and any(
+            part.startswith(self.internal_prefixes) for part in path_parts[1:]
+        )
+        key = (
+            name.lower(),
+            signal_def.length,
+            nested,
+            path_parts[0].startswith("tb_"),
+            internal_hit,
+            path_hits & self._path_mask,
+        )
+
+        signal_type = self._type_cache.get(key)
+        if signal_type is None:
+            signal_type = self._type_cache[key] = self._classify_key(*key)
+        return signal_type
+
+    def _classify_key(
+        self,
+        name: str,
+        length: int,
+        nested: bool,
+        tb_prefix: bool,
+        internal_hit: bool,
+        path_hits: int,
+    ) -> SignalType:
+        """Classify a signal from the features extracted by _classify_signal.
+
+        Args:
+            name: Lower-cased signal name.
+            length: Signal bit length.
+            nested: Whether the path has more than two hierarchy levels.
+            tb_prefix: Whether the top-level scope starts with "tb_".
+            internal_hit: Whether a nested scope starts with an internal prefix.
+            path_hits: Clock and reset keyword bits matched by path components.
+
+        Returns:
+            SignalType classification.
+        """
+        # Clock, then reset (name or path), then explicit input/output patterns
+        signal_type = self._keyword_dispatch[self._cached_hits(name) | path_hits]
+        if signal_type is not None:
+            return signal_type
 
         # Check for internal module prefixes (but not for top-level testbench signals)
-        if len(path_parts) > 2:  # Only check internal prefixes for deeply nested signals
-            if any(
-                any(part.startswith(prefix) for part in path_parts[1:])
-                for prefix in self.internal_prefixes
-            ):
-                return SignalType.INTERNAL
+        if internal_hit:  # Only set for deeply nested signals
+            return SignalType.INTERNAL
 
         # Testbench-level signals (tb_* or top-level) - analyze based on typical usage
-        if len(path_parts) <= 2 or path_parts[0].startswith("tb_"):
+        if not nested or tb_prefix:
             # Common testbench outputs: pulse, done, ready, valid, etc.
-            output_indicators = ["pulse", "done", "ready", "valid", "out", "result"]
-            if any(indicator in name for indicator in output_indicators):
+            if self.output_indicator_re.search(name):
                 return SignalType.OUTPUT
 
             # Single-bit signals at testbench level are often inputs (controls)
-            if signal_def.length == 1:
+            if length == 1:
                 return SignalType.INPUT
             else:
                 # Multi-bit signals at testbench level are often outputs (results)
                 return SignalType.OUTPUT
 
         # Signals with multiple hierarchy levels in modules are likely internal
-        if len(path_parts) > 2:
+        if nested:
             return SignalType.INTERNAL
 
         # For signals that don't match any patterns, classify as unknown
         return SignalType.UNKNOWN
 
-    def _matches_any_pattern(self, text: str, patterns: list[re.Pattern]) -> bool:
-        """Check if text matches any of the given regex patterns.
+    def _cached_hits(self, text: str) -> int:
+        """Get the keyword categories of text, scanning each distinct text once.
+
+        Args:
+            text: Text to check (matched case-insensitively).
+
+        Returns:
+            Bit mask of the matched categories (see keyword_bits).
+        """
+        hits = self._hits_cache.get(text)
+        if hits is None:
+            hits = 0
+            for category in self._keyword_hits(text.lower()):
+                hits |= self.keyword_bits[category]
+            self._hits_cache[text] = hits
+        return hits
+
+    def _keyword_hits(self, text: str) -> set[str]:
+        """Find which keyword categories occur in text with a single scan.
 
         Args:
-            text: Text to check.
-            patterns: List of compiled regex patterns.
+            text: Lower-cased text to check.
 
         Returns:
-            True if any pattern matches.
+            Names of the keyword_pattern groups that matched.
         """
-        return any(pattern.search(text) for pattern in patterns)
+        return {match.lastgroup for match in self.keyword_pattern.finditer(text)}
 
     def suggest_clock_signal(self, category: SignalCategory) -> str | None:
         """Suggest the most likely clock signal from categorized signals.
@@ -177,13 +224,13 @@ class SignalCategorizer:
         if not category.clocks:
             # Look for clock-like signals in inputs
             for path in category.inputs:
-                signal_name = path.split("/")[-1].lower()
-                if self._matches_any_pattern(signal_name, self.clock_patterns):
+                signal_name = path.rpartition("/")[2]
+                if self.clock_re.search(signal_name):
                     return path
             return None
 
         # Prefer internal clock signals (longer paths, deeper in hierarchy)
-        internal_clocks = [path for path in category.clocks if len(path.split("/")) > 2]
+        internal_clocks = [path for path in category.clocks if path.count("/") > 1]
         if internal_clocks:
             return internal_clocks[0]
 
@@ -1,15 +1,24 @@
 """Main VCD to WaveJSON extractor."""
 
+import io
 import logging
+import mmap
+import os
+import pickle
 import sys
+from typing import Any
 
 from .generator import WaveJSONGenerator
 from .models import SignalDef
-from .parser import VCDParser
+from .parser import VCDParser, find_header_end
 from .sampler import SignalSampler
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for the dump section: large sequential reads instead of one
+# read syscall per default-sized (8 KiB) block
+_READ_BUFFER_SIZE = 1 << 20
+
 
 class WaveExtractor:
     """Extract signal values from VCD file and output in WaveJSON format."""
@@ -47,6 +56,8 @@ class WaveExtractor:
         self.parser = VCDParser(vcd_file)
         self.path_dict = path_dict
         self.fin = None
+        self.sample_cache = ""
+        self._cached_samples: list[dict[str, list[str]]] | None = None
 
         if not self.path_dict:
             self._setup()
@@ -60,6 +71,37 @@ class WaveExtractor:
             self.path_dict = self.parser.parse_signals()
             self.path_list = list(self.path_dict.keys())
 
+    @classmethod
+    def from_cache(cls, vcd_file: str, json_file: str, cache_file: str) -> "WaveExtractor":
+        """Create an extractor from samples saved by a previous run.
+
+        The VCD file is not parsed or sampled; execute() only formats the
+        cached samples.
+
+        Args:
+            vcd_file: Path to the VCD file the samples were taken from.
+            json_file: Path to output JSON file (empty string for stdout).
+            cache_file: Path to a sample cache written via sample_cache.
+
+        Returns:
+            Extractor holding the cached signals and samples.
+
+        Raises:
+            ValueError: If the cache was not written for the current VCD file.
+        """
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+
+        extractor = cls(vcd_file, json_file, cached["path_list"], cached["path_dict"])
+        if cached.get("vcd_key") != extractor.parser.file_key():
+            raise ValueError(f"Sample cache {cache_file} was not written for {vcd_file}")
+        extractor.wave_chunk = cached["wave_chunk"]
+        extractor.start_time = cached["start_time"]
+        extractor.end_time = cached["end_time"]
+        extractor._cached_samples = cached["sample_groups"]
+        logger.info(f"Loaded cached samples: {cache_file}")
+        return extractor
+
     @property
     def wave_chunk(self) -> int:
         """Number of wave samples per time group."""
@@ -97,20 +139,16 @@ class WaveExtractor:
         Returns:
             Exit code (0 for success).
         """
-        print(f"vcd_file  = '{self.vcd_file}'")
-        print(f"json_file = '{self.json_file}'")
-        print("path_list = [", end="")
-        for i, path in enumerate(self.path_list):
-            if i != 0:
-                print("             ", end="")
-            print(f"'{path}'", end="")
-            if i != len(self.path_list) - 1:
-                print(",")
-            else:
-                print("]")
-        print(f"wave_chunk = {self.wave_chunk}")
-        print(f"start_time = {self.start_time}")
-        print(f"end_time   = {self.end_time}")
+        indent = "\n" + " " * len("path_list = [")
+        paths = f",{indent}".join(f"'{path}'" for path in self.path_list)
+        sys.stdout.write(
+            f"vcd_file  = '{self.vcd_file}'\n"
+            f"json_file = '{self.json_file}'\n"
+            f"path_list = [{paths}]\n"
+            f"wave_chunk = {self.wave_chunk}\n"
+            f"start_time = {self.start_time}\n"
+            f"end_time   = {self.end_time}\n"
+        )
         return 0
 
     def wave_format(self, signal_path: str, fmt: str) -> int:
@@ -139,54 +177,128 @@ class WaveExtractor:
         Returns:
             Exit code (0 for success).
         """
+        sampled = self._sample()
+        if sampled is None:
+            return 1
+        generator, sample_groups = sampled
+
+        # Output JSON
+        if self.json_file == "":
+            sys.stdout.writelines(generator.iter_json(sample_groups))
+        else:
+            logger.info(f"Creating WaveJSON file: {self.json_file}")
+            with open(self.json_file, "wb") as fout:
+                generator.write_json(sample_groups, fout)
+
+        logger.info("WaveJSON generation completed")
+        return 0
+
+    def execute_many(self, outputs: dict[str, list[str]]) -> int:
+        """Sample once and write one WaveJSON file per signal subset.
+
+        The VCD file is read a single time for all outputs, instead of once
+        per file as with separate extractors.
+
+        Args:
+            outputs: Mapping of JSON file path to the signal paths it shows.
+                The first path of each list is regarded as clock, and every
+                path must be in path_list.
+
+        Returns:
+            Exit code (0 for success).
+        """
+        sampled = self._sample()
+        if sampled is None:
+            return 1
+        _, sample_groups = sampled
+
+        for json_file, path_list in outputs.items():
+            generator = WaveJSONGenerator(path_list, self.path_dict, self.wave_chunk)
+            logger.info(f"Creating WaveJSON file: {json_file}")
+            with open(json_file, "wb") as fout:
+                generator.write_json(sample_groups, fout)
+
+        logger.info("WaveJSON generation completed")
+        return 0
+
+    def extract_wavejson(self) -> dict[str, Any] | None:
+        """Perform signal sampling and return the WaveJSON data structure.
+
+        Used to render straight to an image without writing and re-reading
+        an intermediate JSON file.
+
+        Returns:
+            WaveJSON data, or None if no samples were found.
+        """
+        sampled = self._sample()
+        if sampled is None:
+            return None
+        generator, sample_groups = sampled
+
+        return generator.generate_dict(sample_groups)
+
+    def _sample(self) -> tuple[WaveJSONGenerator, list[dict[str, list[str]]]] | None:
+        """Sample the dump section of the VCD file.
+
+        Returns:
+            Tuple of (generator, sample_groups), or None if no samples were found.
+        """
         if not self.path_dict:
             raise RuntimeError("No signals to process")
 
+        generator = WaveJSONGenerator(self.path_list, self.path_dict, self.wave_chunk)
+        if self._cached_samples is not None:
+            return generator, self._cached_samples
+
         logger.info("Starting signal extraction and JSON generation")
 
         # Open VCD file and skip to dump section
         logger.debug(f"Opening VCD file: {self.vcd_file}")
-        fin = open(self.vcd_file, encoding="utf-8")
-
-        # Skip definitions section
-        while True:
-            line = fin.readline()
-            if not line:
+        with open(self.vcd_file, "rb", buffering=_READ_BUFFER_SIZE) as fraw:
+            # Locate the end of the definitions section with one scan of the map
+            header_end = -1
+            if os.fstat(fraw.fileno()).st_size:
+                with mmap.mmap(fraw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    header_end = find_header_end(mm)
+            if header_end == -1:
                 raise ValueError("Unexpected end of file while looking for $enddefinitions")
-            if "$enddefinitions" in line:
-                break
+            fraw.seek(header_end)
 
-        # Set up sampler and generator
-        sampler = SignalSampler(self.wave_chunk, self.start_time, self.end_time)
-        generator = WaveJSONGenerator(self.path_list, self.path_dict, self.wave_chunk)
+            with io.TextIOWrapper(fraw, encoding="utf-8") as fin:
+                # Set up sampler
+                sampler = SignalSampler(self.wave_chunk, self.start_time, self.end_time)
 
-        # Get signal IDs
-        clock_sid = self.path_dict[self.path_list[0]].sid
-        signal_sids = [self.path_dict[path].sid for path in self.path_list]
+                # Get signal IDs
+                clock_sid = self.path_dict[self.path_list[0]].sid
+                signal_sids = [self.path_dict[path].sid for path in self.path_list]
 
-        # Sample signals
-        sample_groups = sampler.sample_signals(fin, clock_sid, signal_sids)
+                # Sample signals
+                sample_groups = sampler.sample_signals(fin, clock_sid, signal_sids)
 
         if not sample_groups:
             logger.warning("No signal samples found")
-            fin.close()
-            return 1
-
-        # Generate JSON
-        json_content = generator.generate_json(sample_groups)
+            return None
 
-        # Output JSON
-        if self.json_file == "":
-            fout = sys.stdout
-        else:
-            logger.info(f"Creating WaveJSON file: {self.json_file}")
-            fout = open(self.json_file, "w", encoding="utf-8")
+        if self.sample_cache:
+            self._save_samples(sample_groups)
 
-        fout.write(json_content)
+        return generator, sample_groups
 
-        fin.close()
-        if self.json_file:
-            fout.close()
+    def _save_samples(self, sample_groups: list[dict[str, list[str]]]) -> None:
+        """Save sampled signals to the sample cache for from_cache().
 
-        logger.info("WaveJSON generation completed")
-        return 0
+        Args:
+            sample_groups: Sample groups returned by the sampler.
+        """
+        cached = {
+            "vcd_key": self.parser.file_key(),
+            "path_list": self.path_list,
+            "path_dict": self.path_dict,
+            "wave_chunk": self.wave_chunk,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "sample_groups": sample_groups,
+        }
+        with open(self.sample_cache, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"Saved samples to cache: {self.sample_cache}")
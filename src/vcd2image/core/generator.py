@@ -1,11 +1,56 @@
 """WaveJSON generation from sampled signal data."""
 
+import functools
 import logging
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, BinaryIO
 
 from .models import SignalDef
 
 logger = logging.getLogger(__name__)
 
+# Size of the reusable output buffer used by write_json
+WRITE_BUFFER_SIZE = 1 << 20
+
+# A character followed by one or more repeats of itself
+_REPEAT_RE = re.compile(r"(.)\1+")
+
+
+def _collapse_run(match: re.Match[str]) -> str:
+    """Replace the repeats in a run of identical characters with dots."""
+    return match[1] + "." * (len(match[0]) - 1)
+
+
+@functools.cache
+def _value_formatter(length: int, fmt: str) -> Callable[[int], str]:
+    """Build the formatter for values of one signal width and display format.
+
+    Args:
+        length: Signal bit length.
+        fmt: Format character (b, d, u, x, X).
+
+    Returns:
+        Function turning an unsigned value into its display string.
+    """
+    if fmt == "b":
+        spec = f"0{length}b"
+    elif fmt == "d":
+        if length > 1:
+            # Signed decimal: use two's complement for negative numbers
+            sign_bit = 1 << (length - 1)
+            wrap = 1 << length
+            return lambda value: str(value - wrap if value & sign_bit else value)
+        return str
+    elif fmt == "u":
+        return str
+    elif fmt == "X":
+        spec = f"0{((length + 3) // 4)}X"
+    else:  # 'x' or default
+        spec = f"0{((length + 3) // 4)}x"
+
+    return lambda value: format(value, spec)
+
 
 class WaveJSONGenerator:
     """Generates WaveJSON format from signal samples."""
@@ -26,6 +71,12 @@ class WaveJSONGenerator:
         self.clock_name = path_dict[path_list[0]].name
         self.name_width = max(len(path_dict[path].name) for path in path_list)
 
+        # Quoted, padded names are the same in every time group, so build them once
+        self._body_signals = [
+            (path_dict[path], f'"{path_dict[path].name}"'.ljust(self.name_width + 2))
+            for path in path_list[1:]  # Skip clock signal
+        ]
+
     def generate_json(self, sample_groups: list[dict[str, list[str]]]) -> str:
         """Generate complete WaveJSON string.
 
@@ -35,22 +86,117 @@ class WaveJSONGenerator:
         Returns:
             Complete WaveJSON string.
         """
-        json_parts = []
+        return "".join(self.iter_json(sample_groups))
+
+    def iter_json(self, sample_groups: list[dict[str, list[str]]]) -> Iterator[str]:
+        """Yield the WaveJSON document piece by piece.
+
+        Joining the pieces gives the same string as generate_json(); writing
+        them one at a time avoids holding the whole document in memory.
+
+        Args:
+            sample_groups: List of sample groups from signal sampler.
+
+        Yields:
+            Header, one piece per time group, and footer.
+        """
+        yield self._create_header(self._collect_clock_samples(sample_groups))
 
-        # Get clock samples from first sample group
-        clock_sid = self.path_dict[self.path_list[0]].sid
-        clock_samples = []
         for sample_dict in sample_groups:
-            clock_samples.extend(sample_dict.get(clock_sid, []))
+            yield "\n" + self._create_body(sample_dict)
+
+        yield "\n" + self._create_footer()
 
-        json_parts.append(self._create_header(clock_samples))
+    def generate_dict(self, sample_groups: list[dict[str, list[str]]]) -> dict[str, Any]:
+        """Generate the WaveJSON document as Python objects.
+
+        Equivalent to json.loads(generate_json(sample_groups)) without
+        formatting and re-parsing the text.
+
+        Args:
+            sample_groups: List of sample groups from signal sampler.
+
+        Returns:
+            WaveJSON data structure.
+        """
+        clock_wave = self._wave(self._collect_clock_samples(sample_groups))
+        signal: list[Any] = [{"name": self.clock_name, "wave": clock_wave}]
 
         for sample_dict in sample_groups:
-            json_parts.append(self._create_body(sample_dict))
+            group: list[Any] = ["0"]
+            for signal_def, _name in self._body_signals:
+                wave, data = self._wave_fields(signal_def, sample_dict.get(signal_def.sid, []))
+                entry = {"name": signal_def.name, "wave": wave}
+                if data is not None:
+                    entry["data"] = data
+                group.append(entry)
+            signal.append({})
+            signal.append(group)
+
+        return {"head": {"tock": 1}, "signal": signal}
+
+    def write_json(
+        self,
+        sample_groups: list[dict[str, list[str]]],
+        fout: BinaryIO,
+        buffer_size: int = WRITE_BUFFER_SIZE,
+    ) -> None:
+        """Write WaveJSON to a binary stream one time group at a time.
+
+        Produces the same document as generate_json() without holding the
+        complete string in memory. Encoded groups are collected in one
+        reusable buffer and written out whenever it fills up.
+
+        Args:
+            sample_groups: List of sample groups from signal sampler.
+            fout: Binary file object to write UTF-8 encoded JSON to.
+            buffer_size: Size of the output buffer in bytes.
+        """
+        buf = bytearray(buffer_size)
+        view = memoryview(buf)
+        used = 0
+
+        for chunk in self._iter_encoded(sample_groups):
+            size = len(chunk)
+            if used + size > buffer_size:
+                fout.write(view[:used])
+                used = 0
+                if size > buffer_size:
+                    fout.write(chunk)
+                    continue
+            view[used : used + size] = chunk
+            used += size
+
+        if used:
+            fout.write(view[:used])
+        view.release()
+
+    def _iter_encoded(self, sample_groups: list[dict[str, list[str]]]) -> Iterator[bytes]:
+        """Yield the WaveJSON document as UTF-8 encoded pieces.
+
+        Args:
+            sample_groups: List of sample groups from signal sampler.
+
+        Yields:
+            Encoded pieces of iter_json().
+        """
+        for piece in self.iter_json(sample_groups):
+            yield piece.encode("utf-8")
 
-        json_parts.append(self._create_footer())
+    def _collect_clock_samples(self, sample_groups: list[dict[str, list[str]]]) -> list[str]:
+        """Concatenate clock samples across all sample groups.
+
+        Args:
+            sample_groups: List of sample groups from signal sampler.
 
-        return "\n".join(json_parts)
+        Returns:
+            Clock sample values in time order.
+        """
+        clock_sid = self.path_dict[self.path_list[0]].sid
+        clock_samples: list[str] = []
+        for sample_dict in sample_groups:
+            clock_samples.extend(sample_dict.get(clock_sid, []))
+        return clock_samples
 
     def _create_header(self, clock_samples: list[str]) -> str:
         """Create JSON header with clock signal using actual sampled data.
@@ -82,21 +228,17 @@ class WaveJSONGenerator:
         json_lines.append(",\n  {}")
         json_lines.append(f',\n  ["{origin}"')
 
-        for path in self.path_list[1:]:  # Skip clock signal
-            signal_def = self.path_dict[path]
-            sid = signal_def.sid
-            samples = sample_dict.get(sid, [])
+        for signal_def, name in self._body_signals:
+            wave, data = self._wave_fields(signal_def, sample_dict.get(signal_def.sid, []))
 
-            name = f'"{signal_def.name}"'.ljust(self.name_width + 2)
-
-            if signal_def.length == 1:
+            if data is None:
                 # Single-bit signal
-                wave = self._create_wave(samples)
-                json_lines.append(f',\n    {{ "name": {name}, "wave": {wave} }}')
+                json_lines.append(f',\n    {{ "name": {name}, "wave": "{wave}" }}')
             else:
                 # Multi-bit signal
-                wave, data = self._create_wave_data(samples, signal_def.length, signal_def.fmt)
-                json_lines.append(f',\n    {{ "name": {name}, "wave": {wave}, "data": {data} }}')
+                json_lines.append(
+                    f',\n    {{ "name": {name}, "wave": "{wave}", "data": "{data}" }}'
+                )
 
         json_lines.append("\n  ]")
         return "".join(json_lines)
@@ -109,6 +251,23 @@ class WaveJSONGenerator:
         """
         return "\n  ]\n}"
 
+    def _wave_fields(self, signal_def: SignalDef, samples: list[str]) -> tuple[str, str | None]:
+        """Create the unquoted wave and data values of one signal entry.
+
+        Both the text and the dict document builders use this, so the two
+        always agree.
+
+        Args:
+            signal_def: Definition of the signal.
+            samples: List of sample values.
+
+        Returns:
+            Tuple of (wave, data); data is None for single-bit signals.
+        """
+        if signal_def.length == 1:
+            return self._wave(samples), None
+        return self._wave_data(samples, signal_def.length, signal_def.fmt)
+
     def _create_wave(self, samples: list[str]) -> str:
         """Create wave string for single-bit signals.
 
@@ -118,22 +277,52 @@ class WaveJSONGenerator:
         Returns:
             Wave string in quotes.
         """
-        if not samples:
-            return '""'
+        return f'"{self._wave(samples)}"'
 
-        prev = None
-        wave = ""
-        for value in samples:
-            if value == prev:
-                wave += "."
-            else:
-                wave += value
-            prev = value
-        return f'"{wave}"'
+    def _wave(self, samples: list[str]) -> str:
+        """Create the unquoted wave string for single-bit signals.
+
+        Args:
+            samples: List of sample values.
+
+        Returns:
+            Wave string.
+        """
+        if not samples:
+            return ""
+
+        joined = "".join(samples)
+        if len(joined) == len(samples):
+            # One character per sample: find runs in C and call back once per run
+            wave = _REPEAT_RE.sub(_collapse_run, joined)
+        else:
+            # Pair each sample with its predecessor; repeats collapse to "."
+            prevs = [None, *samples]
+            wave = "".join(
+                [
+                    "." if value == prev else value
+                    for prev, value in zip(prevs, samples, strict=False)
+                ]
+            )
+        return wave
 
     def _create_wave_data(self, samples: list[str], length: int, fmt: str) -> tuple[str, str]:
         """Create wave and data strings for multi-bit signals.
 
+        Args:
+            samples: List of sample values.
+            length: Signal bit length.
+            fmt: Display format.
+
+        Returns:
+            Tuple of (wave_string, data_string) in quotes.
+        """
+        wave, data = self._wave_data(samples, length, fmt)
+        return f'"{wave}"', f'"{data}"'
+
+    def _wave_data(self, samples: list[str], length: int, fmt: str) -> tuple[str, str]:
+        """Create the unquoted wave and data strings for multi-bit signals.
+
         Args:
             samples: List of sample values.
             length: Signal bit length.
@@ -143,25 +332,37 @@ class WaveJSONGenerator:
             Tuple of (wave_string, data_string).
         """
         if not samples:
-            return '""', '""'
+            return "", ""
 
         prev = None
-        wave = ""
-        data = ""
+        wave: list[str] = []
+        data: list[str] = []
+        # Wave character and data label of each distinct value seen so far
+        symbols: dict[str, tuple[str, str | None]] = {}
+        format_value = _value_formatter(length, fmt)
 
         for value in samples:
             if value == prev:
-                wave += "."
-            elif self._is_binary_string(value):
-                wave += "="
-                data += " " + self._format_value(value, length, fmt)
-            elif all(c == "z" for c in value):
-                wave += "z"
-            else:
-                wave += "x"
+                wave.append(".")
+                continue
             prev = value
 
-        return f'"{wave}"', f'"{data[1:]}"'
+            symbol = symbols.get(value)
+            if symbol is None:
+                if self._is_binary_string(value):
+                    symbol = ("=", format_value(int(value, 2)))
+                elif not value.strip("z"):
+                    symbol = ("z", None)
+                else:
+                    symbol = ("x", None)
+                symbols[value] = symbol
+
+            code, label = symbol
+            wave.append(code)
+            if label is not None:
+                data.append(label)
+
+        return "".join(wave), " ".join(data)
 
     def _is_binary_string(self, value: str) -> bool:
         """Check if string contains only binary digits.
@@ -172,7 +373,8 @@ class WaveJSONGenerator:
         Returns:
             True if string contains only 0s and 1s and is not empty.
         """
-        return bool(value) and all(c in ("0", "1") for c in value)
+        # strip() removes every 0/1 in one C-level scan; anything left is not binary
+        return bool(value) and not value.strip("01")
 
     def _format_value(self, value: str, length: int, fmt: str) -> str:
         """Format multi-bit value according to specified format.
@@ -190,18 +392,4 @@ class WaveJSONGenerator:
         except ValueError:
             return "x"
 
-        if fmt == "b":
-            fmt_str = f"0{length}b"
-        elif fmt == "d":
-            # Signed decimal: use two's complement for negative numbers
-            if length > 1 and (value_int & (1 << (length - 1))):  # MSB is set
-                value_int = value_int - (1 << length)  # Convert to signed
-            fmt_str = "d"
-        elif fmt == "u":
-            fmt_str = "d"
-        elif fmt == "X":
-            fmt_str = f"0{((length + 3) // 4)}X"
-        else:  # 'x' or default
-            fmt_str = f"0{((length + 3) // 4)}x"
-
-        return format(value_int, fmt_str)
+        return _value_formatter(length, fmt)(value_int)
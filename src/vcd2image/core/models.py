@@ -17,6 +17,9 @@ class SignalType(Enum):
 class SignalDef:
     """Definition of a VCD signal."""
 
+    # One instance per signal in the VCD file, so skip the per-instance __dict__
+    __slots__ = ("name", "sid", "length", "path", "fmt", "signal_type")
+
     def __init__(self, name: str, sid: str, length: int, path: str = "") -> None:
         """Initialize signal definition.
 
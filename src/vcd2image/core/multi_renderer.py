@@ -1,21 +1,218 @@
 """Multi-figure renderer for generating categorized signal plots."""
 
+import hashlib
+import json
 import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .categorizer import SignalCategorizer
 from .extractor import WaveExtractor
 from .models import SignalDef
-from .parser import VCDParser
+from .parser import VCDParser, default_cache_dir
 from .renderer import WaveRenderer
-from .signal_plotter import SignalPlotter
+from .signal_plotter import SignalCategory, SignalPlotter, plot_filenames
 
 if TYPE_CHECKING:
-    pass
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Per-category keys of the figures and JSON files in an output directory, so
+# an unchanged category is not drawn or extracted again
+_OUTPUT_MANIFEST = ".vcd2image.cache.json"
+
+
+def _sampling_clock(signal_dict: dict[str, SignalDef]) -> str | None:
+    """Suggest the clock to sample category JSON on.
+
+    Args:
+        signal_dict: All signal definitions of the VCD file.
+
+    Returns:
+        Path of the suggested clock signal, or None if there is none.
+    """
+    categorizer = SignalCategorizer()
+    return categorizer.suggest_clock_signal(categorizer.categorize_signals(signal_dict))
+
+
+def _with_clock(clock_signal: str | None, signals: list[str]) -> list[str]:
+    """Prepare a signal list with the clock as first element for WaveExtractor.
+
+    WaveExtractor expects the first signal to be the clock for sampling.
+    """
+    if clock_signal and clock_signal not in signals:
+        return [clock_signal] + signals
+    return signals
+
+
+def _write_category_jsons(
+    vcd_file: str, categories: list[tuple[str, list[str]]], output_path: Path
+) -> None:
+    """Generate the WaveJSON files for several signal categories from one sampling pass.
+
+    Module-level so it can run in a worker process. If the combined pass
+    fails, each category is retried on its own so one bad category does
+    not cost the others their files.
+
+    Args:
+        vcd_file: Path to VCD file.
+        categories: (category name, signal paths) of each JSON file to write
+        output_path: Base output directory path
+    """
+    if not categories:
+        return
+
+    json_files = {
+        category_name: output_path / "plots" / f"{category_name}.json"
+        for category_name, _ in categories
+    }
+
+    # Parse and categorize once; the per-category fallback reuses both
+    try:
+        parser = VCDParser(vcd_file)
+        signal_dict = parser.parse_signals()
+        clock_signal = _sampling_clock(signal_dict)
+    except Exception as e:
+        logger.warning(f"Failed to generate category JSON files: {e}")
+        return
+
+    try:
+        outputs = {
+            str(json_files[category_name]): _with_clock(clock_signal, signals)
+            for category_name, signals in categories
+        }
+        union = list(dict.fromkeys(path for paths in outputs.values() for path in paths))
+
+        # Sample the union of all category signals in a single extractor pass
+        extractor = WaveExtractor(vcd_file, "", union, parser.filter_path_dict(union, signal_dict))
+        result = extractor.execute_many(outputs)
+    except Exception as e:
+        logger.warning(f"Failed to generate category JSON files in one pass: {e}")
+        result = None
+
+    if result != 0:
+        for category_name, signals in categories:
+            _write_category_json(
+                vcd_file, category_name, signals, output_path, signal_dict, clock_signal
+            )
+        return
+
+    for category_name, _ in categories:
+        logger.info(f"Generated JSON file for {category_name}: {json_files[category_name]}")
+
+
+def _write_category_json(
+    vcd_file: str,
+    category_name: str,
+    signals: list[str],
+    output_path: Path,
+    signal_dict: dict[str, SignalDef] | None = None,
+    clock_signal: str | None = None,
+) -> None:
+    """Generate the WaveJSON file for one signal category.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        vcd_file: Path to VCD file.
+        category_name: Name of the signal category
+        signals: List of signal paths in this category
+        output_path: Base output directory path
+        signal_dict: All signal definitions of the VCD file; parsed here if None
+        clock_signal: Clock to sample on; suggested here if signal_dict is None
+    """
+    if not signals:
+        logger.warning(f"No signals found for {category_name} category, skipping JSON generation")
+        return
+
+    try:
+        # Create JSON file path in plots subdirectory
+        json_file = output_path / "plots" / f"{category_name}.json"
+
+        # Get suggested clock signal for sampling from the original categorizer results
+        parser = VCDParser(vcd_file)
+        if signal_dict is None:
+            signal_dict = parser.parse_signals()
+            clock_signal = _sampling_clock(signal_dict)
+
+        signals_with_clock = _with_clock(clock_signal, signals)
+
+        # Use WaveExtractor to generate JSON for these specific signals,
+        # handing it the definitions parsed above
+        extractor = WaveExtractor(
+            vcd_file,
+            str(json_file),
+            signals_with_clock,
+            parser.filter_path_dict(signals_with_clock, signal_dict),
+        )
+
+        # Set some basic parameters
+        extractor.start_time = 0
+        extractor.end_time = 0  # Extract full range
+
+        result = extractor.execute()
+
+        if result == 0 and json_file.exists():
+            logger.info(f"Generated JSON file for {category_name}: {json_file}")
+        else:
+            logger.warning(
+                f"Failed to generate JSON for {category_name}: WaveExtractor returned {result}"
+            )
+
+    except Exception as e:
+        logger.warning(f"Failed to generate JSON for {category_name}: {e}")
+
+
+def _outputs_exist(plots_dir: Path, base_name: str, category_name: str, signal_count: int) -> bool:
+    """Check that a category's JSON file and every part of its PNG figure exist."""
+    return (plots_dir / f"{category_name}.json").exists() and all(
+        (plots_dir / filename).exists()
+        for filename in plot_filenames(f"{base_name}_{category_name}.png", signal_count)
+    )
+
+
+def _load_output_manifest(output_path: Path) -> dict[str, str]:
+    """Load the category keys recorded for an output directory.
+
+    Args:
+        output_path: Base output directory path
+
+    Returns:
+        Mapping of category name to key, empty if none could be read.
+    """
+    try:
+        with open(output_path / _OUTPUT_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable output manifest in {output_path}: {e}")
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_output_manifest(output_path: Path, manifest: dict[str, str]) -> None:
+    """Record the category keys for an output directory.
+
+    Args:
+        output_path: Base output directory path
+        manifest: Mapping of category name to key
+    """
+    manifest_file = output_path / _OUTPUT_MANIFEST
+
+    # Write to a temporary file first so a concurrent run never reads a partial manifest
+    tmp_file = manifest_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, manifest_file)
+    except OSError as e:
+        logger.debug(f"Failed to write output manifest {manifest_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
 
 class MultiFigureRenderer:
     """Renderer for generating multiple figures from categorized signals."""
@@ -29,6 +226,119 @@ class MultiFigureRenderer:
         self.skin = skin
         self.categorizer = SignalCategorizer()
         self.renderer = WaveRenderer(skin)
+        self.jobs = 1
+        self._parsed: tuple[tuple[str, int, int], dict[str, SignalDef]] | None = None
+        self._categories: tuple[tuple[tuple[str, int, int], str], SignalCategory] | None = None
+        self._loaded: tuple[tuple[str, int, int], pd.DataFrame, list[str] | None] | None = None
+
+    def load_parsed(
+        self, vcd_file: str, cache_dir: str | Path | None = None
+    ) -> dict[str, SignalDef]:
+        """Load signal definitions through the on-disk parse cache.
+
+        Subsequent render_* calls for the same VCD file reuse the loaded
+        definitions instead of parsing the file again.
+
+        Args:
+            vcd_file: Path to VCD file.
+            cache_dir: Cache directory (defaults to the per-user cache directory).
+
+        Returns:
+            Dictionary mapping signal paths to signal definitions.
+        """
+        parser = VCDParser(vcd_file)
+        path_dict = parser.parse_signals_cached(cache_dir or default_cache_dir())
+        self._parsed = (self._parsed_key(vcd_file), path_dict)
+        return path_dict
+
+    def _parsed_key(self, vcd_file: str) -> tuple[str, int, int]:
+        """Identify the current contents of a file by resolved path, mtime and size.
+
+        The path is resolved so that relative and absolute spellings of the
+        same file share one key.
+        """
+        stat = os.stat(vcd_file)
+        return str(Path(vcd_file).resolve()), stat.st_mtime_ns, stat.st_size
+
+    def _get_parsed(self, vcd_file: str) -> dict[str, SignalDef] | None:
+        """Get signal definitions for a VCD file, parsing it only on first use.
+
+        Definitions are kept on the renderer so that later render_* calls for
+        the same, unmodified file skip the parse.
+
+        Args:
+            vcd_file: Path to VCD file.
+
+        Returns:
+            Signal dictionary, or None if the file cannot be parsed here
+            (SignalPlotter.load_data then reports the error).
+        """
+        try:
+            key = self._parsed_key(vcd_file)
+            if self._parsed is None or self._parsed[0] != key:
+                self._parsed = (key, VCDParser(vcd_file).parse_signals())
+        except (OSError, EOFError, ValueError) as e:
+            logger.debug(f"Not caching signal definitions for {vcd_file}: {e}")
+            return None
+        return self._parsed[1]
+
+    def _load_data(self, plotter: SignalPlotter, vcd_file: str) -> bool:
+        """Load the plotter's waveform data, reusing an earlier render call's samples.
+
+        The samples are kept per VCD file contents, so render_* calls for the
+        same file sample its value changes only once.
+
+        Args:
+            plotter: SignalPlotter to load data into.
+            vcd_file: Path to VCD file.
+
+        Returns:
+            True if data was loaded, False otherwise.
+        """
+        signal_dict = self._get_parsed(vcd_file)
+        try:
+            key = self._parsed_key(vcd_file)
+        except OSError:
+            return plotter.load_data(signal_dict)
+
+        # SignalPlotter only reads or replaces its frame, never mutates it, so
+        # render calls share one frame instead of copying it
+        if signal_dict is not None and self._loaded is not None and self._loaded[0] == key:
+            plotter.adopt_data(signal_dict, self._loaded[1], self._loaded[2])
+            return True
+
+        if not plotter.load_data(signal_dict):
+            return False
+        if plotter.data is not None:
+            self._loaded = (key, plotter.data, plotter.valid_signal_paths)
+        return True
+
+    def _categorize(self, plotter: SignalPlotter) -> bool:
+        """Categorize the plotter's signals, reusing an earlier render call's result.
+
+        The result is kept per VCD file contents and Verilog file, so render_*
+        calls for the same design categorize it only once.
+
+        Args:
+            plotter: SignalPlotter with data loaded.
+
+        Returns:
+            True if categorization succeeded, False otherwise.
+        """
+        try:
+            key = (self._parsed_key(str(plotter.vcd_file)), str(plotter.verilog_file))
+        except OSError:
+            return plotter.categorize_signals()
+
+        if self._categories is not None and self._categories[0] == key:
+            plotter.categories = self._categories[1]
+            return True
+
+        if not plotter.categorize_signals():
+            return False
+        if plotter.categories is not None:
+            self._categories = (key, plotter.categories)
+        return True
 
     def render_categorized_figures(
         self,
@@ -65,11 +375,11 @@ class MultiFigureRenderer:
             )
 
             # Load and categorize data
-            if not plotter.load_data():
+            if not self._load_data(plotter, vcd_file):
                 logger.error("Failed to load VCD data")
                 return 1
 
-            if not plotter.categorize_signals():
+            if not self._categorize(plotter):
                 logger.error("Failed to categorize signals")
                 return 1
 
@@ -96,11 +406,18 @@ class MultiFigureRenderer:
         category = plotter.categories
 
         # Determine clock signal for reference from available categorized signals
-        clock_signals = [s for s in category.inputs if "clock" in s.lower() or "clk" in s.lower()]
-        reset_signals = [s for s in category.inputs if "reset" in s.lower() or "rst" in s.lower()]
+        clock_signals: list[str] = []
+        reset_signals: list[str] = []
+        for signal in category.inputs:
+            lowered = signal.lower()
+            if "clock" in lowered or "clk" in lowered:
+                clock_signals.append(signal)
+            if "reset" in lowered or "rst" in lowered:
+                reset_signals.append(signal)
 
         # Use the first available clock signal (they should already be filtered to top-level)
         clock_signal = clock_signals[0] if clock_signals else None
+        clock_or_reset = {*clock_signals, *reset_signals}
 
         # Generate figures for each category with enhanced styling
         category_configs = [
@@ -109,12 +426,14 @@ class MultiFigureRenderer:
             (
                 "inputs",
                 "Input Ports",
-                [s for s in category.inputs if s not in clock_signals and s not in reset_signals],
+                [s for s in category.inputs if s not in clock_or_reset],
             ),
             ("outputs", "Output Ports", category.outputs),
             ("internals", "Internal Signals", category.internals),
         ]
 
+        # Categories that get a figure, and with it a JSON file
+        planned: list[tuple[str, str, list[str], list[str]]] = []
         for category_name, title, signals in category_configs:
             if not signals:
                 logger.warning(f"No signals found for {category_name} category")
@@ -127,31 +446,160 @@ class MultiFigureRenderer:
                 logger.warning(f"Skipping {category_name} figure: insufficient signals")
                 continue
 
-            logger.info(
-                f"Generating enhanced {category_name} figure with {len(plot_signals)} signals"
-            )
+            planned.append((category_name, title, signals, plot_signals))
+
+        # Skip categories whose figure and JSON file were made from the same inputs
+        keys = self._output_keys(plotter, planned, base_name, formats)
+        manifest = _load_output_manifest(output_path) if keys else {}
+        plots_dir = output_path / "plots"
+        if manifest:
+            current = {
+                category_name
+                for category_name, _title, _signals, plot_signals in planned
+                if manifest.get(category_name) == keys[category_name]
+                and _outputs_exist(plots_dir, base_name, category_name, len(plot_signals))
+            }
+            for category_name in sorted(current):
+                logger.info(f"Skipping {category_name} figure: outputs are up to date")
+            planned = [entry for entry in planned if entry[0] not in current]
+
+        json_categories = [(category_name, signals) for category_name, _, signals, _ in planned]
+
+        # All category JSON files come from one pass over the VCD file; with
+        # jobs > 1 it runs in a worker process while the figures are drawn here
+        pool = ProcessPoolExecutor(max_workers=1) if self.jobs > 1 and json_categories else None
 
-            # Create enhanced plot using SignalPlotter
-            plotter._create_enhanced_signal_plot(
-                plot_signals,
-                f"{title} (Enhanced)",
-                f"{base_name}_{category_name}.png",
-                color="mixed",  # Use mixed colors for categorized plots
-            )
+        try:
+            future: Future[None] | None = None
+            if pool is not None:
+                future = pool.submit(
+                    _write_category_jsons, str(plotter.vcd_file), json_categories, output_path
+                )
 
-            # Generate additional formats if requested
-            for fmt in formats:
-                if fmt == "svg":
-                    # For SVG, we'd need to implement SVG export in SignalPlotter
-                    logger.info(f"SVG format requested for {category_name} but not yet implemented")
-                elif fmt == "html":
-                    # For HTML, we'd need to implement HTML export in SignalPlotter
-                    logger.info(
-                        f"HTML format requested for {category_name} but not yet implemented"
+            if self.jobs > 1 and len(planned) > 1:
+                # Figures are independent Agg figures, so categories draw in parallel
+                with ThreadPoolExecutor(max_workers=min(self.jobs, len(planned))) as threads:
+                    drawn = [
+                        threads.submit(
+                            self._draw_category_figure,
+                            plotter,
+                            category_name,
+                            title,
+                            plot_signals,
+                            base_name,
+                            formats,
+                        )
+                        for category_name, title, _signals, plot_signals in planned
+                    ]
+                for figure in drawn:
+                    figure.result()
+            else:
+                for category_name, title, _signals, plot_signals in planned:
+                    self._draw_category_figure(
+                        plotter, category_name, title, plot_signals, base_name, formats
                     )
 
-            # Generate JSON file for this category
-            self._generate_category_json(plotter, category_name, signals, output_path)
+            # Generate the JSON files for all plotted categories
+            if future is not None:
+                future.result()
+            elif json_categories:
+                self._generate_category_jsons(plotter, json_categories, output_path)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if keys and planned:
+            for category_name, _title, _signals, plot_signals in planned:
+                if _outputs_exist(plots_dir, base_name, category_name, len(plot_signals)):
+                    manifest[category_name] = keys[category_name]
+            _save_output_manifest(output_path, manifest)
+
+    def _output_keys(
+        self,
+        plotter: "SignalPlotter",
+        planned: list[tuple[str, str, list[str], list[str]]],
+        base_name: str,
+        formats: list[str],
+    ) -> dict[str, str]:
+        """Key each planned category by everything its figure and JSON file depend on.
+
+        The key covers the VCD and Verilog files by path, modification time
+        and size, so a rewritten input never matches a stale entry.
+
+        Args:
+            plotter: The SignalPlotter instance with VCD data
+            planned: (category name, title, signals, plot signals) of each figure
+            base_name: Base name for output files
+            formats: Additional formats requested for the figures
+
+        Returns:
+            Mapping of category name to key, empty if the inputs cannot be identified.
+        """
+        try:
+            vcd_key = self._parsed_key(str(plotter.vcd_file))
+            verilog_key = (
+                self._parsed_key(str(plotter.verilog_file)) if plotter.verilog_file else None
+            )
+        except OSError:
+            return {}
+
+        inputs = (vcd_key, verilog_key, base_name, sorted(formats))
+        return {
+            category_name: hashlib.blake2b(
+                repr((inputs, category_name, title, plot_signals)).encode(), digest_size=16
+            ).hexdigest()
+            for category_name, title, _signals, plot_signals in planned
+        }
+
+    def _draw_category_figure(
+        self,
+        plotter: "SignalPlotter",
+        category_name: str,
+        title: str,
+        plot_signals: list[str],
+        base_name: str,
+        formats: list[str],
+    ) -> None:
+        """Draw the enhanced figure of one signal category.
+
+        Args:
+            plotter: The SignalPlotter instance with VCD data
+            category_name: Name of the signal category
+            title: Figure title
+            plot_signals: Signal paths to plot, clock first
+            base_name: Base name for output files
+            formats: Additional formats requested for the figure
+        """
+        logger.info(f"Generating enhanced {category_name} figure with {len(plot_signals)} signals")
+
+        # Create enhanced plot using SignalPlotter
+        plotter._create_enhanced_signal_plot(
+            plot_signals,
+            f"{title} (Enhanced)",
+            f"{base_name}_{category_name}.png",
+            color="mixed",  # Use mixed colors for categorized plots
+        )
+
+        # Generate additional formats if requested
+        for fmt in formats:
+            if fmt == "svg":
+                # For SVG, we'd need to implement SVG export in SignalPlotter
+                logger.info(f"SVG format requested for {category_name} but not yet implemented")
+            elif fmt == "html":
+                # For HTML, we'd need to implement HTML export in SignalPlotter
+                logger.info(f"HTML format requested for {category_name} but not yet implemented")
+
+    def _generate_category_jsons(
+        self, plotter: "SignalPlotter", categories: list[tuple[str, list[str]]], output_path: Path
+    ) -> None:
+        """Generate JSON files for several signal categories from one pass over the VCD file.
+
+        Args:
+            plotter: The SignalPlotter instance with VCD data
+            categories: (category name, signal paths) of each JSON file to write
+            output_path: Base output directory path
+        """
+        _write_category_jsons(str(plotter.vcd_file), categories, output_path)
 
     def _generate_category_json(
         self, plotter: "SignalPlotter", category_name: str, signals: list[str], output_path: Path
@@ -164,50 +612,7 @@ class MultiFigureRenderer:
             signals: List of signal paths in this category
             output_path: Base output directory path
         """
-        if not signals:
-            logger.warning(
-                f"No signals found for {category_name} category, skipping JSON generation"
-            )
-            return
-
-        try:
-            # Create JSON file path in plots subdirectory
-            json_file = output_path / "plots" / f"{category_name}.json"
-
-            # Get suggested clock signal for sampling from the original categorizer results
-            from .categorizer import SignalCategorizer
-
-            parser = VCDParser(str(plotter.vcd_file))
-            signal_dict = parser.parse_signals()
-            categorizer = SignalCategorizer()
-            original_category = categorizer.categorize_signals(signal_dict)
-            clock_signal = categorizer.suggest_clock_signal(original_category)
-
-            # Prepare signals list with clock as first element for WaveExtractor
-            # WaveExtractor expects first signal to be clock for sampling
-            if clock_signal and clock_signal not in signals:
-                signals_with_clock = [clock_signal] + signals
-            else:
-                signals_with_clock = signals
-
-            # Use WaveExtractor to generate JSON for these specific signals
-            extractor = WaveExtractor(str(plotter.vcd_file), str(json_file), signals_with_clock)
-
-            # Set some basic parameters
-            extractor.start_time = 0
-            extractor.end_time = 0  # Extract full range
-
-            result = extractor.execute()
-
-            if result == 0 and json_file.exists():
-                logger.info(f"Generated JSON file for {category_name}: {json_file}")
-            else:
-                logger.warning(
-                    f"Failed to generate JSON for {category_name}: WaveExtractor returned {result}"
-                )
-
-        except Exception as e:
-            logger.warning(f"Failed to generate JSON for {category_name}: {e}")
+        _write_category_json(str(plotter.vcd_file), category_name, signals, output_path)
 
     def render_enhanced_plots_with_golden_references(
         self, vcd_file: str, verilog_file: str | None = None, output_dir: str = "enhanced_plots"
@@ -235,11 +640,11 @@ class MultiFigureRenderer:
             )
 
             # Load and categorize data
-            if not plotter.load_data():
+            if not self._load_data(plotter, vcd_file):
                 logger.error("Failed to load VCD data")
                 return 1
 
-            if not plotter.categorize_signals():
+            if not self._categorize(plotter):
                 logger.error("Failed to categorize signals")
                 return 1
 
@@ -324,11 +729,11 @@ class MultiFigureRenderer:
             )
 
             # Load and categorize data
-            if not plotter.load_data():
+            if not self._load_data(plotter, vcd_file):
                 logger.error("Failed to load VCD data")
                 return 1
 
-            if not plotter.categorize_signals():
+            if not self._categorize(plotter):
                 logger.error("Failed to categorize signals")
                 return 1
 
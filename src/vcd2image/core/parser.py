@@ -1,6 +1,13 @@
 """VCD file parser for extracting signal definitions and hierarchies."""
 
+import hashlib
+import io
 import logging
+import mmap
+import os
+import pickle
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TextIO
 
@@ -8,6 +15,43 @@ from .models import SignalDef
 
 logger = logging.getLogger(__name__)
 
+# Layout of the pickled caches keyed by VCDParser.file_key(); bump it whenever
+# SignalDef or the cached data changes so older cache files are never loaded
+CACHE_FORMAT = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory for persisted signal definitions.
+
+    Returns:
+        ``$XDG_CACHE_HOME/vcd2image``, or ``~/.cache/vcd2image`` if unset.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "vcd2image"
+
+
+def find_header_end(mm: mmap.mmap) -> int:
+    """Find the end of the definitions section in a memory-mapped VCD file.
+
+    Only a ``$enddefinitions`` keyword that starts a line counts, matching
+    the line-based parser.
+
+    Args:
+        mm: Memory map of the VCD file.
+
+    Returns:
+        Offset just past the line containing ``$enddefinitions``, or -1 if
+        there is none.
+    """
+    pos = mm.find(b"$enddefinitions")
+    while pos != -1:
+        line_start = mm.rfind(b"\n", 0, pos) + 1
+        if not mm[line_start:pos].strip():
+            line_end = mm.find(b"\n", pos)
+            return len(mm) if line_end == -1 else line_end + 1
+        pos = mm.find(b"$enddefinitions", pos + 1)
+    return -1
+
 
 class VCDParser:
     """Parser for VCD (Value Change Dump) files."""
@@ -36,15 +80,112 @@ class VCDParser:
         """
         logger.info(f"Parsing VCD file: {self.vcd_file}")
 
-        with open(self.vcd_file, encoding="utf-8") as fin:
-            all_paths, path_dict = self._create_path_dict(fin)
+        all_paths, path_dict = self._create_path_dict(io.StringIO(self._read_header()))
 
         if path_list:
-            path_dict = self._filter_path_dict(path_list, path_dict)
+            path_dict = self.filter_path_dict(path_list, path_dict)
 
         logger.info(f"Found {len(path_dict)} signals")
         return path_dict
 
+    def list_signals(self) -> list[str]:
+        """List signal paths from the VCD header without building signal definitions.
+
+        Only the definitions section is read, so the value change section is
+        never touched.
+
+        Returns:
+            Signal paths in declaration order.
+        """
+        return [path for path, _words in self._iter_vars(self._read_header().splitlines())]
+
+    def _read_header(self) -> str:
+        """Read the definitions section of the VCD file.
+
+        The file is memory-mapped and only the bytes up to the end of the
+        ``$enddefinitions`` line are decoded; the value change section is
+        never copied into Python strings.
+
+        Returns:
+            Definitions section text, including the ``$enddefinitions`` line.
+
+        Raises:
+            EOFError: If the file has no ``$enddefinitions`` line.
+        """
+        with open(self.vcd_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise EOFError("Can't find word '$enddefinitions' in VCD file.")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = find_header_end(mm)
+                if end == -1:
+                    raise EOFError("Can't find word '$enddefinitions' in VCD file.")
+                return mm[:end].decode("utf-8")
+
+    def file_key(self) -> str:
+        """Get a key identifying this VCD file's current contents.
+
+        The key covers the resolved path, modification time and size, so a
+        rewritten VCD file gets a different key, and CACHE_FORMAT, so caches
+        written in an older layout are not matched.
+
+        Returns:
+            Hex digest of the file's identity.
+        """
+        stat = self.vcd_file.stat()
+        return hashlib.blake2b(
+            f"{CACHE_FORMAT}:{self.vcd_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def cache_file(self, cache_dir: str | Path) -> Path:
+        """Get the cache file for this VCD file's current contents.
+
+        Args:
+            cache_dir: Directory holding cached signal definitions.
+
+        Returns:
+            Path to the pickle file for this VCD file.
+        """
+        return Path(cache_dir) / f"{self.file_key()}.pkl"
+
+    def parse_signals_cached(self, cache_dir: str | Path) -> dict[str, SignalDef]:
+        """Parse all signal definitions, reusing a previous parse if cached.
+
+        Args:
+            cache_dir: Directory holding cached signal definitions.
+
+        Returns:
+            Dictionary mapping signal paths to signal definitions.
+        """
+        cache_file = self.cache_file(cache_dir)
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict):
+                logger.info(f"Loaded cached signal definitions: {cache_file}")
+                return cached
+            logger.debug(f"Ignoring cache file {cache_file} holding {type(cached).__name__}")
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable cache file {cache_file}: {e}")
+
+        path_dict = self.parse_signals()
+
+        # Write to a temporary file first so concurrent readers never see a partial pickle
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump(path_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to write cache file {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+        return path_dict
+
     def _create_path_dict(self, fin: TextIO) -> tuple[list[str], dict[str, SignalDef]]:
         """Create path dictionary from VCD definitions section.
 
@@ -54,35 +195,51 @@ class VCDParser:
         Returns:
             Tuple of (all_paths, path_dict).
         """
-        hier_list: list[str] = []
         path_list: list[str] = []
         path_dict: dict[str, SignalDef] = {}
 
-        while True:
-            line = fin.readline()
-            if not line:
-                raise EOFError("Can't find word '$enddefinitions' in VCD file.")
+        for path, words in self._iter_vars(fin):
+            # Instances of one module repeat the same names; share one string
+            name = sys.intern(words[4])
+            path_list.append(path)
+            path_dict[path] = SignalDef(name=name, sid=words[3], length=int(words[2]), path=path)
+
+        return path_list, path_dict
+
+    def _iter_vars(self, lines: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+        """Walk the scopes of the definitions section and yield each variable.
+
+        Args:
+            lines: Lines of the definitions section.
+
+        Yields:
+            Tuple of (signal path, words of the ``$var`` line).
 
+        Raises:
+            EOFError: If the lines end before ``$enddefinitions``.
+        """
+        # Path prefix ("" or "scope/.../") of every open scope, innermost last
+        prefixes = [""]
+
+        for line in lines:
             words = line.split()
             if not words:
                 continue
 
-            if words[0] == "$enddefinitions":
-                return path_list, path_dict
-
-            if words[0] == "$scope":
-                hier_list.append(words[2])
-            elif words[0] == "$var":
-                path = "/".join(hier_list + [words[4]])
-                path_list.append(path)
-                path_dict[path] = SignalDef(
-                    name=words[4], sid=words[3], length=int(words[2]), path=path
-                )
-            elif words[0] == "$upscope":
-                if hier_list:
-                    hier_list.pop()
-
-    def _filter_path_dict(
+            keyword = words[0]
+            if keyword == "$var":
+                yield prefixes[-1] + words[4], words
+            elif keyword == "$scope":
+                prefixes.append(prefixes[-1] + words[2] + "/")
+            elif keyword == "$upscope":
+                if len(prefixes) > 1:
+                    prefixes.pop()
+            elif keyword == "$enddefinitions":
+                return
+
+        raise EOFError("Can't find word '$enddefinitions' in VCD file.")
+
+    def filter_path_dict(
         self, path_list: list[str], path_dict: dict[str, SignalDef]
     ) -> dict[str, SignalDef]:
         """Filter path dictionary to only include requested signals.
@@ -1,28 +1,122 @@
 """Python-based renderer for converting WaveJSON to images using matplotlib."""
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-import matplotlib
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None  # type: ignore[assignment]
 
-matplotlib.use("Agg")  # Use non-interactive backend
-import matplotlib.pyplot as plt
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 logger = logging.getLogger(__name__)
 
+# Signals longer than this are rasterized in vector outputs (SVG/PDF), which
+# would otherwise hold one path vertex pair per time step
+_RASTERIZE_STEPS = 500
+
+
+@functools.cache
+def _pyplot() -> ModuleType:
+    """Import matplotlib.pyplot on first use, so importing this module stays cheap.
+
+    Returns:
+        The matplotlib.pyplot module, using the non-interactive Agg backend.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _load_wavejson(json_path: Path) -> dict[str, Any]:
+    """Read a WaveJSON file, parsing it with orjson when that is installed.
+
+    Args:
+        json_path: Path to WaveJSON file.
+
+    Returns:
+        WaveJSON data structure.
+    """
+    # Both parsers take the raw bytes, skipping the text-mode decode
+    data = json_path.read_bytes()
+    wavejson: dict[str, Any] = orjson.loads(data) if orjson is not None else json.loads(data)
+    return wavejson
+
+
+# Signal colors by name substring, first matching rule wins. Keywords that
+# contain another keyword of their rule are left out: "in" also matches
+# "input", "din", "data_in", ...; "out" matches "dout", "valid_out", ...; and
+# "ck" matches "clock"
+_SIGNAL_COLOR_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("in",), "#1f77b4"),  # Input signals (blue)
+    (("out",), "#2ca02c"),  # Output signals (green)
+    (("clk", "ck"), "#9467bd"),  # Clock signals (purple)
+    (("reset", "rst", "clear", "clr"), "#ff7f0e"),  # Reset signals (orange)
+)
+
+# A line segment as ((x0, x1), (y0, y1))
+_Segment = tuple[tuple[float, float], tuple[float, float]]
+
+
+def _joined_segments(segments: list[_Segment]) -> tuple[list[float], list[float]]:
+    """Join line segments into one x/y series, separated by NaN gaps.
+
+    Args:
+        segments: Segments as ((x0, x1), (y0, y1)).
+
+    Returns:
+        x and y values drawing every segment as a separate piece of one line.
+    """
+    xs: list[float] = []
+    ys: list[float] = []
+    nan = float("nan")
+    for (x0, x1), (y0, y1) in segments:
+        xs += (x0, x1, nan)
+        ys += (y0, y1, nan)
+    return xs, ys
+
 
 class WaveRenderer:
     """Renderer for converting WaveJSON to images using matplotlib."""
 
-    def __init__(self, skin: str = "default") -> None:
+    def __init__(self, skin: str = "default", dpi: int = 150) -> None:
         """Initialize wave renderer.
 
         Args:
             skin: Rendering style/theme (currently unused, for compatibility).
+            dpi: Resolution of saved images in dots per inch.
         """
         self.skin = skin
+        self.dpi = dpi
+        self._wavejson: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
+    def _read_wavejson(self, json_path: Path) -> dict[str, Any]:
+        """Read a WaveJSON file, reusing the last read if the file is unchanged.
+
+        The file is identified by path, modification time and size, so
+        rendering one file to an image and to HTML parses it only once.
+
+        Args:
+            json_path: Path to WaveJSON file.
+
+        Returns:
+            WaveJSON data structure.
+        """
+        stat = os.stat(json_path)
+        key = (str(json_path), stat.st_mtime_ns, stat.st_size)
+        if self._wavejson is None or self._wavejson[0] != key:
+            self._wavejson = (key, _load_wavejson(json_path))
+        return self._wavejson[1]
 
     def render_to_image(self, json_file: str, image_file: str) -> int:
         """Render WaveJSON file to image.
@@ -35,7 +129,6 @@ class WaveRenderer:
             Exit code (0 for success).
         """
         json_path = Path(json_file)
-        image_path = Path(image_file)
 
         if not json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {json_file}")
@@ -43,8 +136,21 @@ class WaveRenderer:
         logger.info(f"Rendering {json_file} to {image_file}")
 
         # Read WaveJSON
-        with open(json_path, encoding="utf-8") as f:
-            wavejson = json.load(f)
+        wavejson = self._read_wavejson(json_path)
+
+        return self.render_wavejson_to_image(wavejson, image_file)
+
+    def render_wavejson_to_image(self, wavejson: dict[str, Any], image_file: str) -> int:
+        """Render already loaded WaveJSON data to image.
+
+        Args:
+            wavejson: WaveJSON data structure.
+            image_file: Path to output image file.
+
+        Returns:
+            Exit code (0 for success).
+        """
+        image_path = Path(image_file)
 
         # Parse and render the waveform
         self._render_waveform_to_image(wavejson, image_path)
@@ -71,8 +177,7 @@ class WaveRenderer:
         logger.info(f"Generating HTML from {json_file} to {html_file}")
 
         # Read WaveJSON
-        with open(json_path, encoding="utf-8") as f:
-            wavejson = json.load(f)
+        wavejson = self._read_wavejson(json_path)
 
         # Generate simple HTML with JSON data (for debugging/inspection)
         html_content = self._generate_html(wavejson)
@@ -96,6 +201,8 @@ class WaveRenderer:
             logger.warning("No signals found in WaveJSON")
             return
 
+        plt = _pyplot()
+
         # Create subplots - one for each signal
         fig, axes = plt.subplots(
             len(signals),
@@ -120,7 +227,7 @@ class WaveRenderer:
         # Save the plot
         plt.tight_layout()
         image_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(image_path, dpi=150, bbox_inches="tight")
+        fig.savefig(image_path, dpi=self.dpi, bbox_inches="tight")
         plt.close(fig)
 
     def _parse_wavejson(self, wavejson: dict[str, Any]) -> tuple[list[dict[str, Any]], int]:
@@ -223,7 +330,7 @@ class WaveRenderer:
         return values
 
     def _plot_single_signal_subplot(
-        self, ax: plt.Axes, signal: dict[str, Any], time_steps: int, is_bottom: bool
+        self, ax: "Axes", signal: dict[str, Any], time_steps: int, is_bottom: bool
     ) -> None:
         """Plot a single signal in its own subplot with professional digital styling.
 
@@ -278,37 +385,19 @@ class WaveRenderer:
         """
         # Use name-based detection for signal type classification
         name = signal["name"].lower()
-
-        # Input signals (blue)
-        if any(
-            keyword in name for keyword in ["input", "in", "din", "data_in", "valid_in", "ready_in"]
-        ):
-            return "#1f77b4"  # Blue
-
-        # Output signals (green)
-        elif any(
-            keyword in name
-            for keyword in ["output", "out", "dout", "data_out", "valid_out", "ready_out"]
-        ):
-            return "#2ca02c"  # Green
-
-        # Clock signals (purple)
-        elif any(keyword in name for keyword in ["clock", "clk", "ck"]):
-            return "#9467bd"  # Purple
-
-        # Reset signals (orange)
-        elif any(keyword in name for keyword in ["reset", "rst", "clear", "clr"]):
-            return "#ff7f0e"  # Orange
+        for keywords, color in _SIGNAL_COLOR_RULES:
+            if any(keyword in name for keyword in keywords):
+                return color
 
         # Default for internal/unknown signals (purple)
-        else:
-            return "#9467bd"  # Purple
+        return "#9467bd"
 
-    def _plot_signal_data(
-        self, ax: plt.Axes, values: list[str], time_steps: int, color: str
-    ) -> None:
+    def _plot_signal_data(self, ax: "Axes", values: list[str], time_steps: int, color: str) -> None:
         """Plot signal data in the given axes with sharp digital transitions.
 
+        Segments are collected per drawing style and each style is drawn with
+        a single plot call, instead of one Line2D per time step.
+
         Args:
             ax: Matplotlib axes to plot on.
             values: Signal values to plot.
@@ -318,110 +407,89 @@ class WaveRenderer:
         if not values:
             return
 
-        # Process the entire signal including special states
-        for t in range(len(values)):
-            val = values[t]
+        # Segments of each style as ((x0, x1), (y0, y1))
+        solid: list[_Segment] = []
+        unknown: list[_Segment] = []
+        floating: list[_Segment] = []
 
+        # Process the entire signal including special states
+        for t, val in enumerate(values):
             if val == "p":
-                # Clock pulse: plot triangular pulse
-                self._plot_clock_pulse(ax, t, color)
+                # Clock pulse: triangular pulse
+                solid.extend(self._clock_pulse_segments(t))
             elif val in ["0", "1"]:
-                # Regular digital signal - plot as horizontal line with sharp edges
+                # Regular digital signal - horizontal line with sharp edges
                 numeric_val = 1 if val == "1" else 0
-                ax.plot(
-                    [t, t + 1],
-                    [numeric_val, numeric_val],
-                    color=color,
-                    linewidth=3.0,
-                    solid_capstyle="butt",
-                    solid_joinstyle="miter",
-                )
+                solid.append(((t, t + 1), (numeric_val, numeric_val)))
             elif val == "x":
-                # Unknown state - draw with red X marks
-                ax.plot(
-                    [t, t + 1],
-                    [0.5, 0.5],
-                    color="red",
-                    marker="x",
-                    markersize=8,
-                    linewidth=2,
-                    alpha=0.9,
-                    linestyle="-",
-                )
+                # Unknown state - red X marks
+                unknown.append(((t, t + 1), (0.5, 0.5)))
             elif val == "z":
-                # High-Z state - draw with gray diamonds at the middle (floating)
-                ax.plot(
-                    [t, t + 1],
-                    [0.5, 0.5],
-                    color="gray",
-                    marker="D",
-                    markersize=6,
-                    linewidth=2,
-                    alpha=0.8,
-                    linestyle="-",
-                )
+                # High-Z state - gray diamonds at the middle (floating)
+                floating.append(((t, t + 1), (0.5, 0.5)))
             else:
                 # Handle other values (like data values from multi-bit signals)
                 try:
                     other_numeric_val: float = float(val) if val.replace(".", "").isdigit() else 0.5
-                    ax.plot(
-                        [t, t + 1],
-                        [other_numeric_val, other_numeric_val],
-                        color=color,
-                        linewidth=3.0,
-                        solid_capstyle="butt",
-                        solid_joinstyle="miter",
-                    )
                 except (ValueError, AttributeError):
                     # Fallback for unknown characters
-                    ax.plot(
-                        [t, t + 1],
-                        [0.5, 0.5],
-                        color="red",
-                        marker="x",
-                        markersize=8,
-                        linewidth=2,
-                        alpha=0.9,
-                        linestyle="-",
-                    )
-
-    def _plot_clock_pulse(self, ax: plt.Axes, t: int, color: str) -> None:
-        """Plot a clock pulse (triangular wave) at time t.
+                    unknown.append(((t, t + 1), (0.5, 0.5)))
+                    continue
+                solid.append(((t, t + 1), (other_numeric_val, other_numeric_val)))
 
-        Args:
-            ax: Matplotlib axes to plot on.
-            t: Time step where the clock pulse occurs.
-            color: Color to use for the clock pulse.
-        """
-        # Clock pulse: low->high->low with sharp transitions
-        # Low segment (if not at start)
-        if t > 0:
+        rasterized = time_steps > _RASTERIZE_STEPS
+
+        if solid:
             ax.plot(
-                [t, t + 0.5],
-                [0, 0],
+                *_joined_segments(solid),
                 color=color,
                 linewidth=3.0,
                 solid_capstyle="butt",
                 solid_joinstyle="miter",
+                rasterized=rasterized,
             )
+        if unknown:
+            ax.plot(
+                *_joined_segments(unknown),
+                color="red",
+                marker="x",
+                markersize=8,
+                linewidth=2,
+                alpha=0.9,
+                linestyle="-",
+                rasterized=rasterized,
+            )
+        if floating:
+            ax.plot(
+                *_joined_segments(floating),
+                color="gray",
+                marker="D",
+                markersize=6,
+                linewidth=2,
+                alpha=0.8,
+                linestyle="-",
+                rasterized=rasterized,
+            )
+
+    def _clock_pulse_segments(self, t: int) -> list[_Segment]:
+        """Get the segments of a clock pulse (triangular wave) at time t.
+
+        Args:
+            t: Time step where the clock pulse occurs.
+
+        Returns:
+            Segments of the pulse as ((x0, x1), (y0, y1)).
+        """
+        # Clock pulse: low->high->low with sharp transitions
+        segments: list[_Segment] = []
+        # Low segment (if not at start)
+        if t > 0:
+            segments.append(((t, t + 0.5), (0, 0)))
         # Rising edge (vertical)
-        ax.plot(
-            [t + 0.5, t + 0.5],
-            [0, 1],
-            color=color,
-            linewidth=3.0,
-            solid_capstyle="butt",
-            solid_joinstyle="miter",
-        )
+        segments.append(((t + 0.5, t + 0.5), (0, 1)))
         # High segment
-        ax.plot(
-            [t + 0.5, t + 1],
-            [1, 1],
-            color=color,
-            linewidth=3.0,
-            solid_capstyle="butt",
-            solid_joinstyle="miter",
-        )
+        segments.append(((t + 0.5, t + 1), (1, 1)))
+        return segments
 
     def _generate_html(self, wavejson: dict[str, Any]) -> str:
         """Generate simple HTML page displaying the WaveJSON data.
@@ -432,7 +500,10 @@ class WaveRenderer:
         Returns:
             HTML content as string.
         """
-        json_str = json.dumps(wavejson, indent=2)
+        if orjson is not None:
+            json_str = orjson.dumps(wavejson, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            json_str = json.dumps(wavejson, indent=2)
 
         html = f"""<!DOCTYPE html>
 <html lang="en">
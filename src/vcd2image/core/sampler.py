@@ -39,37 +39,38 @@ class SignalSampler:
 
         # Initialize value and sample dictionaries
         # Note: dict.fromkeys() with mutable defaults shares the same object, so create individually
-        value_dict = dict.fromkeys([clock_sid] + signal_sids, "x")
-        sample_dict: dict[str, list[str]] = {sid: [] for sid in [clock_sid] + signal_sids}
+        value_dict = dict.fromkeys((clock_sid, *signal_sids), "x")
+        sids = tuple(value_dict)  # de-duplicated, so a clock listed in signal_sids is kept once
+        sample_dict: dict[str, list[str]] = {sid: [] for sid in sids}
 
         logger.debug(f"Sampling signals with clock_sid={clock_sid}, signal_sids={signal_sids}")
         data_count = 0
 
-        while True:
-            if self.end_time != 0 and self.end_time < int(self.now):
-                break
+        # Hoist attribute lookups out of the per-line loop
+        start_time = self.start_time
+        end_time = self.end_time
+        wave_chunk = self.wave_chunk
+        now = self.now
+
+        # The first group grows by append. Once a dump has filled it, it is known to be
+        # at least wave_chunk samples long, so later groups are preallocated to full
+        # size and filled by index. wave_chunk < 1 keeps one unbounded, appended group.
+        preallocated = False
 
-            line = fin.readline()
-            if not line:
+        for line in fin:
+            if end_time and end_time < now:
                 break
 
             words = line.split()
             if not words:
                 continue
 
-            char = words[0][0]
-
-            # Skip comment lines
-            if char == "$":
-                continue
-
-            # Skip real number lines
-            if char == "r":
-                continue
+            token = words[0]
+            char = token[0]
 
             # Handle scalar values
-            if char in ("0", "1", "x", "z"):
-                sid = words[0][1:]
+            if char in "01xz":
+                sid = token[1:]
                 if sid in value_dict:
                     value_dict[sid] = char
                 continue
@@ -78,42 +79,42 @@ class SignalSampler:
             if char == "b":
                 sid = words[1]
                 if sid in value_dict:
-                    value_dict[sid] = words[0][1:]
+                    value_dict[sid] = token[1:]
+                continue
+
+            # Skip comment lines and real number lines
+            if char == "$" or char == "r":
                 continue
 
             # Handle timestamp changes
             if char == "#":
-                next_now = words[0][1:]
-                self.now = int(next_now)
-
-                # Sample at regular time intervals instead of just clock edges
-                # This gives a more complete view of signal behavior
-                if self.start_time <= self.now and (
-                    self.end_time == 0 or self.now <= self.end_time
-                ):
-                    # Check if we should sample at this time point
-                    # Sample every time unit for now (could be made configurable)
-                    should_sample = True  # Sample at every timestamp for complete waveform
-
-                    if should_sample:
-                        # Sample all signals at this time point
-                        for sid in sample_dict:
-                            sample_dict[sid].append(value_dict[sid])
-                        data_count += 1
-
-                        # Check if we have enough samples for this group
-                        if data_count == self.wave_chunk:
-                            sample_groups.append({sid: sample_dict[sid][:] for sid in sample_dict})
-                            # Reset for next group
-                            for sid in sample_dict:
-                                sample_dict[sid].clear()
-                            data_count = 0
+                self.now = now = int(token[1:])
+
+                # Sample at every timestamp for a complete view of signal behavior
+                if start_time <= now and (end_time == 0 or now <= end_time):
+                    if preallocated:
+                        for sid, samples in sample_dict.items():
+                            samples[data_count] = value_dict[sid]
+                    else:
+                        for sid, samples in sample_dict.items():
+                            samples.append(value_dict[sid])
+                    data_count += 1
+
+                    # Check if we have enough samples for this group
+                    if data_count == wave_chunk:
+                        # Hand the filled lists over and start the next group with fresh ones
+                        sample_groups.append(sample_dict)
+                        sample_dict = {sid: [""] * wave_chunk for sid in sids}
+                        preallocated = True
+                        data_count = 0
                 continue
 
             raise ValueError(f"Unexpected character in VCD file: '{char}'")
 
         # Save any remaining incomplete group
-        if any(sample_dict[sid] for sid in sample_dict):
-            sample_groups.append({sid: sample_dict[sid][:] for sid in sample_dict})
+        if data_count:
+            if preallocated:
+                sample_dict = {sid: samples[:data_count] for sid, samples in sample_dict.items()}
+            sample_groups.append(sample_dict)
 
         return sample_groups
@@ -4,13 +4,20 @@ This module provides advanced signal plotting capabilities with golden reference
 categorization, and comprehensive analysis for digital circuit simulation results.
 """
 
+import csv
+import io
+import logging
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 if TYPE_CHECKING:
     import matplotlib.axes
@@ -21,25 +28,65 @@ from .models import SignalDef
 from .parser import VCDParser
 from .verilog_parser import VerilogParser
 
+# Figures of more signals than this are split into numbered parts
+MAX_SIGNALS_PER_PLOT = 10
+
+
+def plot_filenames(filename: str, signal_count: int) -> list[str]:
+    """Get the file names an enhanced figure of signal_count signals is saved as.
+
+    Args:
+        filename: Output filename of the whole figure
+        signal_count: Number of signals in the figure
+
+    Returns:
+        The filename itself, or one numbered part filename per
+        MAX_SIGNALS_PER_PLOT signals.
+    """
+    if signal_count <= MAX_SIGNALS_PER_PLOT:
+        return [filename]
+    parts = -(-signal_count // MAX_SIGNALS_PER_PLOT)
+    return [filename.replace(".png", f"_part{part}.png") for part in range(1, parts + 1)]
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow with its CSV module, or return None if it is not installed.
+
+    pyarrow is optional and slow to import, so it is only loaded once
+    signal data is actually written or read.
+    """
+    try:
+        import pyarrow.csv
+    except ImportError:  # Optional: falls back to pandas' own CSV code
+        return None
+    return pyarrow
+
+
+logger = logging.getLogger(__name__)
+
 
 # Simple logger class for enhanced plotting
 class Logger:
-    """Simple logger for enhanced plotting functionality."""
+    """Simple logger for enhanced plotting functionality.
+
+    Messages go through the logging module, whose handlers serialize
+    records, so figures drawn on several threads never interleave lines.
+    """
 
     def __init__(self, name: str = "SignalPlotter"):
         self.name = name
 
     def info(self, message: str) -> None:
-        print(f"[INFO] {self.name}: {message}")
+        logger.info(f"{self.name}: {message}")
 
     def success(self, message: str) -> None:
-        print(f"[SUCCESS] {self.name}: {message}")
+        logger.info(f"{self.name}: {message}")
 
     def warning(self, message: str) -> None:
-        print(f"[WARNING] {self.name}: {message}")
+        logger.warning(f"{self.name}: {message}")
 
     def error(self, message: str) -> None:
-        print(f"[ERROR] {self.name}: {message}")
+        logger.error(f"{self.name}: {message}")
 
 
 @dataclass
@@ -55,6 +102,25 @@ class SignalCategory:
 class SignalPlotter:
     """Generates enhanced plots directly from VCD files with golden reference categorization."""
 
+    # Substrings of lower-cased names that mark clocks and resets. Longer names
+    # such as sys_clk, pclk, reset_n or initialize contain one of these, and
+    # the alternations are factored so each position is tried once
+    clock_name_re = re.compile(r"c(?:lk|lock)|[smph]ck")
+    reset_name_re = re.compile(r"r(?:st|eset)|cl(?:ear|r)|init")
+
+    # Substrings of lower-cased names for the heuristic data categories, tried in
+    # this order. Names that contain a listed one are left out: select, request,
+    # next_state and counter; ready_out and valid_out already match as inputs
+    input_name_re = re.compile(r"enable|load|data_in|addr|sel|valid|ready|start|din|input|req")
+    output_name_re = re.compile(
+        r"data_out|result|sum|diff|prod|quot|dout|output|ack|done|status|cout"
+        r"|overflow|underflow|zero|carry"
+    )
+    internal_name_re = re.compile(
+        r"temp|wire|reg|internal|int_|state|count|fsm|control|flag|mem|storage"
+        r"|buffer|fifo|queue|stack"
+    )
+
     def __init__(self, vcd_file: str, verilog_file: str | None = None, output_dir: str = "plots"):
         """
         Initialize the SignalPlotter.
@@ -78,15 +144,20 @@ class SignalPlotter:
         self.categories: SignalCategory | None = None
         self.vcd_parser: VCDParser | None = None
         self.parser: VerilogParser | None = None
+        self.signal_dict: dict[str, SignalDef] | None = None
+        self.valid_signal_paths: list[str] | None = None
 
         # Set up matplotlib style
         plt.style.use("default")
         sns.set_palette("husl")
 
-    def load_data(self) -> bool:
+    def load_data(self, signal_dict: dict[str, SignalDef] | None = None) -> bool:
         """
         Load and parse VCD data directly, extracting actual waveform data for plotting.
 
+        Args:
+            signal_dict: Signal definitions already parsed from the VCD file (optional)
+
         Returns:
             True if data loaded successfully, False otherwise
         """
@@ -96,11 +167,14 @@ class SignalPlotter:
 
             # Parse VCD file to get signal data
             self.vcd_parser = VCDParser(str(self.vcd_file))
-            all_signals = self.vcd_parser.parse_signals()
+            all_signals = (
+                signal_dict if signal_dict is not None else self.vcd_parser.parse_signals()
+            )
 
             if not all_signals:
                 self.logger.error("No signals found in VCD file")
                 return False
+            self.signal_dict = all_signals
 
             # Extract actual waveform data from VCD instead of synthetic data
             self._extract_actual_waveform_data(all_signals)
@@ -112,12 +186,32 @@ class SignalPlotter:
             self.logger.error(f"Error loading VCD file: {e}")
             return False
 
+    def adopt_data(
+        self,
+        signal_dict: dict[str, SignalDef],
+        data: pd.DataFrame,
+        valid_signal_paths: list[str] | None,
+    ) -> None:
+        """
+        Take over waveform data another plotter loaded from the same VCD file.
+
+        Sets the same state as load_data() without sampling the file again,
+        and saves the data CSV in this plotter's plots directory.
+
+        Args:
+            signal_dict: Signal definitions parsed from the VCD file
+            data: Waveform DataFrame to share; it is not copied
+            valid_signal_paths: Signal paths left after duplicate SID filtering
+        """
+        self.vcd_parser = VCDParser(str(self.vcd_file))
+        self.signal_dict = signal_dict
+        self.valid_signal_paths = valid_signal_paths
+        self.data = data
+        self._save_data_csv()
+        self.logger.info(f"Loaded actual VCD data with {len(signal_dict)} signals")
+
     def _extract_actual_waveform_data(self, signal_dict: dict[str, "SignalDef"]) -> None:
         """Extract actual waveform data from JSON files and create DataFrame for plotting."""
-        import json
-        import os
-        import tempfile
-
         # Filter out signals with duplicate SIDs to avoid conflicts
         sid_to_paths: dict[str, list[str]] = {}
         for path, signal_def in signal_dict.items():
@@ -137,78 +231,93 @@ class SignalPlotter:
                 valid_signal_paths.append(best_path)
                 other_paths = [p for p in paths if p != best_path]
                 self.logger.info(f"Using {best_path} (preferred over: {other_paths})")
+        self.valid_signal_paths = valid_signal_paths
 
         if not valid_signal_paths:
             self.logger.warning("No valid signals found, falling back to synthetic data")
             self._create_synthetic_dataframe(list(signal_dict.keys()))
             return
 
-        # Create temporary JSON file using WaveExtractor
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_json:
-            temp_json_path = temp_json.name
-
-        try:
-            # Ensure we have a clock signal for WaveExtractor (it expects first signal to be clock)
-            categorizer = SignalCategorizer()
-            category = categorizer.categorize_signals(signal_dict)
-            clock_signal = categorizer.suggest_clock_signal(category)
-
-            # If suggested clock is filtered out, use the top-level clock
-            if (
-                clock_signal is not None
-                and clock_signal not in valid_signal_paths
-                and "clock" in clock_signal
-            ):
-                # Find available clock signal
-                available_clocks = [s for s in valid_signal_paths if "clock" in s]
-                if available_clocks:
-                    clock_signal = available_clocks[0]
-
-            # Put clock signal first for WaveExtractor
-            signal_paths = valid_signal_paths[:]
-            if clock_signal in signal_paths:
-                signal_paths.remove(clock_signal)
-                signal_paths.insert(0, clock_signal)
-
-            # Use WaveExtractor to generate JSON for valid signals
-            from .extractor import WaveExtractor
-
-            extractor = WaveExtractor(str(self.vcd_file), temp_json_path, signal_paths)
-            extractor.start_time = 0
-            extractor.end_time = 0  # Extract full range
-
-            result = extractor.execute()
-            if result != 0:
-                self.logger.warning(
-                    f"WaveExtractor failed with code {result}, falling back to synthetic data"
-                )
-                self._create_synthetic_dataframe(list(signal_dict.keys()))
-                return
+        # Ensure we have a clock signal for WaveExtractor (it expects first signal to be clock)
+        categorizer = SignalCategorizer()
+        category = categorizer.categorize_signals(signal_dict)
+        clock_signal = categorizer.suggest_clock_signal(category)
+
+        # If suggested clock is filtered out, use the top-level clock
+        if (
+            clock_signal is not None
+            and clock_signal not in valid_signal_paths
+            and "clock" in clock_signal
+        ):
+            # Find available clock signal
+            available_clocks = [s for s in valid_signal_paths if "clock" in s]
+            if available_clocks:
+                clock_signal = available_clocks[0]
+
+        # Put clock signal first for WaveExtractor
+        signal_paths = valid_signal_paths[:]
+        if clock_signal in signal_paths:
+            signal_paths.remove(clock_signal)
+            signal_paths.insert(0, clock_signal)
+
+        # Use WaveExtractor to build the WaveJSON in memory, skipping the
+        # encode to a temporary file and decode back
+        from .extractor import WaveExtractor
 
-            # Parse the JSON data
-            with open(temp_json_path, encoding="utf-8") as f:
-                wavejson = json.load(f)
+        extractor = WaveExtractor(
+            str(self.vcd_file),
+            "",
+            signal_paths,
+            {path: signal_dict[path] for path in signal_paths},
+        )
+        extractor.start_time = 0
+        extractor.end_time = 0  # Extract full range
 
-            # Convert WaveJSON to DataFrame format for plotting
-            self._wavejson_to_dataframe(wavejson, valid_signal_paths)
+        wavejson = extractor.extract_wavejson()
+        if wavejson is None:
+            self.logger.warning("WaveExtractor found no samples, falling back to synthetic data")
+            self._create_synthetic_dataframe(list(signal_dict.keys()))
+            return
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_json_path):
-                os.unlink(temp_json_path)
+        # Convert WaveJSON to DataFrame format for plotting
+        self._wavejson_to_dataframe(wavejson, valid_signal_paths)
 
     def _wavejson_to_dataframe(self, wavejson: dict, signal_paths: list[str]) -> None:
         """Convert WaveJSON data to pandas DataFrame format."""
-        import pandas as pd
+        parsed = self._parse_wavejson(wavejson, signal_paths)
+        if parsed is None:
+            self.logger.warning("Invalid WaveJSON structure")
+            self._create_synthetic_dataframe(signal_paths)
+            return
+        signal_data, max_length = parsed
 
+        # If no signals were found, fall back to synthetic data
+        if max_length == 0:
+            self.logger.warning("No signals parsed from WaveJSON, falling back to synthetic data")
+            self._create_synthetic_dataframe(signal_paths)
+            return
+
+        # Create DataFrame
+        self.data = self._padded_signal_frame(signal_data, signal_paths, max_length)
+
+        # Save CSV file for debugging and replotting
+        self._save_data_csv()
+
+    def _parse_wavejson(
+        self, wavejson: dict, signal_paths: list[str]
+    ) -> tuple[dict[str, list[Any]], int] | None:
+        """Decode the WaveJSON signals that match the given paths by name.
+
+        Returns:
+            Decoded values per signal path and the longest signal's length,
+            or None if the WaveJSON structure is invalid
+        """
         # Parse WaveJSON structure
         signals = wavejson.get("signal", [])
         if len(signals) < 3:
-            self.logger.warning("Invalid WaveJSON structure")
-            self._create_synthetic_dataframe(signal_paths)
-            return
+            return None
 
-        signal_data: dict[str, list[Any]] = {"test_case": []}
+        signal_data: dict[str, list[Any]] = {}
 
         # Create mapping from signal names to their data
         signal_map = {}
@@ -242,38 +351,75 @@ class SignalPlotter:
                 signal_data[signal_path] = values
                 max_length = max(max_length, len(values))
 
-        # If no signals were found, fall back to synthetic data
-        if max_length == 0 or len(signal_data) <= 1:
-            self.logger.warning("No signals parsed from WaveJSON, falling back to synthetic data")
-            self._create_synthetic_dataframe(signal_paths)
-            return
-
-        # Ensure all expected signals have data
-        for signal_path in signal_paths:
-            if signal_path not in signal_data:
-                # Signal not found in JSON, fill with zeros
-                signal_data[signal_path] = [0] * max_length
-            elif len(signal_data[signal_path]) < max_length:
-                # Pad shorter signals
-                last_val = signal_data[signal_path][-1] if signal_data[signal_path] else 0
-                signal_data[signal_path].extend(
-                    [last_val] * (max_length - len(signal_data[signal_path]))
-                )
-
-        # Add test case numbers
-        signal_data["test_case"] = list(range(max_length))
+        return signal_data, max_length
 
-        # Create DataFrame
-        self.data = pd.DataFrame(signal_data)
-
-        # Save CSV file for debugging and replotting
+    def _save_data_csv(self) -> None:
+        """Save the loaded signal data as CSV in the plots directory."""
+        if self.data is None:
+            return
         csv_file = self.plots_dir / "signal_data.csv"
-        self.data.to_csv(csv_file, index=False)
+        pyarrow = _import_pyarrow() if self._integer_columns_only(self.data) else None
+        if pyarrow is not None:
+            # Arrow's C++ writer formats integers as pandas does but quotes every
+            # header name, so the header row comes from the csv module instead
+            header = io.StringIO()
+            csv.writer(header, lineterminator="\n").writerow(self.data.columns)
+            table = pyarrow.Table.from_pandas(self.data, preserve_index=False)
+            with open(csv_file, "wb") as fout:
+                fout.write(header.getvalue().encode("utf-8"))
+                pyarrow.csv.write_csv(table, fout, pyarrow.csv.WriteOptions(include_header=False))
+        else:
+            self.data.to_csv(csv_file, index=False)
         self.logger.info(f"Saved signal data to CSV: {csv_file}")
 
+    def _read_data_csv(self, csv_path: Path) -> pd.DataFrame:
+        """Read a signal data CSV with pyarrow's reader when it is installed."""
+        if _import_pyarrow() is not None:
+            data = pd.read_csv(csv_path, engine="pyarrow")
+            if not self._has_wide_integer_column(data):
+                return data
+        # The default parser keeps integers wider than 64 bits exact as Python ints
+        return pd.read_csv(csv_path)
+
+    @staticmethod
+    def _has_wide_integer_column(data: pd.DataFrame) -> bool:
+        """Check whether Arrow read an integer column too wide for int64 as floats.
+
+        Such a column holds only integral values, at least one of them
+        outside the int64 range.
+        """
+        for _, column in data.items():
+            if not pd.api.types.is_float_dtype(column.dtype):
+                continue
+            values = column.dropna().to_numpy()
+            if len(values) and np.all(np.mod(values, 1) == 0) and np.any(np.abs(values) >= 2.0**63):
+                return True
+        return False
+
+    @staticmethod
+    def _integer_columns_only(data: pd.DataFrame) -> bool:
+        """Check whether every column of a DataFrame has an integer dtype."""
+        return all(pd.api.types.is_integer_dtype(dtype) for dtype in data.dtypes)
+
+    def _padded_signal_frame(
+        self, signal_data: dict[str, list[Any]], signal_paths: list[str], length: int
+    ) -> pd.DataFrame:
+        """Build the test_case-numbered DataFrame of decoded signals.
+
+        Signals shorter than ``length`` are padded with their last value, and
+        expected signals missing from ``signal_data`` are filled with zeros.
+        """
+        columns: dict[str, np.ndarray] = {"test_case": np.arange(length)}
+        for path in (*signal_data, *signal_paths):
+            if path not in columns:
+                values = np.asarray(signal_data.get(path) or [0])
+                columns[path] = np.pad(values, (0, length - len(values)), mode="edge")
+
+        # Equal-dtype columns are consolidated into one 2D block
+        return pd.DataFrame(columns)
+
     def _decode_wavejson_wave(self, wave_str: str, data_str: str | None = None) -> list[int]:
         """Decode WaveJSON wave string to list of integer values."""
-        values = []
         data_values = []
 
         # Parse data string if present (for multi-bit signals)
@@ -292,117 +438,43 @@ class SignalPlotter:
                 # Fallback to space-separated format
                 data_values = [int(x.strip()) for x in data_str.split() if x.strip()]
 
-        i = 0
-        data_idx = 0
-
-        while i < len(wave_str):
-            char = wave_str[i]
-
-            if char in ("0", "1"):
-                # Binary value
-                values.append(int(char))
-            elif char == "x":
-                # Unknown - treat as 0
-                values.append(0)
-            elif char == "z":
-                # High impedance - treat as 0
-                values.append(0)
-            elif char == "=":
-                # Multi-bit data follows
-                if data_idx < len(data_values):
-                    values.append(data_values[data_idx])
-                    data_idx += 1
-                else:
-                    values.append(0)
-            elif char == ".":
-                # Repeat previous value
-                if values:
-                    values.append(values[-1])
-                else:
-                    values.append(0)
-            elif char == "|":
-                # Cycle separator - skip
-                pass
-            else:
-                # Unknown character - treat as 0
-                values.append(0)
+        # One code point per wave character; "|" is a cycle separator and is skipped
+        chars = np.frombuffer(wave_str.encode("utf-32-le"), dtype=np.uint32)
+        chars = chars[chars != ord("|")]
+
+        # Index into [0, 1, *data_values] for each sample; x, z and unknown chars map to 0
+        codes = (chars == ord("1")).astype(np.intp)
+        is_data = chars == ord("=")
+        data_count = np.cumsum(is_data)[is_data]
+        codes[is_data] = np.where(data_count <= len(data_values), data_count + 1, 0)
 
-            i += 1
+        # "." repeats the previous sample: forward-fill the last non-repeat position
+        positions = np.where(chars != ord("."), np.arange(len(chars)), -1)
+        np.maximum.accumulate(positions, out=positions)
+        codes = np.where(positions >= 0, codes[positions], 0)
 
-        return values
+        # Gathering from a Python-int table keeps buses wider than 64 bits exact
+        table = np.array([0, 1, *data_values], dtype=object)
+        return table[codes].tolist()
 
     def _json_to_dataframe(self, wavejson: dict, signal_paths: list[str]) -> pd.DataFrame | None:
         """Convert category WaveJSON to DataFrame for CSV export."""
-        import pandas as pd
-
-        # Parse WaveJSON structure
-        signals = wavejson.get("signal", [])
-        if len(signals) < 3:
-            return None
-
-        signal_data: dict[str, list[Any]] = {"test_case": []}
-
-        # Create mapping from signal names to their data
-        signal_map = {}
-
-        # First signal might be separate (clock)
-        if isinstance(signals[0], dict) and "name" in signals[0]:
-            signal_map[signals[0]["name"]] = signals[0]
-
-        # Signals in the array at index 2
-        if len(signals) > 2 and isinstance(signals[2], list) and len(signals[2]) > 1:
-            for entry in signals[2]:
-                if isinstance(entry, dict) and "name" in entry:
-                    signal_map[entry["name"]] = entry
-
-        # Create mapping from JSON signal names back to full paths
-        name_to_path = {}
-        for path in signal_paths:
-            name = path.split("/")[-1]  # Get last part of path
-            name_to_path[name] = path
-
-        # Process each signal found in JSON
-        max_length = 0
-        for json_name, entry in signal_map.items():
-            if json_name in name_to_path:
-                signal_path = name_to_path[json_name]
-                wave_str = entry.get("wave", "")
-                data_str = entry.get("data")
-
-                # Decode WaveJSON wave string to time series
-                values = self._decode_wavejson_wave(wave_str, data_str)
-                signal_data[signal_path] = values
-                max_length = max(max_length, len(values))
-
-        if max_length == 0:
+        parsed = self._parse_wavejson(wavejson, signal_paths)
+        if parsed is None or parsed[1] == 0:
             return None
+        signal_data, max_length = parsed
 
-        # Ensure all expected signals have data
-        for signal_path in signal_paths:
-            if signal_path not in signal_data:
-                signal_data[signal_path] = [0] * max_length
-            elif len(signal_data[signal_path]) < max_length:
-                last_val = signal_data[signal_path][-1] if signal_data[signal_path] else 0
-                signal_data[signal_path].extend(
-                    [last_val] * (max_length - len(signal_data[signal_path]))
-                )
-
-        # Add test case numbers
-        signal_data["test_case"] = list(range(max_length))
-
-        return pd.DataFrame(signal_data)
+        return self._padded_signal_frame(signal_data, signal_paths, max_length)
 
     def load_from_csv(self, csv_file: str) -> bool:
         """Load signal data from CSV file for replotting."""
-        import pandas as pd
-
         try:
             csv_path = Path(csv_file)
             if not csv_path.exists():
                 self.logger.error(f"CSV file not found: {csv_file}")
                 return False
 
-            self.data = pd.read_csv(csv_path)
+            self.data = self._read_data_csv(csv_path)
             self.logger.info(f"Loaded data from CSV: {csv_file} ({len(self.data)} samples)")
 
             # Validate that we have data and required columns
@@ -456,40 +528,36 @@ class SignalPlotter:
         num_test_cases = 100
 
         # Generate test case numbers
-        test_cases = list(range(num_test_cases))
+        test_cases = np.arange(num_test_cases)
+
+        # Each pattern is computed once as an array and shared by every matching signal
+        phase = test_cases % 20
+        clock = test_cases % 2  # Clock signal: alternating 0s and 1s
+        reset = (test_cases < 10).astype(np.int64)  # Reset signal: 1 for first 10 cycles
+        pulse = (phase < 3).astype(np.int64)  # Pulse signal: every 20 cycles, lasting 3
+        # Counter signal: counts from 0 to 15, reset to 0 while pulse is high
+        counter = np.where(pulse == 1, 0, (phase - 2) % 16)
+        default = test_cases % 4  # Default: random-like pattern
 
         # Generate synthetic signal data for each signal
-        signal_data: dict[str, list[int]] = {"test_case": test_cases}
+        signal_data: dict[str, np.ndarray] = {"test_case": test_cases}
 
         for signal_name in signal_names:
-            if "clock" in signal_name.lower():
-                # Clock signal: alternating 0s and 1s
-                signal_data[signal_name] = [i % 2 for i in range(num_test_cases)]
-            elif "reset" in signal_name.lower():
-                # Reset signal: 1 for first 10 cycles, then 0
-                signal_data[signal_name] = [1 if i < 10 else 0 for i in range(num_test_cases)]
-            elif "pulse" in signal_name.lower():
-                # Pulse signal: periodic pulses every 20 cycles, lasting 3 cycles
-                signal_data[signal_name] = [1 if (i % 20) < 3 else 0 for i in range(num_test_cases)]
-            elif "count" in signal_name.lower() and "eq11" not in signal_name.lower():
-                # Counter signal: counts from 0 to 15, resets when pulse is high
-                count_values = []
-                count = 0
-                for i in range(num_test_cases):
-                    pulse_active = 1 if (i % 20) < 3 else 0
-                    if pulse_active:
-                        count = 0
-                    else:
-                        count = (count + 1) % 16
-                    count_values.append(count)
-                signal_data[signal_name] = count_values
-            elif "count_eq11" in signal_name.lower():
+            signal_lower = signal_name.lower()
+            if "clock" in signal_lower:
+                signal_data[signal_name] = clock
+            elif "reset" in signal_lower:
+                signal_data[signal_name] = reset
+            elif "pulse" in signal_lower:
+                signal_data[signal_name] = pulse
+            elif "count" in signal_lower and "eq11" not in signal_lower:
+                signal_data[signal_name] = counter
+            elif "count_eq11" in signal_lower:
                 # Count equals 11 signal: 1 when count reaches 11
-                count_values = signal_data.get("count", [0] * num_test_cases)
-                signal_data[signal_name] = [1 if val == 11 else 0 for val in count_values]
+                count_values = signal_data.get("count", np.zeros(num_test_cases, dtype=np.int64))
+                signal_data[signal_name] = (count_values == 11).astype(np.int64)
             else:
-                # Default: random-like pattern
-                signal_data[signal_name] = [i % 4 for i in range(num_test_cases)]
+                signal_data[signal_name] = default
 
         self.data = pd.DataFrame(signal_data)
 
@@ -507,29 +575,30 @@ class SignalPlotter:
         all_signals = list(self.data.columns)
         all_signals.remove("test_case")  # Remove test_case as it's not a signal
 
-        # Import the parser to use its results
-        from .parser import VCDParser
-
-        # Use the categorizer for accurate signal classification
-        # Use the same signal filtering as in load_data
-        parser = VCDParser(str(self.vcd_file))
-        full_signal_dict = parser.parse_signals()
-
-        # Apply the same filtering as in _extract_actual_waveform_data
-        sid_to_paths: dict[str, list[str]] = {}
-        for path, signal_def in full_signal_dict.items():
-            sid = signal_def.sid
-            if sid not in sid_to_paths:
-                sid_to_paths[sid] = []
-            sid_to_paths[sid].append(path)
+        # Reuse the signals load_data() parsed; only CSV-loaded data needs a parse here
+        full_signal_dict = self.signal_dict
+        if full_signal_dict is None:
+            from .parser import VCDParser
 
-        filtered_paths = []
-        for _sid, paths in sid_to_paths.items():
-            if len(paths) == 1:
-                filtered_paths.append(paths[0])
-            else:
-                best_path = min(paths, key=lambda p: p.count("/"))
-                filtered_paths.append(best_path)
+            full_signal_dict = VCDParser(str(self.vcd_file)).parse_signals()
+
+        filtered_paths = self.valid_signal_paths
+        if filtered_paths is None:
+            # Apply the same filtering as in _extract_actual_waveform_data
+            sid_to_paths: dict[str, list[str]] = {}
+            for path, signal_def in full_signal_dict.items():
+                sid = signal_def.sid
+                if sid not in sid_to_paths:
+                    sid_to_paths[sid] = []
+                sid_to_paths[sid].append(path)
+
+            filtered_paths = []
+            for _sid, paths in sid_to_paths.items():
+                if len(paths) == 1:
+                    filtered_paths.append(paths[0])
+                else:
+                    best_path = min(paths, key=lambda p: p.count("/"))
+                    filtered_paths.append(best_path)
 
         signal_dict = {path: full_signal_dict[path] for path in filtered_paths}
 
@@ -570,14 +639,15 @@ class SignalPlotter:
 
             # Check each signal from CSV against parsed signals
             for signal in all_signals:
+                # Lower-cased once for the name patterns and prefix checks below
                 signal_lower = signal.lower()
 
                 # STRICTLY prioritize module port information over keyword heuristics
                 if signal in parser.inputs:
                     # Check if it's a clock or reset signal that's also an input
-                    if self._is_clock_signal(signal):
+                    if self.clock_name_re.search(signal_lower):
                         clocks.append(signal)
-                    elif self._is_reset_signal(signal):
+                    elif self.reset_name_re.search(signal_lower):
                         resets.append(signal)
                     else:
                         data_inputs.append(signal)
@@ -588,9 +658,9 @@ class SignalPlotter:
                     internal.append(signal)
                 else:
                     # Signal not found in Verilog module ports, use heuristic classification
-                    if self._is_clock_signal(signal):
+                    if self.clock_name_re.search(signal_lower):
                         clocks.append(signal)
-                    elif self._is_reset_signal(signal):
+                    elif self.reset_name_re.search(signal_lower):
                         resets.append(signal)
                     elif signal_lower.startswith(("i_", "in_", "input_")):
                         data_inputs.append(signal)
@@ -622,62 +692,11 @@ class SignalPlotter:
 
     def _is_clock_signal(self, signal_name: str) -> bool:
         """Check if a signal is a clock signal based on naming patterns."""
-        signal_lower = signal_name.lower()
-        clock_patterns = [
-            "clk",
-            "clock",
-            "sys_clk",
-            "system_clock",
-            "bus_clock",
-            "cpu_clock",
-            "core_clock",
-            "ref_clock",
-            "reference_clock",
-            "main_clock",
-            "pixel_clock",
-            "audio_clock",
-            "serial_clock",
-            "sck",
-            "sclk",
-            "mck",
-            "mclk",
-            "pck",
-            "pclk",
-            "hck",
-            "hclk",
-        ]
-        return any(pattern in signal_lower for pattern in clock_patterns)
+        return self.clock_name_re.search(signal_name.lower()) is not None
 
     def _is_reset_signal(self, signal_name: str) -> bool:
         """Check if a signal is a reset signal based on naming patterns."""
-        signal_lower = signal_name.lower()
-        reset_patterns = [
-            "rst",
-            "reset",
-            "rst_n",
-            "reset_n",
-            "rst_b",
-            "reset_b",
-            "sys_rst",
-            "system_reset",
-            "cpu_rst",
-            "core_rst",
-            "clear",
-            "clr",
-            "init",
-            "initialize",
-            "n_rst",
-            "n_reset",
-            "rst_async",
-            "reset_async",
-            "rst_sync",
-            "reset_sync",
-            "arst",
-            "areset",
-            "srst",
-            "sreset",
-        ]
-        return any(pattern in signal_lower for pattern in reset_patterns)
+        return self.reset_name_re.search(signal_name.lower()) is not None
 
     def _categorize_by_heuristic(self, all_signals: list[str]) -> bool:
         """Categorize signals using enhanced heuristic rules."""
@@ -690,78 +709,18 @@ class SignalPlotter:
         for signal in all_signals:
             signal_lower = signal.lower()
 
-            # Enhanced classification using helper methods
-            if self._is_clock_signal(signal):
+            # Enhanced classification with the clock and reset name patterns
+            if self.clock_name_re.search(signal_lower):
                 clocks.append(signal)
-            elif self._is_reset_signal(signal):
+            elif self.reset_name_re.search(signal_lower):
                 resets.append(signal)
             else:
-                # Common input signal patterns (data inputs)
-                input_patterns = [
-                    "enable",
-                    "load",
-                    "data_in",
-                    "addr",
-                    "sel",
-                    "select",
-                    "valid",
-                    "ready",
-                    "start",
-                    "din",
-                    "input",
-                    "req",
-                    "request",
-                ]
-
-                # Common output signal patterns
-                output_patterns = [
-                    "data_out",
-                    "result",
-                    "sum",
-                    "diff",
-                    "prod",
-                    "quot",
-                    "dout",
-                    "output",
-                    "ack",
-                    "done",
-                    "ready_out",
-                    "valid_out",
-                    "status",
-                    "cout",
-                    "overflow",
-                    "underflow",
-                    "zero",
-                    "carry",
-                ]
-
-                # Common internal signal patterns
-                internal_patterns = [
-                    "temp",
-                    "wire",
-                    "reg",
-                    "internal",
-                    "int_",
-                    "state",
-                    "next_state",
-                    "count",
-                    "counter",
-                    "fsm",
-                    "control",
-                    "flag",
-                    "mem",
-                    "storage",
-                    "buffer",
-                    "fifo",
-                    "queue",
-                    "stack",
-                ]
-
-                if any(pattern in signal_lower for pattern in input_patterns):
+                # Common data input, output and internal signal name patterns
+                if self.input_name_re.search(signal_lower):
                     data_inputs.append(signal)
-                elif any(pattern in signal_lower for pattern in output_patterns):
+                elif self.output_name_re.search(signal_lower):
                     data_outputs.append(signal)
-                elif any(pattern in signal_lower for pattern in internal_patterns):
+                elif self.internal_name_re.search(signal_lower):
                     internal.append(signal)
                 else:
                     # Fallback heuristics based on signal naming
@@ -820,6 +779,20 @@ class SignalPlotter:
             self.logger.error(f"Error generating plots: {e}")
             return False
 
+    def _signal_defs(self, signals: list[str]) -> dict[str, SignalDef] | None:
+        """Get the loaded signal definitions for the given paths.
+
+        Args:
+            signals: Signal paths to look up.
+
+        Returns:
+            Definitions in the order of signals, or None if any are not loaded
+            (WaveExtractor then parses the VCD file itself).
+        """
+        if self.signal_dict is None or not all(path in self.signal_dict for path in signals):
+            return None
+        return {path: self.signal_dict[path] for path in signals}
+
     def _generate_category_jsons(self) -> None:
         """Generate JSON files for each signal category using WaveExtractor."""
         from .extractor import WaveExtractor
@@ -847,8 +820,11 @@ class SignalPlotter:
                 # Create JSON file path
                 json_file = self.plots_dir / filename
 
-                # Use WaveExtractor to generate JSON for these specific signals
-                extractor = WaveExtractor(str(self.vcd_file), str(json_file), signals)
+                # Use WaveExtractor to generate JSON for these specific signals,
+                # reusing the definitions parsed by load_data when available
+                extractor = WaveExtractor(
+                    str(self.vcd_file), str(json_file), signals, self._signal_defs(signals)
+                )
 
                 # Set some basic parameters
                 extractor.start_time = 0
@@ -954,15 +930,13 @@ class SignalPlotter:
             color: Base color scheme for the plot
         """
         # Limit number of signals per plot for readability
-        max_signals_per_plot = 10
-        if len(signals) > max_signals_per_plot:
+        filenames = plot_filenames(filename, len(signals))
+        if len(filenames) > 1:
             # Create multiple plots if too many signals
-            for i in range(0, len(signals), max_signals_per_plot):
-                subset_signals = signals[i : i + max_signals_per_plot]
-                subset_title = f"{title} (Part {i // max_signals_per_plot + 1})"
-                subset_filename = filename.replace(
-                    ".png", f"_part{i // max_signals_per_plot + 1}.png"
-                )
+            for part, subset_filename in enumerate(filenames):
+                start = part * MAX_SIGNALS_PER_PLOT
+                subset_signals = signals[start : start + MAX_SIGNALS_PER_PLOT]
+                subset_title = f"{title} (Part {part + 1})"
                 self._create_single_enhanced_plot(
                     subset_signals, subset_title, subset_filename, color
                 )
@@ -994,15 +968,18 @@ class SignalPlotter:
 
         # Handle mixed color case for all_signals plot
         if base_color == "mixed":
+            # The category lists keep plot order; sets make each lookup O(1)
+            inputs = set(self.categories.inputs)
+            outputs = set(self.categories.outputs)
             for signal in signals:
-                if signal in self.categories.inputs:
+                if signal in inputs:
                     if self._is_clock_signal(signal):
                         colors.append("#000080")  # Dark blue for clock inputs
                     elif self._is_reset_signal(signal):
                         colors.append("#004080")  # Dark blue-cyan for reset inputs
                     else:
                         colors.append("#0000A0")  # Dark blue for data inputs
-                elif signal in self.categories.outputs:
+                elif signal in outputs:
                     colors.append("#800080")  # Pure purple for outputs
                 else:
                     colors.append("#008000")  # Pure green for internal signals
@@ -1036,7 +1013,11 @@ class SignalPlotter:
             self.logger.error("No data available for plotting")
             return
 
-        fig, axes = plt.subplots(len(signals), 1, figsize=(14, 3.5 * len(signals)))
+        # A standalone Agg figure keeps pyplot's global state out of the way, so
+        # figures for different categories can be drawn from worker threads
+        fig = Figure(figsize=(14, 3.5 * len(signals)))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(len(signals), 1)
         if len(signals) == 1:
             axes = [axes]  # Ensure axes is always a list
         if axes is None:
@@ -1112,13 +1093,12 @@ class SignalPlotter:
                     )
 
         # Enhanced layout
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.92, bottom=0.08, left=0.08, right=0.95, hspace=0.4)
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.92, bottom=0.08, left=0.08, right=0.95, hspace=0.4)
 
         # Save plot with higher quality in plots subdirectory
         output_path = self.plots_dir / filename
         fig.savefig(output_path, dpi=300, bbox_inches="tight", facecolor="white", edgecolor="none")
-        plt.close(fig)
 
         self.logger.info(f"Saved enhanced digital signal plot: {output_path}")
 
@@ -18,12 +18,22 @@ class TestSignalCategorizer:
         categorizer = SignalCategorizer()
 
         # Check that patterns are initialized
-        assert len(categorizer.clock_patterns) > 0
-        assert len(categorizer.input_patterns) > 0
-        assert len(categorizer.output_patterns) > 0
-        assert len(categorizer.reset_patterns) > 0
+        assert categorizer.clock_re.search("clk")
+        assert categorizer._keyword_hits("clk") == {"clock"}
+        assert categorizer._keyword_hits("input") == {"input"}
+        assert categorizer._keyword_hits("output") == {"output"}
+        assert categorizer._keyword_hits("rst") == {"reset"}
         assert len(categorizer.internal_prefixes) > 0
 
+    def test_patterns_shared_between_instances(self) -> None:
+        """Test compiled patterns are class-level while caches stay per instance."""
+        first = SignalCategorizer()
+        second = SignalCategorizer()
+
+        assert first.keyword_pattern is second.keyword_pattern
+        assert first.clock_re is second.clock_re
+        assert first._hits_cache is not second._hits_cache
+
     def test_categorize_signals_empty(self) -> None:
         """Test categorizing empty signal dictionary."""
         categorizer = SignalCategorizer()
@@ -168,16 +178,40 @@ class TestSignalCategorizer:
         # Multi-bit signals at testbench level default to OUTPUT
         assert categorizer._classify_signal("data_bus", signal_def) == SignalType.OUTPUT
 
-    def test_matches_any_pattern(self) -> None:
-        """Test pattern matching utility."""
-        import re
+    def test_keyword_hits(self) -> None:
+        """Test single-pass keyword scan reports every matching category."""
+        categorizer = SignalCategorizer()
+
+        assert categorizer._keyword_hits("top/clk") == {"clock"}
+        assert categorizer._keyword_hits("rst in") == {"reset", "input"}
+        assert categorizer._keyword_hits("i_data o_q") == {"input", "output"}
+        assert categorizer._keyword_hits("input.output") == {"input", "output"}
+        assert categorizer._keyword_hits("clocked_data") == set()
 
+    def test_keyword_dispatch_precedence(self) -> None:
+        """Test the highest-precedence keyword category picks the signal type."""
+        categorizer = SignalCategorizer()
+        bits = categorizer.keyword_bits
+        dispatch = categorizer._keyword_dispatch
+
+        assert dispatch[0] is None
+        assert dispatch[bits["clock"] | bits["reset"]] == SignalType.CLOCK
+        assert dispatch[bits["reset"] | bits["input"]] == SignalType.RESET
+        assert dispatch[bits["input"] | bits["output"]] == SignalType.INPUT
+        assert dispatch[bits["output"]] == SignalType.OUTPUT
+        assert categorizer._cached_hits("RST in") == bits["reset"] | bits["input"]
+
+    def test_classify_signal_reuses_cached_results(self) -> None:
+        """Test signals sharing a leaf name in equivalent scopes are classified once."""
         categorizer = SignalCategorizer()
 
-        patterns = [re.compile(r"test"), re.compile(r"sample")]
-        assert categorizer._matches_any_pattern("test_string", patterns) is True
-        assert categorizer._matches_any_pattern("sample_data", patterns) is True
-        assert categorizer._matches_any_pattern("other_text", patterns) is False
+        for index in range(3):
+            path = f"top/u_core{index}/data"
+            signal_def = SignalDef(name="data", sid=str(index), length=8, path=path)
+            assert categorizer._classify_signal(path, signal_def) == SignalType.INTERNAL
+
+        assert len(categorizer._type_cache) == 1
+        assert "data" in categorizer._hits_cache
 
     def test_suggest_clock_signal_no_clocks(self) -> None:
         """Test clock suggestion when no clocks found."""
@@ -1,12 +1,15 @@
 """Tests for CLI main module."""
 
+import os
+import subprocess
+import sys
 from argparse import Namespace
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from vcd2image.cli.main import main, setup_logging, validate_args
+from vcd2image.cli.main import create_parser, main, setup_logging, validate_args
 
 if TYPE_CHECKING:
     pass
@@ -45,6 +48,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         # Should not raise any exception
@@ -66,6 +73,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         # Should not raise any exception
@@ -82,6 +93,8 @@ class TestCLIMain:
             auto_plot=False,
             auto_dir=None,
             auto_formats=None,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Input file does not exist"):
@@ -102,6 +115,10 @@ class TestCLIMain:
             auto_dir=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Signal paths are required for VCD input"):
@@ -120,6 +137,8 @@ class TestCLIMain:
             list_signals=False,
             auto_plot=False,
             auto_dir=None,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Signal paths cannot be specified for JSON input"):
@@ -140,6 +159,10 @@ class TestCLIMain:
             auto_dir=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Image output is required for JSON input"):
@@ -160,6 +183,10 @@ class TestCLIMain:
             auto_dir=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Input file must be .vcd or .json"):
@@ -181,6 +208,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir="/some/dir",
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Auto plotting options are not valid for JSON input"):
@@ -202,6 +233,8 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=["png"],
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="--plot-formats requires --auto-plot or --plot-dir"):
@@ -223,6 +256,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Cannot specify signals with auto plotting"):
@@ -244,12 +281,16 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Cannot specify output JSON with auto plotting"):
             validate_args(args)
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_without_image(self, mock_multi_renderer, tmp_path) -> None:
         """Test auto plotting without image output specified."""
         vcd_file = tmp_path / "test.vcd"
@@ -263,6 +304,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = None
             mock_args.image = None  # No image specified
@@ -277,7 +322,7 @@ class TestCLIMain:
 
             assert result == 1  # Should fail due to missing image
 
-    @patch("vcd2image.cli.main.WaveExtractor")
+    @patch("vcd2image.core.extractor.WaveExtractor")
     def test_main_vcd_to_json_success(self, mock_extractor, tmp_path) -> None:
         """Test successful VCD to JSON conversion."""
         vcd_file = tmp_path / "test.vcd"
@@ -295,6 +340,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = str(json_file)
             mock_args.image = None
@@ -318,7 +367,7 @@ class TestCLIMain:
         )
         mock_extractor_instance.execute.assert_called_once()
 
-    @patch("vcd2image.cli.main.WaveRenderer")
+    @patch("vcd2image.core.renderer.WaveRenderer")
     def test_main_json_to_image_success(self, mock_renderer, tmp_path) -> None:
         """Test successful JSON to image conversion."""
         json_file = tmp_path / "input.json"
@@ -336,6 +385,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(json_file)
             mock_args.output = None
             mock_args.image = str(image_file)
@@ -364,12 +417,16 @@ class TestCLIMain:
 
         with (
             patch("vcd2image.cli.main.create_parser") as mock_create_parser,
-            patch("vcd2image.cli.main.WaveExtractor") as mock_extractor,
-            patch("vcd2image.cli.main.WaveRenderer") as mock_renderer,
+            patch("vcd2image.core.extractor.WaveExtractor") as mock_extractor,
+            patch("vcd2image.core.renderer.WaveRenderer") as mock_renderer,
         ):
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = str(json_file)
             mock_args.image = str(image_file)
@@ -402,7 +459,7 @@ class TestCLIMain:
             mock_extractor.assert_called_once()
             mock_renderer.assert_called_once()
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_single_image(self, mock_multi_renderer, tmp_path) -> None:
         """Test auto plotting with single image output."""
         vcd_file = tmp_path / "test.vcd"
@@ -417,6 +474,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = None
             mock_args.image = str(image_file)
@@ -435,7 +496,7 @@ class TestCLIMain:
                 vcd_file=str(vcd_file), output_file=str(image_file)
             )
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_multiple_formats(self, mock_multi_renderer, tmp_path) -> None:
         """Test auto plotting with multiple output formats."""
         vcd_file = tmp_path / "test.vcd"
@@ -451,6 +512,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = None
             mock_args.image = None
@@ -469,7 +534,7 @@ class TestCLIMain:
                 vcd_file=str(vcd_file), output_dir=str(plot_dir), formats=["png", "svg"]
             )
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_default_formats(self, mock_multi_renderer, tmp_path) -> None:
         """Test auto plotting with default formats."""
         vcd_file = tmp_path / "test.vcd"
@@ -485,6 +550,10 @@ class TestCLIMain:
             mock_parser = MagicMock()
             mock_create_parser.return_value = mock_parser
             mock_args = Namespace()
+            mock_args.jobs = 1
+            mock_args.dpi = 150
+            mock_args.from_cache = None
+            mock_args.cache_parsed = None
             mock_args.input_file = str(vcd_file)
             mock_args.output = None
             mock_args.image = None
@@ -550,14 +619,18 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir="/some/dir",
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         # This should raise an error because auto_plot is not valid for JSON input
         with pytest.raises(ValueError, match="Auto plotting options are not valid for JSON input"):
             validate_args(args)
 
-    @patch("vcd2image.cli.main.WaveExtractor")
-    @patch("vcd2image.cli.main.WaveRenderer")
+    @patch("vcd2image.core.extractor.WaveExtractor")
+    @patch("vcd2image.core.renderer.WaveRenderer")
     def test_main_vcd_to_image_direct(self, mock_renderer, mock_extractor, tmp_path) -> None:
         """Test main function with direct VCD to image conversion."""
         vcd_file = tmp_path / "test.vcd"
@@ -576,33 +649,53 @@ class TestCLIMain:
             result = main()
             assert result == 0
 
-    @patch("vcd2image.cli.main.WaveRenderer")
-    @patch("vcd2image.cli.main.WaveExtractor")
-    def test_main_vcd_to_image_cleanup_error(self, mock_extractor, mock_renderer, tmp_path) -> None:
-        """Test main function handles cleanup errors gracefully."""
+    @patch("vcd2image.core.renderer.WaveRenderer")
+    @patch("vcd2image.core.extractor.WaveExtractor")
+    def test_main_vcd_to_image_in_memory(self, mock_extractor, mock_renderer, tmp_path) -> None:
+        """Test direct VCD to image conversion renders WaveJSON without a temporary file."""
         vcd_file = tmp_path / "test.vcd"
         vcd_file.write_text("$enddefinitions $end")
 
         mock_extractor_instance = MagicMock()
         mock_extractor.return_value = mock_extractor_instance
-        mock_extractor_instance.execute.return_value = 0
+        wavejson = {"signal": []}
+        mock_extractor_instance.extract_wavejson.return_value = wavejson
 
         mock_renderer_instance = MagicMock()
         mock_renderer.return_value = mock_renderer_instance
 
-        with patch("pathlib.Path.unlink") as mock_unlink:
-            mock_unlink.side_effect = PermissionError("File in use")
+        with patch(
+            "sys.argv", ["vcd2image", str(vcd_file), "--image", "output.png", "-s", "signal1"]
+        ):
+            result = main()
 
-            with patch(
-                "sys.argv", ["vcd2image", str(vcd_file), "--image", "output.png", "-s", "signal1"]
-            ):
-                result = main()
-                assert result == 0
-                # Verify cleanup was attempted but failed gracefully
-                mock_unlink.assert_called_once()
+        assert result == 0
+        mock_extractor_instance.execute.assert_not_called()
+        mock_renderer_instance.render_wavejson_to_image.assert_called_once_with(
+            wavejson, "output.png"
+        )
 
-    @patch("vcd2image.cli.main.WaveRenderer")
-    @patch("vcd2image.cli.main.WaveExtractor")
+    @patch("vcd2image.core.renderer.WaveRenderer")
+    @patch("vcd2image.core.extractor.WaveExtractor")
+    def test_main_vcd_to_image_no_samples(self, mock_extractor, mock_renderer, tmp_path) -> None:
+        """Test direct VCD to image conversion fails when no samples are found."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text("$enddefinitions $end")
+
+        mock_extractor_instance = MagicMock()
+        mock_extractor.return_value = mock_extractor_instance
+        mock_extractor_instance.extract_wavejson.return_value = None
+
+        with patch(
+            "sys.argv", ["vcd2image", str(vcd_file), "--image", "output.png", "-s", "signal1"]
+        ):
+            result = main()
+
+        assert result == 1
+        mock_renderer.assert_not_called()
+
+    @patch("vcd2image.core.renderer.WaveRenderer")
+    @patch("vcd2image.core.extractor.WaveExtractor")
     def test_main_vcd_to_json_and_image(self, mock_extractor, mock_renderer, tmp_path) -> None:
         """Test main function with VCD to JSON and then JSON to image conversion."""
         vcd_file = tmp_path / "test.vcd"
@@ -631,7 +724,7 @@ class TestCLIMain:
             result = main()
             assert result == 0
 
-    @patch("vcd2image.cli.main.WaveRenderer")
+    @patch("vcd2image.core.renderer.WaveRenderer")
     def test_main_json_to_image(self, mock_renderer, tmp_path) -> None:
         """Test main function with JSON to image conversion."""
         json_file = tmp_path / "test.json"
@@ -644,7 +737,7 @@ class TestCLIMain:
             result = main()
             assert result == 0
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_single_figure(self, mock_multi_renderer, tmp_path) -> None:
         """Test main function with auto plot single figure."""
         vcd_file = tmp_path / "test.vcd"
@@ -658,7 +751,7 @@ class TestCLIMain:
             result = main()
             assert result == 0
 
-    @patch("vcd2image.cli.main.MultiFigureRenderer")
+    @patch("vcd2image.core.multi_renderer.MultiFigureRenderer")
     def test_main_auto_plot_multiple_figures(self, mock_multi_renderer, tmp_path) -> None:
         """Test main function with auto plot multiple figures."""
         vcd_file = tmp_path / "test.vcd"
@@ -700,7 +793,7 @@ class TestCLIMain:
             result = main()
             assert result == 1
 
-    @patch("vcd2image.cli.main.WaveExtractor")
+    @patch("vcd2image.core.extractor.WaveExtractor")
     def test_main_vcd_extraction_with_formats(self, mock_extractor, tmp_path) -> None:
         """Test main function with format specifications."""
         vcd_file = tmp_path / "test.vcd"
@@ -714,20 +807,24 @@ class TestCLIMain:
             result = main()
             assert result == 0
 
-    @patch("vcd2image.cli.main.WaveExtractor")
-    def test_main_list_signals(self, mock_extractor, tmp_path) -> None:
+    @patch("vcd2image.core.extractor.WaveExtractor")
+    def test_main_list_signals(self, mock_extractor, tmp_path, capsys) -> None:
         """Test main function with list signals option."""
         vcd_file = tmp_path / "test.vcd"
-        vcd_file.write_text("$enddefinitions $end")
-
-        mock_extractor_instance = MagicMock()
-        mock_extractor.return_value = mock_extractor_instance
-        mock_extractor_instance.print_props.return_value = None
+        vcd_file.write_text(
+            "$scope module top $end\n"
+            "$var wire 1 ! clk $end\n"
+            '$var wire 8 " data $end\n'
+            "$upscope $end\n"
+            "$enddefinitions $end\n"
+        )
 
         with patch("sys.argv", ["vcd2image", str(vcd_file), "--list-signals"]):
             result = main()
             assert result == 0
-            mock_extractor_instance.print_props.assert_called_once()
+
+        assert capsys.readouterr().out.splitlines() == ["top/clk", "top/data"]
+        mock_extractor.assert_not_called()
 
     def test_validate_args_invalid_file_extension(self, tmp_path) -> None:
         """Test validating arguments with invalid file extension."""
@@ -745,6 +842,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Input file must be .vcd or .json"):
@@ -766,6 +867,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Signal paths are required for VCD input"):
@@ -787,6 +892,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir="plots",
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Cannot specify signals with auto plotting"):
@@ -808,6 +917,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir="plots",
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="--plot-dir requires --auto-plot"):
@@ -829,6 +942,8 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=["png"],
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="--plot-formats requires --auto-plot"):
@@ -850,6 +965,10 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Image output is required for JSON input"):
@@ -871,7 +990,111 @@ class TestCLIMain:
             auto_formats=None,
             plot_dir=None,
             plot_formats=None,
+            jobs=1,
+            dpi=150,
+            from_cache=None,
+            cache_parsed=None,
         )
 
         with pytest.raises(ValueError, match="Auto plotting options are not valid for JSON input"):
             validate_args(args)
+
+    def test_validate_args_rejects_options_conflicting_with_from_cache(self, tmp_path) -> None:
+        """Test --from-cache rejects options the cached samples would override."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text("$enddefinitions $end")
+        parser = create_parser()
+
+        validate_args(parser.parse_args([str(vcd_file), "--from-cache", "samples.pkl"]))
+
+        for extra, option in (
+            (["-s", "top/clk"], "-s/--signals"),
+            (["--start-time", "0"], "--start-time"),
+            (["--end-time", "100"], "--end-time"),
+            (["--wave-chunk", "20"], "--wave-chunk"),
+            (["--cache-parsed", "other.pkl"], "--cache-parsed"),
+        ):
+            args = parser.parse_args([str(vcd_file), "--from-cache", "samples.pkl", *extra])
+            with pytest.raises(ValueError, match=f"cannot be combined with {option}"):
+                validate_args(args)
+
+    def test_validate_args_rejects_jobs_below_one(self, tmp_path) -> None:
+        """Test --jobs values below 1 are rejected."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text("$enddefinitions $end")
+
+        for jobs in (0, -2):
+            args = Namespace(
+                input_file=str(vcd_file),
+                output=None,
+                image=None,
+                signals=None,
+                list_signals=False,
+                auto_plot=True,
+                plot_dir=str(tmp_path / "plots"),
+                plot_formats=None,
+                jobs=jobs,
+                dpi=150,
+                from_cache=None,
+                cache_parsed=None,
+            )
+
+            with pytest.raises(ValueError, match="--jobs must be at least 1"):
+                validate_args(args)
+
+    def test_validate_args_rejects_non_positive_dpi(self, tmp_path) -> None:
+        """Test --dpi values below 1 are rejected before any conversion work."""
+        json_file = tmp_path / "test.json"
+        json_file.write_text("{}")
+
+        for dpi in (0, -72):
+            args = Namespace(
+                input_file=str(json_file),
+                output=None,
+                image=str(tmp_path / "out.png"),
+                signals=None,
+                list_signals=False,
+                auto_plot=False,
+                plot_dir=None,
+                plot_formats=None,
+                jobs=1,
+                dpi=dpi,
+                from_cache=None,
+                cache_parsed=None,
+            )
+
+            with pytest.raises(ValueError, match="--dpi must be positive"):
+                validate_args(args)
+
+    def test_cli_import_defers_plotting_libraries(self) -> None:
+        """Test that importing the CLI does not load matplotlib or pandas."""
+        code = (
+            "import sys, vcd2image.cli.main; "
+            "print(any(m in sys.modules for m in ('matplotlib', 'pandas')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        assert result.stdout.strip() == "False"
+
+    @patch("vcd2image.core.extractor.WaveExtractor")
+    def test_main_default_json_file_replaces_suffix_only(self, mock_extractor, tmp_path) -> None:
+        """Test the default JSON path only replaces the input file suffix."""
+        vcd_dir = tmp_path / "sim.vcd"
+        vcd_dir.mkdir()
+        vcd_file = vcd_dir / "timer.vcd"
+        vcd_file.write_text("$enddefinitions $end")
+
+        mock_extractor_instance = MagicMock()
+        mock_extractor.return_value = mock_extractor_instance
+
+        with patch("sys.argv", ["vcd2image", str(vcd_file), "-s", "clock"]):
+            result = main()
+
+        assert result == 0
+        assert mock_extractor_instance.json_file == str(vcd_dir / "timer.json")
@@ -195,7 +195,7 @@ b11111111 #
 
         mock_generator_instance = MagicMock()
         mock_generator.return_value = mock_generator_instance
-        mock_generator_instance.generate_json.return_value = '{"test": "json"}'
+        mock_generator_instance.iter_json.return_value = iter(['{"test": ', '"json"}'])
 
         # Mock stdout for output
         mock_stdout = mocker.patch("sys.stdout")
@@ -203,7 +203,9 @@ b11111111 #
         result = extractor.execute()
 
         assert result == 0
-        mock_stdout.write.assert_called_once_with('{"test": "json"}')
+        mock_stdout.writelines.assert_called_once()
+        assert "".join(mock_stdout.writelines.call_args.args[0]) == '{"test": "json"}'
+        mock_generator_instance.generate_json.assert_not_called()
 
     def test_execute_no_signals(self, mocker) -> None:
         """Test execution with no signals raises error."""
@@ -252,3 +254,76 @@ b11111111 #
         # This tests the parser's EOFError when $enddefinitions is missing
         with pytest.raises(EOFError, match="Can't find word '\\$enddefinitions' in VCD file"):
             WaveExtractor("tests/test_data/bad.vcd", "output.json", ["top.!"])
+
+    def test_execute_missing_enddefinitions(self, tmp_path: Path, mocker) -> None:
+        """Test sampling a file without a definitions section raises ValueError."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text("#0\n1$\n")
+
+        mocker.patch("vcd2image.core.extractor.VCDParser")
+        extractor = WaveExtractor(str(vcd_file), "output.json", ["clock"])
+        extractor.path_dict = {"clock": MagicMock(sid="$")}
+
+        with pytest.raises(ValueError, match="Unexpected end of file"):
+            extractor.execute()
+
+    def test_execute_many_matches_separate_extractors(
+        self, timer_vcd_file: Path, tmp_path: Path
+    ) -> None:
+        """Test one sampling pass writes the same files as one extractor per subset."""
+        subsets = {
+            "clock_reset": ["tb_timer/clock", "tb_timer/reset"],
+            "counter": ["tb_timer/u_timer/clock", "tb_timer/u_timer/count"],
+        }
+        union = [path for paths in subsets.values() for path in paths]
+
+        extractor = WaveExtractor(str(timer_vcd_file), "", union)
+        outputs = {str(tmp_path / f"{name}.json"): paths for name, paths in subsets.items()}
+        assert extractor.execute_many(outputs) == 0
+
+        for name, paths in subsets.items():
+            separate_file = tmp_path / f"{name}_separate.json"
+            assert WaveExtractor(str(timer_vcd_file), str(separate_file), paths).execute() == 0
+            assert (tmp_path / f"{name}.json").read_bytes() == separate_file.read_bytes()
+
+    def test_sample_cache_round_trip(self, timer_vcd_file: Path, tmp_path: Path, mocker) -> None:
+        """Test samples saved via sample_cache reproduce the same JSON without sampling."""
+        paths = ["tb_timer/clock", "tb_timer/reset", "tb_timer/u_timer/count"]
+        cache_file = tmp_path / "samples.pkl"
+        json_file = tmp_path / "timer.json"
+        cached_json_file = tmp_path / "cached.json"
+
+        extractor = WaveExtractor(str(timer_vcd_file), str(json_file), paths)
+        extractor.wave_chunk = 7
+        extractor.sample_cache = str(cache_file)
+        assert extractor.execute() == 0
+        assert cache_file.exists()
+
+        mock_sampler = mocker.patch("vcd2image.core.extractor.SignalSampler")
+        cached = WaveExtractor.from_cache(
+            str(timer_vcd_file), str(cached_json_file), str(cache_file)
+        )
+
+        assert cached.path_list == paths
+        assert cached.wave_chunk == 7
+        assert cached.execute() == 0
+        assert cached_json_file.read_bytes() == json_file.read_bytes()
+        mock_sampler.assert_not_called()
+
+    def test_sample_cache_rejects_other_vcd(self, timer_vcd_file: Path, tmp_path: Path) -> None:
+        """Test a sample cache is not applied to a different or rewritten VCD file."""
+        vcd_file = tmp_path / "timer.vcd"
+        vcd_file.write_bytes(timer_vcd_file.read_bytes())
+        cache_file = tmp_path / "samples.pkl"
+
+        extractor = WaveExtractor(str(vcd_file), str(tmp_path / "timer.json"), ["tb_timer/clock"])
+        extractor.sample_cache = str(cache_file)
+        assert extractor.execute() == 0
+
+        with pytest.raises(ValueError, match="was not written for"):
+            WaveExtractor.from_cache(str(timer_vcd_file), "", str(cache_file))
+
+        with open(vcd_file, "ab") as f:
+            f.write(b"#999999\n")
+        with pytest.raises(ValueError, match="was not written for"):
+            WaveExtractor.from_cache(str(vcd_file), "", str(cache_file))
@@ -1,5 +1,7 @@
 """Tests for WaveJSON generator module."""
 
+import json
+from io import BytesIO
 from typing import TYPE_CHECKING
 
 import pytest
@@ -97,6 +99,10 @@ class TestWaveJSONGenerator:
         wave = generator._create_wave(["1", "z", "0"])
         assert wave == '"1z0"'
 
+        # Test runs longer than two samples
+        wave = generator._create_wave(["0", "0", "0", "1", "1", "x", "x", "x", "x"])
+        assert wave == '"0..1.x..."'
+
         # Test empty samples
         wave = generator._create_wave([])
         assert wave == '""'
@@ -119,6 +125,12 @@ class TestWaveJSONGenerator:
         assert wave == '"=z="'  # z for high impedance
         assert data == '"1010 1111"'  # z values don't add to data
 
+        # Test values that recur after other values are formatted each time
+        samples = ["1010", "1111", "1010", "xxxx", "1111", "zzzz", "zzzz", "1010"]
+        wave, data = generator._create_wave_data(samples, 4, "x")
+        assert wave == '"===x=z.="'
+        assert data == '"a f a f a"'
+
         # Test empty samples
         wave, data = generator._create_wave_data([], 4, "b")
         assert wave == '""'
@@ -175,3 +187,45 @@ class TestWaveJSONGenerator:
         assert generator._is_binary_string("1020") is False
         assert generator._is_binary_string("abc") is False
         assert generator._is_binary_string("") is False
+
+    def test_write_json_matches_generate_json(
+        self, sample_signals: dict[str, SignalDef], sample_sample_groups: list[dict[str, list[str]]]
+    ) -> None:
+        """Test streamed JSON is byte-identical to the in-memory document."""
+        path_list = ["clock", "data", "reset"]
+        generator = WaveJSONGenerator(path_list, sample_signals, wave_chunk=2)
+
+        expected = generator.generate_json(sample_sample_groups).encode("utf-8")
+
+        fout = BytesIO()
+        generator.write_json(sample_sample_groups, fout)
+        assert fout.getvalue() == expected
+
+        # Buffer smaller than a single time group forces flushes and direct writes
+        fout = BytesIO()
+        generator.write_json(sample_sample_groups, fout, buffer_size=16)
+        assert fout.getvalue() == expected
+
+    def test_iter_json_joins_to_generate_json(
+        self, sample_signals: dict[str, SignalDef], sample_sample_groups: list[dict[str, list[str]]]
+    ) -> None:
+        """Test the yielded pieces join to the complete document."""
+        path_list = ["clock", "data", "reset"]
+        generator = WaveJSONGenerator(path_list, sample_signals, wave_chunk=2)
+
+        pieces = list(generator.iter_json(sample_sample_groups))
+
+        # Header, one piece per time group, footer
+        assert len(pieces) == len(sample_sample_groups) + 2
+        assert "".join(pieces) == generator.generate_json(sample_sample_groups)
+
+    def test_generate_dict_matches_generate_json(
+        self, sample_signals: dict[str, SignalDef], sample_sample_groups: list[dict[str, list[str]]]
+    ) -> None:
+        """Test the in-memory document equals the parsed JSON text."""
+        path_list = ["clock", "data", "reset"]
+        generator = WaveJSONGenerator(path_list, sample_signals, wave_chunk=2)
+
+        wavejson = generator.generate_dict(sample_sample_groups)
+
+        assert wavejson == json.loads(generator.generate_json(sample_sample_groups))
@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import pickle
 from typing import TYPE_CHECKING
 
 from vcd2image.core.models import SignalCategory, SignalDef
@@ -37,6 +38,17 @@ class TestSignalDef:
         assert signal.path == "tb/u_dut/test"
         assert signal.fmt == "x"  # default format
 
+    def test_slots_pickle_round_trip(self) -> None:
+        """Test SignalDef has no instance dict and survives pickling (parse cache)."""
+        signal = SignalDef(name="test", sid="!", length=8, path="tb/test")
+        signal.fmt = "d"
+
+        assert not hasattr(signal, "__dict__")
+        restored = pickle.loads(pickle.dumps(signal, protocol=pickle.HIGHEST_PROTOCOL))
+        assert repr(restored) == repr(signal)
+        assert restored.fmt == "d"
+        assert restored.signal_type == signal.signal_type
+
     def test_init_edge_cases(self) -> None:
         """Test SignalDef initialization with edge cases."""
         # Empty name
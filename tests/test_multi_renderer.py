@@ -3,9 +3,15 @@
 import logging
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 
+from vcd2image.core.categorizer import SignalCategorizer
+from vcd2image.core.extractor import WaveExtractor
 from vcd2image.core.multi_renderer import MultiFigureRenderer
+from vcd2image.core.parser import VCDParser
+from vcd2image.core.sampler import SignalSampler
+from vcd2image.core.signal_plotter import plot_filenames
 
 
 class TestMultiFigureRenderer:
@@ -145,7 +151,7 @@ class TestMultiFigureRenderer:
         mock_plotter.categories.internals = []
 
         with patch("vcd2image.core.multi_renderer.logger") as mock_logger:
-            with patch.object(renderer, "_generate_category_json"):
+            with patch.object(renderer, "_generate_category_jsons"):
                 renderer._generate_enhanced_categorized_plots(
                     mock_plotter, Path("/tmp"), "test", ["png"]
                 )
@@ -260,7 +266,7 @@ class TestMultiFigureRenderer:
         mock_plotter.categories.internals = ["internal1"]  # Has signals
 
         with patch("vcd2image.core.multi_renderer.logger") as mock_logger:
-            with patch.object(renderer, "_generate_category_json"):
+            with patch.object(renderer, "_generate_category_jsons"):
                 renderer._generate_enhanced_categorized_plots(
                     mock_plotter, Path("/tmp"), "test", ["png"]
                 )
@@ -285,7 +291,7 @@ class TestMultiFigureRenderer:
         mock_plotter.categories.internals = ["internal1"]
 
         with patch("vcd2image.core.multi_renderer.logger") as mock_logger:
-            with patch.object(renderer, "_generate_category_json"):
+            with patch.object(renderer, "_generate_category_jsons"):
                 with patch.object(mock_plotter, "_create_enhanced_signal_plot"):
                     renderer._generate_enhanced_categorized_plots(
                         mock_plotter, Path("/tmp"), "test", ["svg"]
@@ -317,7 +323,7 @@ class TestMultiFigureRenderer:
         mock_plotter.categories.internals = ["internal1"]
 
         with patch("vcd2image.core.multi_renderer.logger") as mock_logger:
-            with patch.object(renderer, "_generate_category_json"):
+            with patch.object(renderer, "_generate_category_jsons"):
                 with patch.object(mock_plotter, "_create_enhanced_signal_plot"):
                     renderer._generate_enhanced_categorized_plots(
                         mock_plotter, Path("/tmp"), "test", ["html"]
@@ -689,3 +695,311 @@ $end
         )
 
         assert result == 1  # Should return error code
+
+    @patch("vcd2image.core.multi_renderer.SignalPlotter")
+    def test_load_parsed_reused_by_render_auto_plot(
+        self, mock_signal_plotter, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test that signals parsed by load_parsed are passed to the plotter."""
+        mock_plotter_instance = Mock()
+        mock_signal_plotter.return_value = mock_plotter_instance
+        mock_plotter_instance.load_data.return_value = False
+
+        renderer = MultiFigureRenderer()
+        signal_dict = renderer.load_parsed(str(timer_vcd_file), tmp_path / "cache")
+
+        assert "tb_timer/clock" in signal_dict
+
+        renderer.render_auto_plot(
+            vcd_file=str(timer_vcd_file), output_file=str(tmp_path / "auto_plot.png")
+        )
+
+        mock_plotter_instance.load_data.assert_called_once_with(signal_dict)
+
+    def test_generate_enhanced_categorized_plots_parallel_json(
+        self, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test category JSON files are generated by worker processes when jobs > 1."""
+        renderer = MultiFigureRenderer()
+        renderer.jobs = 2
+
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = timer_vcd_file
+        mock_plotter.categories = Mock()
+        mock_plotter.categories.inputs = ["tb_timer/clock", "tb_timer/reset"]
+        mock_plotter.categories.outputs = ["tb_timer/pulse"]
+        mock_plotter.categories.internals = ["tb_timer/u_timer/count"]
+        (tmp_path / "plots").mkdir()
+
+        renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+
+        assert mock_plotter._create_enhanced_signal_plot.call_count == 4
+        for category_name in ("clocks", "resets", "outputs", "internals"):
+            assert (tmp_path / "plots" / f"{category_name}.json").exists()
+
+    def test_render_categorized_figures_threaded_matches_serial(
+        self, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test figures drawn by a real SignalPlotter on threads match a serial run."""
+        outputs = {}
+        for jobs in (1, 2):
+            renderer = MultiFigureRenderer()
+            renderer.jobs = jobs
+            output_dir = tmp_path / f"jobs{jobs}"
+
+            assert renderer.render_categorized_figures(str(timer_vcd_file), str(output_dir)) == 0
+
+            outputs[jobs] = {
+                path.name: path.read_bytes() for path in sorted((output_dir / "plots").iterdir())
+            }
+
+        assert any(name.endswith(".png") for name in outputs[1])
+        assert outputs[2] == outputs[1]
+
+    @patch("vcd2image.core.multi_renderer.SignalPlotter")
+    def test_render_calls_share_parsed_signals(
+        self, mock_signal_plotter, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test that repeated render calls parse the same VCD file only once."""
+        mock_plotter_instance = Mock()
+        mock_signal_plotter.return_value = mock_plotter_instance
+        mock_plotter_instance.load_data.return_value = False
+
+        renderer = MultiFigureRenderer()
+
+        with patch(
+            "vcd2image.core.multi_renderer.VCDParser.parse_signals", autospec=True
+        ) as mock_parse:
+            mock_parse.return_value = {"tb_timer/clock": Mock()}
+            renderer.render_auto_plot(str(timer_vcd_file), str(tmp_path / "auto.png"))
+            renderer.render_enhanced_plots_with_golden_references(
+                str(timer_vcd_file), output_dir=str(tmp_path / "enhanced")
+            )
+
+        mock_parse.assert_called_once()
+        first, second = mock_plotter_instance.load_data.call_args_list
+        assert first.args[0] is second.args[0] is mock_parse.return_value
+
+    @pytest.mark.parametrize("combined_pass_fails", [False, True])
+    def test_category_json_parses_vcd_once(
+        self, timer_vcd_file, tmp_path, combined_pass_fails
+    ) -> None:
+        """Test that JSON for several categories of one VCD file parses and categorizes once.
+
+        The per-category fallback after a failed combined pass reuses the
+        same definitions and clock.
+        """
+        renderer = MultiFigureRenderer()
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = str(timer_vcd_file)
+        (tmp_path / "plots").mkdir()
+
+        parse_signals = VCDParser.parse_signals
+        categorize_signals = SignalCategorizer.categorize_signals
+        execute_many = WaveExtractor.execute_many
+        with (
+            patch.object(
+                VCDParser, "parse_signals", autospec=True, side_effect=parse_signals
+            ) as mock_parse,
+            patch.object(
+                SignalCategorizer,
+                "categorize_signals",
+                autospec=True,
+                side_effect=categorize_signals,
+            ) as mock_categorize,
+            patch.object(
+                WaveExtractor,
+                "execute_many",
+                autospec=True,
+                side_effect=(lambda *args: 1) if combined_pass_fails else execute_many,
+            ),
+        ):
+            renderer._generate_category_jsons(
+                mock_plotter,
+                [("outputs", ["tb_timer/pulse"]), ("internals", ["tb_timer/u_timer/count"])],
+                tmp_path,
+            )
+
+        mock_parse.assert_called_once()
+        mock_categorize.assert_called_once()
+        assert (tmp_path / "plots" / "outputs.json").exists()
+        assert (tmp_path / "plots" / "internals.json").exists()
+
+    @patch("vcd2image.core.multi_renderer.SignalPlotter")
+    def test_render_calls_share_categories(
+        self, mock_signal_plotter, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test that repeated render calls categorize the same design only once."""
+        first_plotter, second_plotter = Mock(), Mock()
+        mock_signal_plotter.side_effect = [first_plotter, second_plotter]
+        for plotter in (first_plotter, second_plotter):
+            plotter.vcd_file = timer_vcd_file
+            plotter.verilog_file = None
+            plotter.load_data.return_value = True
+            plotter.categorize_signals.return_value = True
+            plotter.categories = None
+        first_plotter.categories = Mock()
+
+        renderer = MultiFigureRenderer()
+        with patch.object(renderer, "_generate_enhanced_categorized_plots"):
+            renderer.render_categorized_figures(str(timer_vcd_file), str(tmp_path / "first"))
+            renderer.render_categorized_figures(str(timer_vcd_file), str(tmp_path / "second"))
+
+        first_plotter.categorize_signals.assert_called_once()
+        second_plotter.categorize_signals.assert_not_called()
+        assert second_plotter.categories is first_plotter.categories
+
+    def test_category_jsons_sample_vcd_once(self, timer_vcd_file, tmp_path) -> None:
+        """Test that the JSON files of all plotted categories share one sampling pass."""
+        renderer = MultiFigureRenderer()
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = str(timer_vcd_file)
+        (tmp_path / "plots").mkdir()
+
+        sample_signals = SignalSampler.sample_signals
+        with patch.object(
+            SignalSampler, "sample_signals", autospec=True, side_effect=sample_signals
+        ) as mock_sample:
+            renderer._generate_category_jsons(
+                mock_plotter,
+                [("outputs", ["tb_timer/pulse"]), ("internals", ["tb_timer/u_timer/count"])],
+                tmp_path,
+            )
+
+        mock_sample.assert_called_once()
+        assert (tmp_path / "plots" / "outputs.json").exists()
+        assert (tmp_path / "plots" / "internals.json").exists()
+
+    def test_category_jsons_fall_back_per_category(self, timer_vcd_file, tmp_path, caplog) -> None:
+        """Test that a bad category does not stop the other JSON files being written."""
+        renderer = MultiFigureRenderer()
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = str(timer_vcd_file)
+        (tmp_path / "plots").mkdir()
+
+        with caplog.at_level(logging.WARNING):
+            renderer._generate_category_jsons(
+                mock_plotter,
+                [("outputs", ["tb_timer/pulse"]), ("missing", ["tb_timer/nonexistent"])],
+                tmp_path,
+            )
+
+        assert (tmp_path / "plots" / "outputs.json").exists()
+        assert not (tmp_path / "plots" / "missing.json").exists()
+        assert "Failed to generate JSON for missing:" in caplog.text
+
+    def test_unchanged_categories_are_not_regenerated(self, timer_vcd_file, tmp_path) -> None:
+        """Test a second run skips categories whose figure and JSON file are up to date."""
+        renderer = MultiFigureRenderer()
+        plots_dir = tmp_path / "plots"
+        plots_dir.mkdir()
+
+        def draw(signals, title, filename, color):
+            (plots_dir / filename).write_bytes(b"png")
+
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = timer_vcd_file
+        mock_plotter.verilog_file = None
+        mock_plotter._create_enhanced_signal_plot.side_effect = draw
+        mock_plotter.categories = Mock()
+        mock_plotter.categories.inputs = ["tb_timer/clock", "tb_timer/reset"]
+        mock_plotter.categories.outputs = ["tb_timer/pulse"]
+        mock_plotter.categories.internals = ["tb_timer/u_timer/count"]
+
+        renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+        assert mock_plotter._create_enhanced_signal_plot.call_count == 4
+        assert (tmp_path / ".vcd2image.cache.json").exists()
+
+        # Nothing changed: no figure is drawn and no JSON file is extracted
+        mock_plotter._create_enhanced_signal_plot.reset_mock()
+        with patch.object(renderer, "_generate_category_jsons") as mock_jsons:
+            renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+        mock_plotter._create_enhanced_signal_plot.assert_not_called()
+        mock_jsons.assert_not_called()
+
+        # A changed category and a missing output are regenerated
+        mock_plotter.categories.outputs = ["tb_timer/pulse", "tb_timer/u_timer/pulse"]
+        (plots_dir / "internals.json").unlink()
+        renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+        drawn = [c.args[2] for c in mock_plotter._create_enhanced_signal_plot.call_args_list]
+        assert drawn == ["test_outputs.png", "test_internals.png"]
+
+    def test_output_keys_ignore_path_spelling(self, timer_vcd_file, monkeypatch) -> None:
+        """Test relative and absolute paths of one VCD file give the same category keys."""
+        renderer = MultiFigureRenderer()
+        planned = [("clocks", "Clock Signals", ["tb_timer/clock"], ["tb_timer/clock"])]
+        monkeypatch.chdir(timer_vcd_file.parent)
+
+        keys = []
+        for vcd_file in (timer_vcd_file.resolve(), timer_vcd_file.name):
+            plotter = Mock()
+            plotter.vcd_file = vcd_file
+            plotter.verilog_file = None
+            keys.append(renderer._output_keys(plotter, planned, "test", ["png"]))
+
+        assert keys[0] == keys[1] != {}
+
+    def test_split_figure_with_missing_part_is_regenerated(self, timer_vcd_file, tmp_path) -> None:
+        """Test a figure split into parts is redrawn when any part, not just the first, is gone."""
+        renderer = MultiFigureRenderer()
+        plots_dir = tmp_path / "plots"
+        plots_dir.mkdir()
+
+        def draw(signals, title, filename, color):
+            for part in plot_filenames(filename, len(signals)):
+                (plots_dir / part).write_bytes(b"png")
+
+        def write_jsons(plotter, categories, output_path):
+            for category_name, _signals in categories:
+                (plots_dir / f"{category_name}.json").write_text("{}")
+
+        mock_plotter = Mock()
+        mock_plotter.vcd_file = timer_vcd_file
+        mock_plotter.verilog_file = None
+        mock_plotter._create_enhanced_signal_plot.side_effect = draw
+        mock_plotter.categories = Mock()
+        mock_plotter.categories.inputs = ["tb_timer/clock"]
+        mock_plotter.categories.outputs = []
+        mock_plotter.categories.internals = [f"tb_timer/u_timer/r{i}" for i in range(12)]
+
+        with patch.object(renderer, "_generate_category_jsons", side_effect=write_jsons):
+            renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+            assert (plots_dir / "test_internals_part2.png").exists()
+
+            mock_plotter._create_enhanced_signal_plot.reset_mock()
+            renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+            mock_plotter._create_enhanced_signal_plot.assert_not_called()
+
+            (plots_dir / "test_internals_part2.png").unlink()
+            renderer._generate_enhanced_categorized_plots(mock_plotter, tmp_path, "test", ["png"])
+
+        drawn = [c.args[2] for c in mock_plotter._create_enhanced_signal_plot.call_args_list]
+        assert drawn == ["test_internals.png"]
+        assert (plots_dir / "test_internals_part2.png").exists()
+
+    @patch("vcd2image.core.multi_renderer.SignalPlotter")
+    def test_render_calls_share_loaded_data(
+        self, mock_signal_plotter, timer_vcd_file, tmp_path
+    ) -> None:
+        """Test that repeated render calls sample the same VCD file only once."""
+        first_plotter, second_plotter = Mock(), Mock()
+        mock_signal_plotter.side_effect = [first_plotter, second_plotter]
+        for plotter in (first_plotter, second_plotter):
+            plotter.load_data.return_value = True
+            plotter.categorize_signals.return_value = False
+        first_plotter.data = pd.DataFrame({"test_case": [0, 1], "tb_timer/clock": [0, 1]})
+        first_plotter.valid_signal_paths = ["tb_timer/clock"]
+
+        renderer = MultiFigureRenderer()
+        renderer.render_auto_plot(str(timer_vcd_file), str(tmp_path / "auto.png"))
+        renderer.render_enhanced_plots_with_golden_references(
+            str(timer_vcd_file), output_dir=str(tmp_path / "enhanced")
+        )
+
+        first_plotter.load_data.assert_called_once()
+        second_plotter.load_data.assert_not_called()
+        second_plotter.adopt_data.assert_called_once_with(
+            first_plotter.load_data.call_args.args[0],
+            first_plotter.data,
+            first_plotter.valid_signal_paths,
+        )
@@ -1,10 +1,12 @@
 """Tests for VCD parser module."""
 
+import pickle
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
-from vcd2image.core.parser import VCDParser
+from vcd2image.core.parser import CACHE_FORMAT, VCDParser
 
 if TYPE_CHECKING:
     from pytest_mock.plugin import MockerFixture
@@ -102,6 +104,21 @@ b11111111 #
         with pytest.raises(ValueError, match="Can't find signal path: nonexistent"):
             parser.parse_signals(["nonexistent"])
 
+    def test_filter_path_dict(self, sample_vcd_content: str, tmp_path) -> None:
+        """Test filtering already parsed definitions without reading the file again."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(sample_vcd_content)
+
+        parser = VCDParser(str(vcd_file))
+        path_dict = parser.parse_signals()
+
+        filtered = parser.filter_path_dict(["/top/reset", "top/clock"], path_dict)
+
+        assert list(filtered) == ["top/reset", "top/clock"]
+        assert filtered["top/clock"] is path_dict["top/clock"]
+        with pytest.raises(ValueError, match="Can't find signal path: top/missing"):
+            parser.filter_path_dict(["top/missing"], path_dict)
+
     def test_create_path_dict(self, tmp_path) -> None:
         """Test creating path dictionary from VCD content."""
         vcd_content = """$scope module top $end
@@ -124,6 +141,54 @@ $enddefinitions $end
         assert "top/clock" in path_dict
         assert "top/data" in path_dict
 
+    def test_list_signals(self, tmp_path) -> None:
+        """Test listing signal paths from the header only."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(
+            """$scope module top $end
+$var wire 1 ! clk $end
+$scope module sub $end
+$var wire 4 " count $end
+$upscope $end
+$upscope $end
+$enddefinitions $end
+#0
+$var wire 1 # not_a_signal $end
+"""
+        )
+
+        parser = VCDParser(str(vcd_file))
+
+        assert parser.list_signals() == ["top/clk", "top/sub/count"]
+
+    def test_parse_signals_ignores_enddefinitions_inside_line(self, tmp_path) -> None:
+        """Test the header ends only at a line starting with $enddefinitions."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(
+            """$comment no $enddefinitions here $end
+$scope module top $end
+$var wire 1 ! clk $end
+$upscope $end
+  $enddefinitions $end
+#0
+0!
+"""
+        )
+
+        parser = VCDParser(str(vcd_file))
+
+        assert list(parser.parse_signals()) == ["top/clk"]
+
+    def test_parse_signals_empty_file(self, tmp_path) -> None:
+        """Test parsing an empty VCD file."""
+        vcd_file = tmp_path / "empty.vcd"
+        vcd_file.write_text("")
+
+        parser = VCDParser(str(vcd_file))
+
+        with pytest.raises(EOFError, match="Can't find word"):
+            parser.parse_signals()
+
     def test_create_path_dict_missing_enddefinitions(self, tmp_path) -> None:
         """Test _create_path_dict with missing $enddefinitions."""
         vcd_content = """$scope module top $end
@@ -161,3 +226,54 @@ $enddefinitions $end
         assert len(all_paths) == 1
         assert len(path_dict) == 1
         assert "top/clock" in path_dict
+
+    def test_parse_signals_cached(
+        self, sample_vcd_content: str, tmp_path, mocker: "MockerFixture"
+    ) -> None:
+        """Test cached parse is reused until the VCD file changes."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(sample_vcd_content)
+        cache_dir = tmp_path / "cache"
+
+        parser = VCDParser(str(vcd_file))
+        path_dict = parser.parse_signals_cached(cache_dir)
+        assert parser.cache_file(cache_dir).exists()
+
+        spy = mocker.spy(parser, "parse_signals")
+        cached = parser.parse_signals_cached(cache_dir)
+        spy.assert_not_called()
+        assert list(cached) == list(path_dict)
+        assert cached["top/data"].length == 8
+
+        # Rewriting the file changes the cache key
+        vcd_file.write_text(sample_vcd_content.replace("$var wire 1 % reset $end\n", ""))
+        reparsed = parser.parse_signals_cached(cache_dir)
+        spy.assert_called_once()
+        assert "top/reset" not in reparsed
+
+    def test_parse_signals_cached_ignores_foreign_cache(
+        self, sample_vcd_content: str, tmp_path, mocker: "MockerFixture"
+    ) -> None:
+        """Test a cache holding something other than a dict is parsed again."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(sample_vcd_content)
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        parser = VCDParser(str(vcd_file))
+        parser.cache_file(cache_dir).write_bytes(pickle.dumps(["top/clock"]))
+
+        path_dict = parser.parse_signals_cached(cache_dir)
+
+        assert "top/clock" in path_dict
+        assert isinstance(pickle.loads(parser.cache_file(cache_dir).read_bytes()), dict)
+
+    def test_cache_file_depends_on_cache_format(self, sample_vcd_content: str, tmp_path) -> None:
+        """Test caches written in another cache format are never matched."""
+        vcd_file = tmp_path / "test.vcd"
+        vcd_file.write_text(sample_vcd_content)
+        parser = VCDParser(str(vcd_file))
+
+        current = parser.cache_file(tmp_path)
+        with patch("vcd2image.core.parser.CACHE_FORMAT", CACHE_FORMAT + 1):
+            assert parser.cache_file(tmp_path) != current
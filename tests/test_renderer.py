@@ -1,7 +1,10 @@
 """Tests for wave renderer module."""
 
+import json
+import math
+import os
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -108,6 +111,36 @@ class TestWaveRenderer:
         expected_json = json.dumps(sample_wavejson, indent=2)
         assert expected_json in html
 
+    def test_render_to_html_without_orjson(self, tmp_path, sample_wavejson) -> None:
+        """Test the stdlib json fallback produces the same HTML as orjson."""
+        json_file = tmp_path / "input.json"
+        json_file.write_text(json.dumps(sample_wavejson), encoding="utf-8")
+
+        renderer = WaveRenderer()
+        renderer.render_to_html(str(json_file), str(tmp_path / "default.html"))
+        with patch("vcd2image.core.renderer.orjson", None):
+            renderer.render_to_html(str(json_file), str(tmp_path / "stdlib.html"))
+
+        assert (tmp_path / "stdlib.html").read_text() == (tmp_path / "default.html").read_text()
+
+    def test_render_calls_share_parsed_wavejson(self, tmp_path, sample_wavejson) -> None:
+        """Test rendering one file twice parses it once, and again after it changes."""
+        json_file = tmp_path / "input.json"
+        json_file.write_text(json.dumps(sample_wavejson), encoding="utf-8")
+
+        renderer = WaveRenderer()
+        with patch(
+            "vcd2image.core.renderer._load_wavejson", return_value=sample_wavejson
+        ) as mock_load:
+            renderer.render_to_html(str(json_file), str(tmp_path / "first.html"))
+            renderer.render_to_html(str(json_file), str(tmp_path / "second.html"))
+            assert mock_load.call_count == 1
+
+            stat = json_file.stat()
+            os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            renderer.render_to_html(str(json_file), str(tmp_path / "third.html"))
+            assert mock_load.call_count == 2
+
     def test_render_to_image_no_signals(self, tmp_path) -> None:
         """Test rendering with no signals in WaveJSON."""
         json_file = tmp_path / "input.json"
@@ -309,18 +342,58 @@ class TestWaveRenderer:
 
     @patch("matplotlib.pyplot.figure")
     def test_plot_signal_data_unknown_char_exception(self, mock_figure) -> None:
-        """Test plotting signal data with unknown character exception (lines 375-377)."""
+        """Test plotting signal data whose value cannot be converted to a level."""
         renderer = WaveRenderer()
 
         # Mock figure and axes
         mock_fig = mock_figure.return_value
         mock_ax = mock_fig.add_subplot.return_value
 
-        # Make plot raise an exception to trigger the exception handler
-        mock_ax.plot.side_effect = [ValueError("Test exception"), None]
+        # Looks numeric but float() rejects it, so it is drawn as unknown
+        renderer._plot_signal_data(mock_ax, ["1.2.3"], 1, "blue")
+
+        mock_ax.plot.assert_called_once()
+        call_args = mock_ax.plot.call_args
+        assert call_args[1]["marker"] == "x"
+        assert call_args[1]["color"] == "red"
+
+    def test_plot_signal_data_one_plot_call_per_style(self) -> None:
+        """Test each drawing style is plotted once however many time steps use it."""
+        renderer = WaveRenderer()
+        mock_ax = Mock()
+
+        renderer._plot_signal_data(mock_ax, ["p", "0", "1", "x", "1", "z", "x", "0"], 8, "blue")
+
+        assert mock_ax.plot.call_count == 3
+        solid, unknown, floating = mock_ax.plot.call_args_list
+        assert solid[1]["color"] == "blue"
+        assert unknown[1]["marker"] == "x"
+        assert floating[1]["marker"] == "D"
+
+        # Segments are separated by NaN gaps: clock pulse (2 at t=0), then 0, 1, 1, 0
+        xs, ys = solid[0]
+        assert len(xs) == len(ys) == 3 * 6
+        assert all(math.isnan(x) for x in xs[2::3])
+        assert ys[6:8] == [0, 0] and ys[9:11] == [1, 1]
+
+    def test_plot_signal_data_rasterizes_long_signals(self) -> None:
+        """Test long signals are rasterized and short ones stay vector paths."""
+        renderer = WaveRenderer()
+
+        short_ax, long_ax = Mock(), Mock()
+        renderer._plot_signal_data(short_ax, ["0", "1"], 500, "blue")
+        renderer._plot_signal_data(long_ax, ["0", "1"], 501, "blue")
+
+        assert short_ax.plot.call_args[1]["rasterized"] is False
+        assert long_ax.plot.call_args[1]["rasterized"] is True
+
+    def test_render_to_image_dpi(self, tmp_path, sample_wavejson) -> None:
+        """Test images are saved at the renderer's resolution."""
+        renderer = WaveRenderer(dpi=72)
+        assert renderer.dpi == 72
+        assert WaveRenderer().dpi == 150
 
-        # Call with some value that might cause issues
-        renderer._plot_signal_data(mock_ax, ["?"], 1, "red")
+        with patch("matplotlib.figure.Figure.savefig") as mock_savefig:
+            renderer.render_wavejson_to_image(sample_wavejson, str(tmp_path / "out.png"))
 
-        # Should have called plot twice - first failed, second succeeded with fallback
-        assert mock_ax.plot.call_count == 2
+        assert mock_savefig.call_args[1]["dpi"] == 72
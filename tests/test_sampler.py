@@ -1,5 +1,6 @@
 """Tests for signal sampler module."""
 
+import tracemalloc
 from io import StringIO
 from typing import TYPE_CHECKING
 
@@ -83,6 +84,36 @@ b00000000 #
             assert len(group["#"]) == 2  # data samples per group
             assert len(group["%"]) == 2  # reset samples per group
 
+    def test_sample_signals_partial_and_unbounded_groups(self, sample_vcd_dump: str) -> None:
+        """Test the last group holds only its samples, and wave_chunk < 1 keeps one group."""
+        sampler = SignalSampler(wave_chunk=2, start_time=0, end_time=0)
+        sample_groups = sampler.sample_signals(StringIO(sample_vcd_dump), "$", ["#", "%"])
+
+        assert [len(group["#"]) for group in sample_groups] == [2, 2, 1]
+        assert sample_groups[-1] == {"$": ["0"], "#": ["11111111"], "%": ["0"]}
+
+        sampler = SignalSampler(wave_chunk=0, start_time=0, end_time=0)
+        sample_groups = sampler.sample_signals(StringIO(sample_vcd_dump), "$", ["#", "%"])
+
+        assert len(sample_groups) == 1
+        assert sample_groups[0]["$"] == ["x", "1", "1", "0", "0"]
+
+    def test_sample_signals_large_wave_chunk_short_dump(self, sample_vcd_dump: str) -> None:
+        """Test memory follows the dump length rather than wave_chunk."""
+        sampler = SignalSampler(wave_chunk=1_000_000, start_time=0, end_time=0)
+        signal_sids = [f"s{index}" for index in range(200)]
+
+        tracemalloc.start()
+        try:
+            sample_groups = sampler.sample_signals(StringIO(sample_vcd_dump), "$", signal_sids)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(sample_groups) == 1
+        assert len(sample_groups[0]["$"]) == 5
+        assert peak < 1_000_000
+
     def test_sample_signals_with_time_limits(self) -> None:
         """Test sampling with time limits."""
         vcd_dump = """#0
@@ -1,8 +1,12 @@
 """Tests for the SignalPlotter class and related functionality."""
 
+import logging
+import sys
 from unittest.mock import Mock, patch
 
+import matplotlib.pyplot as plt
 import pandas as pd
+import pytest
 
 from vcd2image.core.models import SignalCategory
 from vcd2image.core.signal_plotter import Logger, SignalPlotter
@@ -19,8 +23,9 @@ class TestLogger:
         logger = Logger("TestLogger")
         assert logger.name == "TestLogger"
 
-    def test_logger_methods(self, capsys) -> None:
+    def test_logger_methods(self, caplog) -> None:
         """Test Logger output methods."""
+        caplog.set_level(logging.INFO)
         logger = Logger("TestLogger")
 
         logger.info("test info")
@@ -28,11 +33,12 @@ class TestLogger:
         logger.warning("test warning")
         logger.error("test error")
 
-        captured = capsys.readouterr()
-        assert "[INFO] TestLogger: test info" in captured.out
-        assert "[SUCCESS] TestLogger: test success" in captured.out
-        assert "[WARNING] TestLogger: test warning" in captured.out
-        assert "[ERROR] TestLogger: test error" in captured.out
+        assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+            ("INFO", "TestLogger: test info"),
+            ("INFO", "TestLogger: test success"),
+            ("WARNING", "TestLogger: test warning"),
+            ("ERROR", "TestLogger: test error"),
+        ]
 
 
 class TestSignalPlotter:
@@ -83,9 +89,39 @@ class TestSignalPlotter:
         assert len(plotter.data) > 0  # Should have loaded some data
         assert "test_case" in plotter.data.columns
 
+    def test_adopt_data_matches_load_data(self, timer_vcd_file, tmp_path) -> None:
+        """Test adopting another plotter's data sets the same state as loading it."""
+        loaded = SignalPlotter(str(timer_vcd_file), output_dir=str(tmp_path / "loaded"))
+        assert loaded.load_data() is True
+
+        adopted = SignalPlotter(str(timer_vcd_file), output_dir=str(tmp_path / "adopted"))
+        adopted.adopt_data(loaded.signal_dict, loaded.data, loaded.valid_signal_paths)
+
+        assert adopted.vcd_parser is not None
+        assert adopted.signal_dict is loaded.signal_dict
+        assert adopted.data is loaded.data
+        assert adopted.valid_signal_paths == loaded.valid_signal_paths
+        assert (tmp_path / "adopted" / "plots" / "signal_data.csv").read_bytes() == (
+            tmp_path / "loaded" / "plots" / "signal_data.csv"
+        ).read_bytes()
+
+    def test_signal_defs_reuse_loaded_definitions(self, timer_vcd_file, tmp_path) -> None:
+        """Test definitions parsed by load_data are handed out for WaveExtractor."""
+        plotter = SignalPlotter(str(timer_vcd_file), output_dir=str(tmp_path))
+        assert plotter._signal_defs(["tb_timer/clock"]) is None
+
+        with patch.object(plotter, "_extract_actual_waveform_data"):
+            assert plotter.load_data() is True
+
+        defs = plotter._signal_defs(["tb_timer/reset", "tb_timer/clock"])
+        assert list(defs) == ["tb_timer/reset", "tb_timer/clock"]
+        assert defs["tb_timer/clock"] is plotter.signal_dict["tb_timer/clock"]
+        assert plotter._signal_defs(["tb_timer/clock", "missing"]) is None
+
     @patch("vcd2image.core.parser.VCDParser")
-    def test_load_data_no_signals(self, mock_vcd_parser, tmp_path, capsys) -> None:
+    def test_load_data_no_signals(self, mock_vcd_parser, tmp_path, caplog) -> None:
         """Test data loading with no signals found."""
+        caplog.set_level(logging.INFO)
         mock_parser_instance = Mock()
         mock_vcd_parser.return_value = mock_parser_instance
         mock_parser_instance.parse_signals.return_value = {}
@@ -94,8 +130,7 @@ class TestSignalPlotter:
         result = plotter.load_data()
 
         assert result is False
-        captured = capsys.readouterr()
-        assert "No signals found in VCD file" in captured.out
+        assert "No signals found in VCD file" in caplog.text
 
     @patch("vcd2image.core.parser.VCDParser")
     def test_load_data_exception(self, mock_vcd_parser, tmp_path) -> None:
@@ -110,9 +145,10 @@ class TestSignalPlotter:
     @patch("vcd2image.core.parser.VCDParser")
     @patch("vcd2image.core.extractor.WaveExtractor")
     def test_load_data_wave_extractor_failure_fallback(
-        self, mock_wave_extractor, mock_vcd_parser, tmp_path, capsys
+        self, mock_wave_extractor, mock_vcd_parser, tmp_path, caplog
     ) -> None:
         """Test data loading falls back to synthetic data when WaveExtractor fails."""
+        caplog.set_level(logging.INFO)
         from vcd2image.core.models import SignalDef
 
         # Mock parser to return valid signals
@@ -126,14 +162,13 @@ class TestSignalPlotter:
         # Mock WaveExtractor to fail
         mock_extractor_instance = Mock()
         mock_wave_extractor.return_value = mock_extractor_instance
-        mock_extractor_instance.execute.return_value = 1  # Failure
+        mock_extractor_instance.extract_wavejson.return_value = None  # Failure
 
         plotter = SignalPlotter(str(tmp_path / "test.vcd"))
         result = plotter.load_data()
 
         assert result is True  # Should succeed with synthetic data
-        captured = capsys.readouterr()
-        assert "WaveExtractor failed with code 1, falling back to synthetic data" in captured.out
+        assert "WaveExtractor found no samples, falling back to synthetic data" in caplog.text
         assert plotter.data is not None
         assert len(plotter.data.columns) > 0
 
@@ -167,6 +202,21 @@ class TestSignalPlotter:
         )
         assert total_signals > 0
 
+    def test_categorize_signals_reuses_loaded_signals(self, timer_vcd_file) -> None:
+        """Test categorization after load_data does not parse the VCD file again."""
+        plotter = SignalPlotter(str(timer_vcd_file))
+        assert plotter.load_data() is True
+        expected = SignalPlotter(str(timer_vcd_file))
+        expected.data = plotter.data
+
+        with patch("vcd2image.core.parser.VCDParser") as mock_vcd_parser:
+            assert plotter.categorize_signals() is True
+        mock_vcd_parser.assert_not_called()
+
+        # A plotter without loaded signals parses the file and categorizes the same
+        assert expected.categorize_signals() is True
+        assert plotter.categories == expected.categories
+
     def test_generate_plots_no_data(self) -> None:
         """Test generate_plots with no data."""
         plotter = SignalPlotter("test.vcd")
@@ -191,6 +241,41 @@ class TestSignalPlotter:
 
         assert result is False
 
+    def test_load_csv_without_pyarrow(self, tmp_path) -> None:
+        """Test the default CSV parser loads the same frame as pyarrow, wide values included."""
+        csv_file = tmp_path / "signal_data.csv"
+        plotter = SignalPlotter("test.vcd", output_dir=str(tmp_path))
+
+        for wide in (7, 2**70):
+            csv_file.write_text(f"test_case,clock,bus\n0,0,{wide}\n1,1,3\n")
+            assert plotter.load_from_csv(str(csv_file)) is True
+            default = plotter.data
+            with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.csv": None}):
+                assert plotter.load_from_csv(str(csv_file)) is True
+
+            pd.testing.assert_frame_equal(default, plotter.data)
+            assert default["bus"].tolist() == [wide, 3]
+
+    def test_load_csv_with_pyarrow(self, tmp_path) -> None:
+        """Test pyarrow's reader is kept unless it turned wide integers into floats."""
+        pytest.importorskip("pyarrow.csv")
+        csv_file = tmp_path / "signal_data.csv"
+        plotter = SignalPlotter("test.vcd", output_dir=str(tmp_path))
+
+        for text, reads, expected in (
+            ("7", 1, [7, 3]),
+            ("0.5", 1, [0.5, 3.0]),
+            (str(2**70), 2, [2**70, 3]),
+        ):
+            csv_file.write_text(f"test_case,clock,bus\n0,0,{text}\n1,1,3\n")
+            with patch(
+                "vcd2image.core.signal_plotter.pd.read_csv", wraps=pd.read_csv
+            ) as mock_read_csv:
+                assert plotter.load_from_csv(str(csv_file)) is True
+
+            assert mock_read_csv.call_count == reads
+            assert plotter.data["bus"].tolist() == expected
+
     def test_generate_plots_no_categories(self, tmp_path) -> None:
         """Test generate_plots with data but no categories."""
         plotter = SignalPlotter(str(tmp_path / "test.vcd"))
@@ -308,6 +393,9 @@ class TestSignalPlotter:
         assert plotter._is_clock_signal("clock") is True
         assert plotter._is_clock_signal("sys_clk") is True
         assert plotter._is_clock_signal("data_signal") is False
+        for name in ("tb/Pixel_Clock", "SCK", "u_spi/mck", "pck", "HCLK_div"):
+            assert plotter._is_clock_signal(name) is True
+        assert plotter._is_clock_signal("lock_count") is False
 
     def test_is_reset_signal(self) -> None:
         """Test reset signal detection."""
@@ -316,6 +404,9 @@ class TestSignalPlotter:
         assert plotter._is_reset_signal("reset") is True
         assert plotter._is_reset_signal("rst_n") is True
         assert plotter._is_reset_signal("data_signal") is False
+        for name in ("tb/ARESET", "Clear_fifo", "clr", "initialize", "u_core/srst"):
+            assert plotter._is_reset_signal(name) is True
+        assert plotter._is_reset_signal("resync") is False
 
     def test_categorize_by_heuristic(self) -> None:
         """Test heuristic signal categorization."""
@@ -587,8 +678,9 @@ class TestSignalPlotter:
         values = plotter._decode_wavejson_wave(wave_str, data_str)
         assert values == [2, 0, 3, 0]  # Current implementation behavior
 
-    def test_wavejson_to_dataframe_invalid_structure(self, capsys) -> None:
+    def test_wavejson_to_dataframe_invalid_structure(self, caplog) -> None:
         """Test WaveJSON to DataFrame conversion with invalid structure."""
+        caplog.set_level(logging.INFO)
         plotter = SignalPlotter("test.vcd")
 
         # Invalid WaveJSON structure (missing signal key)
@@ -597,8 +689,7 @@ class TestSignalPlotter:
 
         plotter._wavejson_to_dataframe(wavejson, signal_paths)
 
-        captured = capsys.readouterr()
-        assert "Invalid WaveJSON structure" in captured.out
+        assert "Invalid WaveJSON structure" in caplog.text
 
     def test_wavejson_to_dataframe(self) -> None:
         """Test WaveJSON to DataFrame conversion."""
@@ -716,29 +807,32 @@ class TestSignalPlotter:
         assert len(colors_default) == 1
         assert colors_default[0].startswith("#")
 
-    @patch("matplotlib.pyplot.subplots")
-    @patch("matplotlib.pyplot.savefig")
-    def test_create_single_enhanced_plot_binary(self, mock_savefig, mock_subplots) -> None:
+    @patch("vcd2image.core.signal_plotter.FigureCanvasAgg")
+    @patch("vcd2image.core.signal_plotter.Figure")
+    def test_create_single_enhanced_plot_binary(self, mock_figure, mock_canvas) -> None:
         """Test single enhanced plot for binary signals."""
         # Setup mocks
         mock_fig, mock_axes = Mock(), Mock()
-        mock_subplots.return_value = (mock_fig, mock_axes)
+        mock_figure.return_value = mock_fig
+        mock_fig.subplots.return_value = mock_axes
 
         plotter = SignalPlotter("test.vcd")
         plotter.data = pd.DataFrame({"test_case": [0, 1, 2], "signal1": [0, 1, 0]})
 
         plotter._create_single_enhanced_plot(["signal1"], "Test Plot", "test.png", ["#000080"])
 
-        mock_subplots.assert_called_once()
+        mock_fig.subplots.assert_called_once_with(1, 1)
+        mock_canvas.assert_called_once_with(mock_fig)
         mock_fig.savefig.assert_called_once()
 
-    @patch("matplotlib.pyplot.subplots")
-    @patch("matplotlib.pyplot.savefig")
-    def test_create_single_enhanced_plot_multi_value(self, mock_savefig, mock_subplots) -> None:
+    @patch("vcd2image.core.signal_plotter.FigureCanvasAgg")
+    @patch("vcd2image.core.signal_plotter.Figure")
+    def test_create_single_enhanced_plot_multi_value(self, mock_figure, mock_canvas) -> None:
         """Test single enhanced plot for multi-value signals (lines 1074-1094)."""
         # Setup mocks
         mock_fig, mock_axes = Mock(), Mock()
-        mock_subplots.return_value = (mock_fig, mock_axes)
+        mock_figure.return_value = mock_fig
+        mock_fig.subplots.return_value = mock_axes
 
         plotter = SignalPlotter("test.vcd")
         # Multi-value signal data (bus with values 0, 5, 10)
@@ -766,6 +860,17 @@ class TestSignalPlotter:
 
         mock_fig.savefig.assert_called_once()
 
+    def test_create_single_enhanced_plot_leaves_pyplot_alone(self, tmp_path) -> None:
+        """Test figures are saved without registering with pyplot, so threads can draw them."""
+        plotter = SignalPlotter("test.vcd", output_dir=str(tmp_path))
+        plotter.data = pd.DataFrame({"test_case": [0, 1, 2], "signal1": [0, 1, 0]})
+        open_figures = plt.get_fignums()
+
+        plotter._create_single_enhanced_plot(["signal1"], "Test Plot", "test.png", "blue")
+
+        assert (tmp_path / "plots" / "test.png").exists()
+        assert plt.get_fignums() == open_figures
+
     def test_create_single_enhanced_plot_no_data(self) -> None:
         """Test _create_single_enhanced_plot with no data available (lines 1036-1037)."""
         plotter = SignalPlotter("test.vcd")
@@ -817,9 +922,10 @@ class TestSignalPlotter:
     @patch("vcd2image.core.extractor.WaveExtractor")
     @patch("vcd2image.core.parser.VCDParser")
     def test_extract_actual_waveform_data_wave_extractor_failure(
-        self, mock_vcd_parser, mock_wave_extractor, capsys
+        self, mock_vcd_parser, mock_wave_extractor, caplog
     ) -> None:
         """Test _extract_actual_waveform_data with WaveExtractor failure (lines 182-184)."""
+        caplog.set_level(logging.INFO)
         from vcd2image.core.models import SignalDef
 
         plotter = SignalPlotter("test.vcd")
@@ -832,13 +938,12 @@ class TestSignalPlotter:
         # Mock WaveExtractor to fail
         mock_extractor_instance = Mock()
         mock_wave_extractor.return_value = mock_extractor_instance
-        mock_extractor_instance.execute.return_value = 1  # Failure
+        mock_extractor_instance.extract_wavejson.return_value = None  # Failure
 
         plotter._extract_actual_waveform_data(signal_dict)
 
         # Check that WaveExtractor failure message is logged
-        captured = capsys.readouterr()
-        assert "WaveExtractor failed with code 1, falling back to synthetic data" in captured.out
+        assert "WaveExtractor found no samples, falling back to synthetic data" in caplog.text
         assert plotter.data is not None
 
     def test_wavejson_to_dataframe_missing_signal_padding(self) -> None:
@@ -864,6 +969,68 @@ class TestSignalPlotter:
         assert "missing_signal" in plotter.data.columns
         assert plotter.data["missing_signal"].tolist() == [0, 0]
 
+    def test_wavejson_to_dataframe_pads_short_signals(self) -> None:
+        """Test short signals repeat their last value and columns keep their order."""
+        plotter = SignalPlotter("test.vcd")
+
+        wide = 2**70
+        wavejson = {
+            "signal": [
+                {"name": "clock", "wave": "1010"},
+                {},
+                [
+                    {"name": "bus", "wave": "=.", "data": f"{wide}"},
+                    {"name": "signal1", "wave": "01"},
+                ],
+            ]
+        }
+        signal_paths = ["missing_signal", "signal1", "bus", "clock"]
+
+        plotter._wavejson_to_dataframe(wavejson, signal_paths)
+
+        assert list(plotter.data.columns) == [
+            "test_case",
+            "clock",
+            "bus",
+            "signal1",
+            "missing_signal",
+        ]
+        assert plotter.data["test_case"].tolist() == [0, 1, 2, 3]
+        assert plotter.data["signal1"].tolist() == [0, 1, 1, 1]
+        assert plotter.data["bus"].tolist() == [wide] * 4
+        assert plotter.data["missing_signal"].tolist() == [0, 0, 0, 0]
+
+    def test_save_data_csv_without_pyarrow(self, tmp_path) -> None:
+        """Test the DataFrame.to_csv fallback writes the same CSV as pyarrow."""
+        plotter = SignalPlotter("test.vcd", output_dir=str(tmp_path))
+        csv_file = tmp_path / "plots" / "signal_data.csv"
+
+        plotter.data = pd.DataFrame(
+            {"test_case": [0, 1, 2], "top/a,b": [1, 0, 1], 'top/"q"': [255, 7, 2**40]}
+        )
+        plotter._save_data_csv()
+        default = csv_file.read_bytes()
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.csv": None}):
+            plotter._save_data_csv()
+
+        assert csv_file.read_bytes() == default
+        assert default.startswith(b'test_case,"top/a,b","top/""q"""\n0,1,255\n')
+
+    def test_save_data_csv_with_pyarrow(self, tmp_path) -> None:
+        """Test integer frames are written by pyarrow, byte-identical to DataFrame.to_csv."""
+        pyarrow_csv = pytest.importorskip("pyarrow.csv")
+        plotter = SignalPlotter("test.vcd", output_dir=str(tmp_path))
+        csv_file = tmp_path / "plots" / "signal_data.csv"
+
+        plotter.data = pd.DataFrame(
+            {"test_case": [0, 1, 2], "top/a,b": [1, 0, 1], 'top/"q"': [255, -7, 2**40]}
+        )
+        with patch.object(pyarrow_csv, "write_csv", wraps=pyarrow_csv.write_csv) as mock_write_csv:
+            plotter._save_data_csv()
+
+        mock_write_csv.assert_called_once()
+        assert csv_file.read_bytes() == plotter.data.to_csv(index=False).encode("utf-8")
+
     def test_decode_wavejson_wave_high_impedance_z(self) -> None:
         """Test _decode_wavejson_wave with high impedance z state (line 309)."""
         plotter = SignalPlotter("test.vcd")
@@ -887,6 +1054,15 @@ class TestSignalPlotter:
         # Should use available data and fallback to 0 for missing values
         assert values == [2, 0, 0, 0, 0, 0]
 
+    def test_decode_wavejson_wave_repeats_across_separators(self) -> None:
+        """Test repeats carry the last sample over separators and wide data values."""
+        plotter = SignalPlotter("test.vcd")
+
+        wide = 2**70
+        values = plotter._decode_wavejson_wave("=..|.1|..=.", f"{wide} 5")
+        assert values == [wide, wide, wide, wide, 1, 1, 1, 5, 5]
+        assert all(type(value) is int for value in values)
+
     def test_decode_wavejson_wave_repeat_without_previous(self) -> None:
         """Test _decode_wavejson_wave with repeat (.) without previous value (line 322)."""
         plotter = SignalPlotter("test.vcd")
@@ -1100,8 +1276,9 @@ class TestSignalPlotter:
         assert mock_ax.annotate.call_count <= 5
 
     @patch("vcd2image.core.signal_plotter.SignalPlotter._generate_input_ports_plot")
-    def test_generate_plots_exception_handling(self, mock_generate_plot, capsys) -> None:
+    def test_generate_plots_exception_handling(self, mock_generate_plot, caplog) -> None:
         """Test generate_plots with exception handling (lines 819-821)."""
+        caplog.set_level(logging.INFO)
         plotter = SignalPlotter("test.vcd")
 
         # Mock data and categories
@@ -1117,9 +1294,8 @@ class TestSignalPlotter:
 
         result = plotter.generate_plots()
 
-        captured = capsys.readouterr()
         assert result is False
-        assert "Error generating plots: Test error" in captured.out
+        assert "Error generating plots: Test error" in caplog.text
 
     @patch("vcd2image.core.signal_plotter.SignalPlotter._create_single_enhanced_plot")
     def test_create_enhanced_signal_plot_multiple_parts(self, mock_create_single) -> None:
@@ -1359,7 +1535,7 @@ class TestSignalPlotter:
         # Mock WaveExtractor to fail
         mock_extractor_instance = Mock()
         mock_wave_extractor.return_value = mock_extractor_instance
-        mock_extractor_instance.execute.return_value = 1  # Failure
+        mock_extractor_instance.extract_wavejson.return_value = None  # Failure
 
         plotter._generate_category_jsons()
 